@@ -1,9 +1,24 @@
 """Command line applications built by the Pitt Center for Research Computing for wrapping common HPC user tasks."""
 
-import importlib.metadata
 
-try:
-    __version__ = importlib.metadata.version('crc-wrappers')
+def __getattr__(name: str) -> str:
+    """Lazily resolve the package version on first access.
 
-except importlib.metadata.PackageNotFoundError:  # pragma: no cover
-    __version__ = '0.0.0'
+    Looking up distribution metadata is slow relative to the runtime of most
+    wrapper applications, so the lookup is deferred until the version is
+    actually requested (e.g., by the `--version` flag) and cached afterward.
+    """
+
+    if name != '__version__':
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    import importlib.metadata
+
+    try:
+        version = importlib.metadata.version('crc-wrappers')
+
+    except importlib.metadata.PackageNotFoundError:  # pragma: no cover
+        version = '0.0.0'
+
+    globals()['__version__'] = version
+    return version
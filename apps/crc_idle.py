@@ -3,14 +3,21 @@
 The `crc-idle` application queries each cluster partition and summarizes
 how many CPU cores or GPUs are currently available. Drained or downed nodes
 are reported as having zero available resources.
+
+When a recent cluster state snapshot is published (see `apps.utils.snapshot`),
+clusters included in the snapshot are summarized without querying Slurm.
 """
 
 import re
 from argparse import Namespace
+from array import array
 from collections import defaultdict
+from itertools import compress, repeat
+from typing import Any, Callable, Hashable, Iterable, Optional, Sequence
 
 from .utils import Shell, Slurm
 from .utils.cli import BaseParser
+from .utils.snapshot import ClusterSnapshot, load_snapshot
 
 
 class CrcIdle(BaseParser):
@@ -27,6 +34,8 @@ class CrcIdle(BaseParser):
         teach='cores',
     )
 
+    default_workers = 8  # Default number of concurrent `sinfo` queries
+
     def __init__(self) -> None:
         """Define arguments for the command line interface."""
 
@@ -37,6 +46,12 @@ class CrcIdle(BaseParser):
         self.add_argument('-d', '--htc', action='store_true', help='list idle resources on the htc cluster')
         self.add_argument('-t', '--teach', action='store_true', help='list idle resources on the teach cluster')
         self.add_argument('-p', '--partition', nargs='+', help='only include information for specific partitions')
+        self.add_argument(
+            '-j', '--workers', type=int, default=self.default_workers,
+            help=f'maximum number of concurrent Slurm queries [default: {self.default_workers}]')
+        self.add_argument(
+            '-b', '--bulk', action='store_true',
+            help='query each cluster once and group nodes by partition locally')
 
     def get_cluster_list(self, args: Namespace) -> tuple[str, ...]:
         """Return which clusters to report on based on command line arguments.
@@ -54,134 +69,621 @@ class CrcIdle(BaseParser):
         specified = tuple(c for c in all_clusters if getattr(args, c))
         return specified or all_clusters
 
+    # Output formats used when querying node status with `sinfo`
+    cpu_format = '%N,%C,%e,%t'
+    cpu_format_by_partition = '%N,%P,%C,%e,%t'
+    gpu_format = "NodeList:'_',gres:5'_',gresUsed:12'_',StateCompact:'_',FreeMem ' '"
+    gpu_format_by_partition = "NodeList:'_',Partition:'_',gres:5'_',gresUsed:12'_',StateCompact:'_',FreeMem ' '"
+
+    # Methods used to build `sinfo` commands and parse their output for each type of cluster resource
+    resource_handlers = {
+        'cores': {
+            'command': '_cpu_command',
+            'parse': '_parse_cpu_output',
+            'parse_by_partition': '_parse_cpu_output_by_partition',
+            'node_columns': '_cpu_node_columns',
+        },
+        'GPUs': {
+            'command': '_gpu_command',
+            'parse': '_parse_gpu_output',
+            'parse_by_partition': '_parse_gpu_output_by_partition',
+            'node_columns': '_gpu_node_columns',
+        },
+    }
+
+    # Precompiled patterns used when parsing node status
+    _unavailable_cpu_state = re.compile('down|drain')
+    _unavailable_gpu_state = re.compile('drain')
+    _first_number = re.compile(r'\d+')
+    _gpu_count = re.compile(r'gpu(?::[^:(,]*)?:(\d+)')
+
     @staticmethod
-    def _count_idle_cpu_resources(cluster: str, partition: str) -> dict[int, dict[str, int]]:
-        """Return idle CPU core counts and free memory statistics per node group.
+    def _parse_free_mem(free_mem: str) -> int:
+        """Return free node memory as an integer, handling cases where sinfo reports 'N/A'.
+
+        Args:
+            free_mem: The free memory value reported by `sinfo`.
+
+        Returns:
+            The free memory in MB, or zero if the value is not numeric.
+        """
+
+        try:
+            return int(free_mem)
+
+        except (ValueError, TypeError):
+            return 0
 
-        Nodes in a downed or drained state are reported as having zero idle cores
-        and zero free memory.
+    @classmethod
+    def _parse_gres_count(cls, gres: str) -> int:
+        """Return the first number in a `sinfo` GRES column value (e.g., `gpu:4`), or zero if there is none."""
+
+        match = cls._first_number.search(gres)
+        return int(match.group()) if match else 0
+
+    @staticmethod
+    def _map_column(func: Callable[[str], Any], column: Sequence[str]) -> list:
+        """Apply a function to every value in a column, evaluating it once per distinct value.
+
+        Node status columns contain few distinct values (states, GRES strings,
+        core counts), so this avoids repeating the same parsing work per node.
 
         Args:
-            cluster: The name of the cluster to query.
-            partition: The name of the partition within the cluster.
+            func: The function to apply.
+            column: The column values.
 
         Returns:
-            A dictionary mapping idle core count to a record containing the number
-            of nodes at that count along with minimum and maximum free memory in MB.
+            A list with the mapped value for each entry in the column.
         """
 
-        # Use `sinfo` command to determine the status of each node in the given partition
-        command = f'sinfo -h -M {cluster} -p {partition} -N -o %N,%C,%e,%t'
-        slurm_data = Shell.run_command(command).strip().split()
+        lookup = {value: func(value) for value in set(column)}
+        return list(map(lookup.__getitem__, column))
 
-        # Count the number of nodes having a given number of idle cores/GPUs
-        result: dict[int, dict[str, int]] = {}
-        for node_info in slurm_data:
-            _, resource_data, free_mem, node_state = node_info.split(',')
+    @classmethod
+    def _parse_int_column(cls, column: Sequence[str]) -> array:
+        """Return a compact integer array from a column of free memory values.
 
-            # If the node is in a downed state, report 0 resource availability.
-            if any(key in node_state for key in ('down', 'drain')):
-                idle, free_mem = 0, 0
+        Args:
+            column: The free memory values reported by `sinfo`.
 
-            else:
-                _, idle, _, _ = (int(x) for x in resource_data.split('/'))
+        Returns:
+            An integer array, with non-numeric values (e.g., `N/A`) replaced by zero.
+        """
 
-            # Handle cases where sinfo reports 'N/A' for free memory
-            try:
-                free_mem = int(free_mem)
+        try:
+            return array('q', map(int, column))
 
-            except (ValueError, TypeError):
-                free_mem = 0
+        except ValueError:
+            return array('q', map(cls._parse_free_mem, column))
 
-            if idle not in result:
-                result[idle] = {'count': 1, 'min_free_mem': free_mem, 'max_free_mem': free_mem}
+    @classmethod
+    def _clear_unavailable(cls, states: Sequence[str], pattern: re.Pattern, *columns: array) -> None:
+        """Zero out resource columns for nodes in an unavailable state.
 
-            else:
-                result[idle]['count'] += 1
-                result[idle]['min_free_mem'] = min(result[idle]['min_free_mem'], free_mem)
-                result[idle]['max_free_mem'] = max(result[idle]['max_free_mem'], free_mem)
+        Args:
+            states: The state reported for each node.
+            pattern: A pattern matching unavailable node states.
+            *columns: Integer columns to update in place.
+        """
+
+        unavailable = cls._map_column(lambda state: pattern.search(state) is not None, states)
+        for index in compress(range(len(unavailable)), unavailable):
+            for column in columns:
+                column[index] = 0
+
+    @staticmethod
+    def _split_columns(rows: list[list[str]], num_fields: int) -> list[tuple[str, ...]]:
+        """Transpose node records split into fields into columns of field values.
+
+        Args:
+            rows: The fields of each node record.
+            num_fields: The expected number of fields in each record.
+
+        Returns:
+            A list of columns, each holding one field from every record.
+
+        Raises:
+            ValueError: If a record does not contain the expected number of fields.
+        """
+
+        if any(len(row) != num_fields for row in rows):
+            raise ValueError(f'Expected {num_fields} fields in every sinfo record')
+
+        return list(zip(*rows)) if rows else [()] * num_fields
+
+    @staticmethod
+    def _aggregate_nodes(
+        keys: Iterable[Hashable], idle: Iterable[int], free_mem: Iterable[int]
+    ) -> dict[Hashable, dict[int, dict[str, int]]]:
+        """Return node counts and free memory ranges grouped by key and idle resource count.
+
+        This is the shared aggregation step for every node status format. It
+        makes a single linear pass over compact integer columns.
+
+        Args:
+            keys: The group (e.g., partition) each node belongs to.
+            idle: The number of idle resources on each node.
+            free_mem: The free memory on each node in MB.
+
+        Returns:
+            A dictionary mapping each key, then idle resource count, to a record
+            containing the number of nodes and their minimum and maximum free memory.
+        """
+
+        stats: dict[tuple[Hashable, int], list[int]] = {}
+        for group, mem in zip(zip(keys, idle), free_mem):
+            entry = stats.get(group)
+            if entry is None:
+                stats[group] = [1, mem, mem]
+                continue
+
+            entry[0] += 1
+            if mem < entry[1]:
+                entry[1] = mem
+
+            elif mem > entry[2]:
+                entry[2] = mem
+
+        result: dict[Hashable, dict[int, dict[str, int]]] = {}
+        for (key, idle_count), (count, min_mem, max_mem) in stats.items():
+            result.setdefault(key, {})[idle_count] = {
+                'count': count, 'min_free_mem': min_mem, 'max_free_mem': max_mem}
 
         return result
 
+    @classmethod
+    def _cpu_columns(cls, resource_data: Sequence[str], free_mem: Sequence[str], states: Sequence[str]) -> tuple[array, array]:
+        """Return idle core and free memory columns for CPU nodes.
+
+        Nodes in a downed or drained state are reported as having zero idle
+        cores and zero free memory.
+
+        Args:
+            resource_data: CPU counts for each node in allocated/idle/other/total format.
+            free_mem: The free memory value reported for each node.
+            states: The state reported for each node.
+
+        Returns:
+            Compact integer arrays with the idle cores and free memory of each node.
+        """
+
+        idle = array('q', cls._map_column(lambda data: int(data.split('/')[1]), resource_data))
+        memory = cls._parse_int_column(free_mem)
+        cls._clear_unavailable(states, cls._unavailable_cpu_state, idle, memory)
+        return idle, memory
+
+    @classmethod
+    def _gpu_columns(
+        cls, total: Sequence[str], allocated: Sequence[str], states: Sequence[str], free_mem: Sequence[str]
+    ) -> tuple[array, array]:
+        """Return idle GPU and free memory columns for GPU nodes.
+
+        Nodes in a drained state are reported as having zero idle GPUs and
+        zero free memory.
+
+        Args:
+            total: The configured GRES string of each node.
+            allocated: The allocated GRES string of each node.
+            states: The state reported for each node.
+            free_mem: The free memory value reported for each node.
+
+        Returns:
+            Compact integer arrays with the idle GPUs and free memory of each node.
+        """
+
+        total_gpus = cls._map_column(cls._parse_gres_count, total)
+        allocated_gpus = cls._map_column(cls._parse_gres_count, allocated)
+
+        # Ensure idle values are never negative
+        idle = array('q', [max(0, gpus - used) for gpus, used in zip(total_gpus, allocated_gpus)])
+        memory = cls._parse_int_column(free_mem)
+        cls._clear_unavailable(states, cls._unavailable_gpu_state, idle, memory)
+        return idle, memory
+
     @staticmethod
-    def _count_idle_gpu_resources(cluster: str, partition: str) -> dict[int, dict[str, int]]:
-        """Return idle GPU counts and free memory statistics per node group.
+    def _split_sinfo_output(output: str) -> list[str]:
+        """Split `sinfo` output into per-node records, dropping any cluster headers.
+
+        Args:
+            output: Raw output from an `sinfo` command.
+
+        Returns:
+            A list of node records.
+        """
+
+        return [line.strip() for line in output.strip().split('\n') if line.strip() and not line.startswith('CLUSTER:')]
 
-        Nodes in a drained state are reported as having zero idle GPUs and zero
-        free memory.
+    @classmethod
+    def _cpu_command(cls, cluster: str, partition: Optional[str] = None) -> str:
+        """Return the `sinfo` command used to query CPU node status.
 
         Args:
             cluster: The name of the cluster to query.
-            partition: The name of the partition within the cluster.
+            partition: The name of the partition to query, or None to query every partition at once.
+
+        Returns:
+            The `sinfo` command as a string.
+        """
+
+        if partition is None:
+            return f'sinfo -h -M {cluster} -N -o {cls.cpu_format_by_partition}'
+
+        return f'sinfo -h -M {cluster} -p {partition} -N -o {cls.cpu_format}'
+
+    @classmethod
+    def _gpu_command(cls, cluster: str, partition: Optional[str] = None) -> str:
+        """Return the `sinfo` command used to query GPU node status.
+
+        Args:
+            cluster: The name of the cluster to query.
+            partition: The name of the partition to query, or None to query every partition at once.
 
         Returns:
-            A dictionary mapping idle GPU count to a record containing the number
-            of nodes at that count along with minimum and maximum free memory in MB.
+            The `sinfo` command as a string.
         """
 
-        # Use `sinfo` command to determine the status of each node in the given partition
-        fmt = "NodeList:'_',gres:5'_',gresUsed:12'_',StateCompact:'_',FreeMem ' '"
-        command = f"sinfo -h -M {cluster} -p {partition} -N --Format={fmt}"
-        slurm_data = Shell.run_command(command).strip().split()
+        if partition is None:
+            return f"sinfo -h -M {cluster} -N --Format={cls.gpu_format_by_partition}"
+
+        return f"sinfo -h -M {cluster} -p {partition} -N --Format={cls.gpu_format}"
+
+    @classmethod
+    def _parse_cpu_output(cls, output: str) -> dict[int, dict[str, int]]:
+        """Return idle CPU core statistics from the output of a single partition `sinfo` query.
+
+        Args:
+            output: Raw output from `sinfo` using the `cpu_format` output format.
+
+        Returns:
+            A dictionary mapping idle core count to node statistics.
+        """
 
         # Count the number of nodes having a given number of idle cores/GPUs
-        result: dict[int, dict[str, int]] = {}
-        for node_info in slurm_data:
-            _, total, allocated, state, free_mem = node_info.split('_')
+        _, resource_data, free_mem, states = cls._split_columns(
+            [record.split(',') for record in cls._split_sinfo_output(output)], 4)
+        idle, memory = cls._cpu_columns(resource_data, free_mem, states)
+        return cls._aggregate_nodes(repeat(None), idle, memory).get(None, {})
 
-            if re.search('drain', state):
-                idle, free_mem = 0, 0
+    @classmethod
+    def _parse_gpu_output(cls, output: str) -> dict[int, dict[str, int]]:
+        """Return idle GPU statistics from the output of a single partition `sinfo` query.
 
-            else:
-                total_match = re.search(r'(\d+)', total)
-                allocated_match = re.search(r'(\d+)', allocated)
-                total_gpus = int(total_match.group(1)) if total_match else 0
-                allocated_gpus = int(allocated_match.group(1)) if allocated_match else 0
+        Args:
+            output: Raw output from `sinfo` using the `gpu_format` output format.
 
-                # Ensure idle value is never negative
-                idle = max(0, total_gpus - allocated_gpus)
+        Returns:
+            A dictionary mapping idle GPU count to node statistics.
+        """
 
-            # Handle cases where sinfo reports 'N/A' for free memory
-            try:
-                free_mem = int(free_mem)
+        # Count the number of nodes having a given number of idle cores/GPUs
+        _, total, allocated, states, free_mem = cls._split_columns(
+            [record.split('_') for record in cls._split_sinfo_output(output)], 5)
+        idle, memory = cls._gpu_columns(total, allocated, states, free_mem)
+        return cls._aggregate_nodes(repeat(None), idle, memory).get(None, {})
 
-            except (ValueError, TypeError):
-                free_mem = 0
+    @classmethod
+    def _parse_cpu_output_by_partition(cls, output: str) -> dict[str, dict[int, dict[str, int]]]:
+        """Return idle CPU core statistics per partition from the output of a cluster-wide `sinfo` query.
 
-            if idle not in result:
-                result[idle] = {'count': 1, 'min_free_mem': free_mem, 'max_free_mem': free_mem}
+        Args:
+            output: Raw output from `sinfo` using the `cpu_format_by_partition` output format.
 
-            else:
-                result[idle]['count'] += 1
-                result[idle]['min_free_mem'] = min(result[idle]['min_free_mem'], free_mem)
-                result[idle]['max_free_mem'] = max(result[idle]['max_free_mem'], free_mem)
+        Returns:
+            A dictionary mapping partition name to idle core statistics.
+        """
 
-        return result
+        columns = cls._cpu_node_columns(output)
+        return cls._aggregate_nodes(columns['partition'], columns['idle'], columns['free_mem'])
+
+    @classmethod
+    def _cpu_node_columns(cls, output: str) -> dict[str, Sequence]:
+        """Return per-node status columns from the output of a cluster-wide CPU `sinfo` query.
+
+        Args:
+            output: Raw output from `sinfo` using the `cpu_format_by_partition` output format.
+
+        Returns:
+            Node name, partition, state, GRES, idle core, and free memory columns.
+        """
+
+        nodes, partitions, resource_data, free_mem, states = cls._split_columns(
+            [record.split(',') for record in cls._split_sinfo_output(output)], 5)
+        idle, memory = cls._cpu_columns(resource_data, free_mem, states)
+
+        # Slurm marks the default partition with a trailing asterisk
+        return {
+            'node': nodes,
+            'partition': cls._map_column(lambda name: name.rstrip('*'), partitions),
+            'state': states,
+            'gres': ('',) * len(nodes),
+            'idle': idle,
+            'free_mem': memory,
+        }
+
+    @classmethod
+    def _parse_gpu_output_by_partition(cls, output: str) -> dict[str, dict[int, dict[str, int]]]:
+        """Return idle GPU statistics per partition from the output of a cluster-wide `sinfo` query.
+
+        Args:
+            output: Raw output from `sinfo` using the `gpu_format_by_partition` output format.
+
+        Returns:
+            A dictionary mapping partition name to idle GPU statistics.
+        """
+
+        columns = cls._gpu_node_columns(output)
+        return cls._aggregate_nodes(columns['partition'], columns['idle'], columns['free_mem'])
+
+    @classmethod
+    def _gpu_node_columns(cls, output: str) -> dict[str, Sequence]:
+        """Return per-node status columns from the output of a cluster-wide GPU `sinfo` query.
+
+        Args:
+            output: Raw output from `sinfo` using the `gpu_format_by_partition` output format.
+
+        Returns:
+            Node name, partition, state, GRES, idle GPU, and free memory columns.
+        """
+
+        # Partition names may contain underscores, so split fields from both ends
+        rows = []
+        for record in cls._split_sinfo_output(output):
+            node, _, fields = record.partition('_')
+            rows.append([node, *fields.rsplit('_', 4)])
+
+        nodes, partitions, total, allocated, states, free_mem = cls._split_columns(rows, 6)
+        idle, memory = cls._gpu_columns(total, allocated, states, free_mem)
+        return {
+            'node': nodes,
+            'partition': cls._map_column(lambda name: name.rstrip('*'), partitions),
+            'state': states,
+            'gres': total,
+            'idle': idle,
+            'free_mem': memory,
+        }
+
+    def _get_resource_handler(self, cluster: str, name: str) -> Callable:
+        """Return the method handling a step of a node status query for the cluster's resource type.
+
+        Args:
+            cluster: The name of the cluster.
+            name: The key of the method in `resource_handlers`.
+
+        Returns:
+            The bound method.
+
+        Raises:
+            ValueError: If the cluster type is not recognized.
+        """
+
+        cluster_type = self.cluster_types[cluster]
+        if cluster_type not in self.resource_handlers:
+            raise ValueError(f'Unknown cluster type: {cluster_type}')
+
+        return getattr(self, self.resource_handlers[cluster_type][name])
+
+    def get_sinfo_command(self, cluster: str, partition: Optional[str] = None) -> str:
+        """Return the `sinfo` command used to query node status on a cluster.
+
+        Dispatches to the appropriate output format based on the cluster type (see `resource_handlers`).
+
+        Args:
+            cluster: The name of the cluster to query.
+            partition: The name of the partition to query, or None to query every partition at once.
+
+        Returns:
+            The `sinfo` command as a string.
+
+        Raises:
+            ValueError: If the cluster type is not recognized.
+        """
+
+        return self._get_resource_handler(cluster, 'command')(cluster, partition)
+
+    def parse_idle_resources(self, cluster: str, output: str) -> dict[int, dict[str, int]]:
+        """Return idle resource counts from the output of a single partition `sinfo` query.
+
+        Args:
+            cluster: The name of the queried cluster.
+            output: Raw output from the command returned by `get_sinfo_command`.
+
+        Returns:
+            A dictionary mapping idle resource count to node statistics.
+
+        Raises:
+            ValueError: If the cluster type is not recognized.
+        """
+
+        return self._get_resource_handler(cluster, 'parse')(output)
+
+    def parse_idle_resources_by_partition(self, cluster: str, output: str) -> dict[str, dict[int, dict[str, int]]]:
+        """Return idle resource counts per partition from the output of a cluster-wide `sinfo` query.
+
+        Args:
+            cluster: The name of the queried cluster.
+            output: Raw output from the command returned by `get_sinfo_command`.
+
+        Returns:
+            A dictionary mapping partition name to idle resource statistics.
+
+        Raises:
+            ValueError: If the cluster type is not recognized.
+        """
+
+        return self._get_resource_handler(cluster, 'parse_by_partition')(output)
+
+    def get_node_columns(self, cluster: str, output: str) -> dict[str, Sequence]:
+        """Return per-node status columns from the output of a cluster-wide `sinfo` query.
+
+        Args:
+            cluster: The name of the queried cluster.
+            output: Raw output from the command returned by `get_sinfo_command`.
+
+        Returns:
+            Node name, partition, state, GRES, idle resource, and free memory columns.
+
+        Raises:
+            ValueError: If the cluster type is not recognized.
+        """
+
+        return self._get_resource_handler(cluster, 'node_columns')(output)
+
+    @classmethod
+    def parse_idle_resources_snapshot(
+        cls, cluster: str, snapshot: ClusterSnapshot
+    ) -> dict[str, dict[int, dict[str, int]]]:
+        """Return idle resource counts per partition from a cluster state snapshot.
+
+        Args:
+            cluster: The name of the cluster.
+            snapshot: A snapshot including the cluster.
+
+        Returns:
+            A dictionary mapping partition name to idle resource statistics.
+        """
+
+        columns = snapshot.node_columns(cluster)
+        by_index = cls._aggregate_nodes(columns['partition'], columns['idle'], columns['free_mem'])
+        return {snapshot.string(index): stats for index, stats in by_index.items()}
 
     def count_idle_resources(self, cluster: str, partition: str) -> dict[int, dict[str, int]]:
         """Return idle resource counts for a given cluster partition.
 
-        Dispatches to the appropriate method based on the cluster type (CPU or GPU).
-
         Args:
             cluster: The name of the cluster to query.
             partition: The name of the partition within the cluster.
 
         Returns:
             A dictionary mapping idle resource count to node statistics.
+        """
+
+        output = Shell.run_command(self.get_sinfo_command(cluster, partition))
+        return self.parse_idle_resources(cluster, output)
+
+    def count_idle_resources_by_partition(self, cluster: str) -> dict[str, dict[int, dict[str, int]]]:
+        """Return idle resource counts for every partition on a cluster.
+
+        Issues a single `sinfo` query for the entire cluster and groups nodes
+        by partition locally.
+
+        Args:
+            cluster: The name of the cluster to query.
+
+        Returns:
+            A dictionary mapping partition name to idle resource statistics.
+        """
+
+        output = Shell.run_command(self.get_sinfo_command(cluster))
+        return self.parse_idle_resources_by_partition(cluster, output)
+
+    @staticmethod
+    def _get_json_number(value: Any) -> int:
+        """Return an integer from a numeric field of Slurm JSON output.
+
+        Newer Slurm releases wrap numbers in an object with `set` and `number` keys.
+
+        Args:
+            value: The raw field value.
+
+        Returns:
+            The numeric value, or zero if the value is not set.
+        """
+
+        if isinstance(value, dict):
+            value = value.get('number') if value.get('set', True) else 0
+
+        return value if isinstance(value, int) else 0
+
+    @classmethod
+    def _count_gpus(cls, gres: str) -> int:
+        """Return the number of GPUs in a generic resource (GRES) string such as `gpu:a100:4(S:0-1)`.
+
+        Args:
+            gres: The GRES string reported by Slurm.
+
+        Returns:
+            The total number of GPUs.
+        """
+
+        return sum(int(count) for count in cls._gpu_count.findall(gres or ''))
+
+    @classmethod
+    def _count_idle_cpus(cls, node: dict) -> int:
+        """Return the number of idle cores on a node from Slurm JSON output.
+
+        Matches the idle count of the `%C` sinfo format used when parsing text
+        output, which excludes both allocated cores and "other" cores that are
+        unavailable to jobs (e.g., cores reserved by core specialization).
+
+        Args:
+            node: A node record from `scontrol --json show nodes`.
+
+        Returns:
+            The number of idle cores.
+        """
+
+        if 'alloc_idle_cpus' in node:
+            return max(0, cls._get_json_number(node['alloc_idle_cpus']))
+
+        cpus = cls._get_json_number(node.get('effective_cpus')) or cls._get_json_number(node.get('cpus'))
+        return max(0, cpus - cls._get_json_number(node.get('alloc_cpus')))
+
+    def parse_idle_resources_json(self, cluster: str, data: dict) -> dict[str, dict[int, dict[str, int]]]:
+        """Return idle resource counts per partition from the JSON output of `get_json_command`.
+
+        Args:
+            cluster: The name of the queried cluster.
+            data: The parsed JSON document.
+
+        Returns:
+            A dictionary mapping partition name to idle resource statistics.
 
         Raises:
-            ValueError: If the cluster type is not recognized.
+            KeyError: If the document does not contain node information.
         """
 
-        cluster_type = self.cluster_types[cluster]
-        if cluster_type == 'GPUs':
-            return self._count_idle_gpu_resources(cluster, partition)
+        is_gpu_cluster = self.cluster_types[cluster] == 'GPUs'
+
+        # Build compact columns with one entry per node and partition membership
+        partitions, idle_column, free_mem_column = [], array('q'), array('q')
+        for node in data['nodes']:
+            state = node.get('state', '')
+            state = ' '.join(state if isinstance(state, list) else [state]).lower()
+            free_mem = self._get_json_number(node.get('free_mem', node.get('free_memory')))
+
+            # Mirror the node states excluded when parsing text output
+            if is_gpu_cluster:
+                if self._unavailable_gpu_state.search(state):
+                    idle, free_mem = 0, 0
+
+                else:
+                    idle = max(0, self._count_gpus(node.get('gres')) - self._count_gpus(node.get('gres_used')))
+
+            elif self._unavailable_cpu_state.search(state):
+                idle, free_mem = 0, 0
+
+            else:
+                idle = self._count_idle_cpus(node)
+
+            for partition in node.get('partitions') or []:
+                partitions.append(partition)
+                idle_column.append(idle)
+                free_mem_column.append(free_mem)
+
+        return self._aggregate_nodes(partitions, idle_column, free_mem_column)
+
+    @staticmethod
+    def get_json_command(cluster: str) -> str:
+        """Return the command used to query node status on a cluster as JSON.
+
+        Args:
+            cluster: The name of the cluster to query.
 
-        if cluster_type == 'cores':
-            return self._count_idle_cpu_resources(cluster, partition)
+        Returns:
+            The `scontrol` command as a string.
+        """
 
-        raise ValueError(f'Unknown cluster type: {cluster_type}')
+        return f'scontrol -M {cluster} --json show nodes'
 
     def print_partition_summary(self, cluster: str, partition: str, idle_resources: dict) -> None:
         """Print a summary of idle resources for a single partition.
@@ -209,6 +711,97 @@ class CrcIdle(BaseParser):
 
         print('')
 
+    def _collect_json_summaries(
+        self, clusters: Sequence[str], workers: int
+    ) -> dict[str, dict[str, dict[int, dict[str, int]]]]:
+        """Return idle resource statistics for each cluster using structured JSON output.
+
+        Node records are fetched from the Slurm REST API when the REST backend
+        is selected, and from `scontrol` otherwise.
+
+        Args:
+            clusters: The names of the clusters to query.
+            workers: The maximum number of concurrent Slurm queries.
+
+        Returns:
+            A dictionary mapping cluster name, then partition name, to idle
+            resource statistics. Clusters that did not return valid JSON
+            output are omitted.
+        """
+
+        if not clusters:
+            return {}
+
+        rest_client = Slurm.get_rest_client()
+        if rest_client is not None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                nodes = executor.map(rest_client.get_nodes, clusters)
+                return {
+                    cluster: self.parse_idle_resources_json(cluster, {'nodes': cluster_nodes})
+                    for cluster, cluster_nodes in zip(clusters, nodes)
+                }
+
+        if not Slurm.use_json():
+            return {}
+
+        commands = [self.get_json_command(cluster) for cluster in clusters]
+        outputs = Shell.run_commands(commands, max_concurrency=workers)
+
+        results = {}
+        for cluster, output in zip(clusters, outputs):
+            try:
+                results[cluster] = self.parse_idle_resources_json(cluster, Slurm.parse_json(output))
+
+            except (KeyError, TypeError):
+                continue
+
+        return results
+
+    def _collect_bulk_summaries(
+        self, clusters: Sequence[str], workers: int
+    ) -> dict[str, dict[str, dict[int, dict[str, int]]]]:
+        """Return idle resource statistics using a single `sinfo` query per cluster.
+
+        Args:
+            clusters: The names of the clusters to query.
+            workers: The maximum number of concurrent Slurm queries.
+
+        Returns:
+            A dictionary mapping cluster name, then partition name, to idle resource statistics.
+        """
+
+        commands = [self.get_sinfo_command(cluster) for cluster in clusters]
+        outputs = Shell.run_snapshot_commands(commands, max_concurrency=workers)
+        return {
+            cluster: self.parse_idle_resources_by_partition(cluster, output)
+            for cluster, output in zip(clusters, outputs)
+        }
+
+    def _collect_partition_summaries(
+        self, partitions: dict[str, list[str]], workers: int
+    ) -> dict[str, dict[str, dict[int, dict[str, int]]]]:
+        """Return idle resource statistics using a separate `sinfo` query for each partition.
+
+        Args:
+            partitions: The partition names to query, keyed by cluster name.
+            workers: The maximum number of concurrent Slurm queries.
+
+        Returns:
+            A dictionary mapping cluster name, then partition name, to idle resource statistics.
+        """
+
+        queries = [(cluster, partition) for cluster, names in partitions.items() for partition in names]
+        commands = [self.get_sinfo_command(cluster, partition) for cluster, partition in queries]
+        outputs = Shell.run_snapshot_commands(commands, max_concurrency=workers)
+
+        results = {cluster: {} for cluster in partitions}
+        for (cluster, partition), output in zip(queries, outputs):
+            results[cluster][partition] = self.parse_idle_resources(cluster, output)
+
+        return results
+
     def app_logic(self, args: Namespace) -> None:
         """Logic to evaluate when executing the application.
 
@@ -216,9 +809,42 @@ class CrcIdle(BaseParser):
             args: Parsed command line arguments.
         """
 
-        for cluster in self.get_cluster_list(args):
-            partitions_to_print = args.partition or Slurm.get_partition_names(cluster)
+        if args.workers < 1:
+            self.error('The number of workers must be a positive integer.')
+
+        clusters = self.get_cluster_list(args)
+
+        # Read clusters from a recent snapshot where one is published and query Slurm for the rest
+        snapshot = load_snapshot()
+        snapshot_clusters = [cluster for cluster in clusters if snapshot is not None and cluster in snapshot.clusters]
+        live_clusters = [cluster for cluster in clusters if cluster not in snapshot_clusters]
+
+        partitions = {}
+        for cluster in clusters:
+            if args.partition:
+                partitions[cluster] = args.partition
+
+            elif cluster in snapshot_clusters:
+                partitions[cluster] = sorted(set(snapshot.partition_names(cluster)) - Slurm.ignore_partitions)
+
+            else:
+                partitions[cluster] = sorted(Slurm.get_partition_names(cluster))
+
+        idle_resources = {
+            cluster: self.parse_idle_resources_snapshot(cluster, snapshot) for cluster in snapshot_clusters}
+
+        # Prefer structured output and fall back to text queries for any cluster not supporting it
+        idle_resources.update(self._collect_json_summaries(live_clusters, args.workers))
+        text_clusters = [cluster for cluster in live_clusters if cluster not in idle_resources]
+
+        if args.bulk:
+            idle_resources.update(self._collect_bulk_summaries(text_clusters, args.workers))
+
+        else:
+            text_partitions = {cluster: partitions[cluster] for cluster in text_clusters}
+            idle_resources.update(self._collect_partition_summaries(text_partitions, args.workers))
 
-            for partition in partitions_to_print:
-                idle_resources = self.count_idle_resources(cluster, partition)
-                self.print_partition_summary(cluster, partition, idle_resources)
+        # Summaries are printed in a deterministic order regardless of how queries were issued
+        for cluster in clusters:
+            for partition in partitions[cluster]:
+                self.print_partition_summary(cluster, partition, idle_resources[cluster].get(partition, {}))
@@ -7,10 +7,13 @@ find the expiration date of an account's active resource allocation request.
 import grp
 import os
 from argparse import Namespace
-from getpass import getpass
 
 from .utils.cli import BaseParser
-from .utils.keystone import (authenticate_keystone_session, get_active_requests, get_most_recent_expired_request)
+from .utils.keystone import (
+    authenticate_keystone_session,
+    get_active_requests,
+    get_most_recent_expired_request,
+    ResponseCache)
 from .utils.system_info import Slurm
 
 
@@ -27,6 +30,9 @@ class CrcProposalEnd(BaseParser):
         self.add_argument(
             'account', nargs='?', default=default_group,
             help=f'Slurm account name [defaults to your primary group: {default_group}]')
+        self.add_argument(
+            '--no-cache', action='store_true',
+            help='always fetch allocation information from Keystone instead of using cached responses')
 
     def app_logic(self, args: Namespace) -> None:
         """Logic to evaluate when executing the application.
@@ -37,16 +43,14 @@ class CrcProposalEnd(BaseParser):
 
         Slurm.check_slurm_account_exists(args.account)
 
-        keystone_session = authenticate_keystone_session(
-            username=os.environ["USER"],
-            password=getpass("Please enter your CRCD login password:\n")
-        )
+        keystone_session = authenticate_keystone_session(username=os.environ["USER"])
+        cache = None if args.no_cache else ResponseCache.from_environment()
 
-        alloc_requests = get_active_requests(keystone_session, args.account)
+        alloc_requests = get_active_requests(keystone_session, args.account, cache)
         if not alloc_requests:
             try:
                 alloc_requests = [
-                    get_most_recent_expired_request(keystone_session, args.account)
+                    get_most_recent_expired_request(keystone_session, args.account, cache)
                 ]
 
                 print(f'\033[91m\033[1mNo active allocation information found in accounting system for \'{args.account}\'!\n')
@@ -1,49 +1,158 @@
-"""Command line application for canceling a Slurm job with a confirmation prompt.
+"""Command line application for canceling Slurm jobs with a confirmation prompt.
 
 The `crc-scancel` application wraps the Slurm `scancel` command and adds an
 interactive confirmation step so users can verify they are canceling the correct
-job before it is terminated.
+jobs before they are terminated. Jobs can be selected by ID, array task ID, ID
+range, or by filtering on job name, state, and partition. Matching jobs are
+cancelled using a single `scancel` call per cluster.
 """
 
 import getpass
-from argparse import Namespace
-from typing import Union
+import re
+from argparse import ArgumentTypeError, Namespace
+from shlex import quote
+from typing import Optional, Sequence, Union
 
 from .utils.cli import BaseParser
 from .utils.system_info import Shell, Slurm
 
 
 class CrcScancel(BaseParser):
-    """Cancel a Slurm job submitted by the current user."""
+    """Cancel Slurm jobs submitted by the current user."""
 
     user = getpass.getuser()
 
+    # Job selections accepted on the command line: `1234`, `1234_5` (array task), or `1200-1250` (ID range)
+    job_spec_pattern = re.compile(r'(\d+)(?:_(\d+)|-(\d+))?')
+
+    # Fields reported by `squeue` for each job (the name is last since it may contain the separator)
+    job_format = '%i|%T|%P|%j'
+
     def __init__(self) -> None:
         """Define arguments for the command line interface."""
 
         super(CrcScancel, self).__init__()
+        self.add_argument(
+            'job_ids', nargs='*', type=self.parse_job_spec, metavar='job_id',
+            help='job IDs to cancel, including array tasks (1234_5) and ID ranges (1200-1250)')
+        self.add_argument('-n', '--name', help='only cancel jobs with the given name')
+        self.add_argument('-t', '--state', help='only cancel jobs in the given state(s) (e.g., PENDING)')
+        self.add_argument('-p', '--partition', help='only cancel jobs in the given partition(s)')
 
-        # Argument must be a valid integer expressed as a string
-        int_as_str = lambda x: str(int(x))
-        self.add_argument('job_id', type=int_as_str, help='the job ID to cancel')
+    @classmethod
+    def parse_job_spec(cls, value: str) -> str:
+        """Validate a job selection given on the command line.
 
-    @staticmethod
-    def cancel_job_on_cluster(cluster: str, job_id: str) -> None:
-        """Cancel a Slurm job on the given cluster.
+        Args:
+            value: A job ID, array task ID, or job ID range.
+
+        Returns:
+            The validated job selection.
+
+        Raises:
+            ArgumentTypeError: If the value is not a valid job selection.
+        """
+
+        match = cls.job_spec_pattern.fullmatch(value.strip())
+        if not match:
+            raise ArgumentTypeError(f'invalid job ID: {value!r}')
+
+        start, _, end = match.groups()
+        if end is not None and int(end) < int(start):
+            raise ArgumentTypeError(f'invalid job ID range: {value!r}')
+
+        return match.group()
+
+    @classmethod
+    def job_id_matches(cls, job_spec: str, reported_id: str) -> bool:
+        """Return whether a job ID reported by `squeue` is selected by a job specification.
 
         Args:
-            cluster: The name of the cluster the job is running on.
-            job_id: The ID of the Slurm job to cancel.
+            job_spec: A job ID, array task ID, or job ID range.
+            reported_id: A job ID reported by `squeue`, which may be an array task ID (e.g., `1234_5`)
+                or a heterogeneous job component (e.g., `1234+0`).
+
+        Returns:
+            True if the reported job is selected. Selecting a job ID also selects all of its
+            array tasks and heterogeneous job components.
+        """
+
+        start, task, end = cls.job_spec_pattern.fullmatch(job_spec).groups()
+        base_id = re.split('[_+]', reported_id, maxsplit=1)[0]
+        if task is not None:
+            return reported_id == job_spec
+
+        if end is not None:
+            return base_id.isdigit() and int(start) <= int(base_id) <= int(end)
+
+        return base_id == start
+
+    def get_squeue_command(
+        self, name: Optional[str] = None, state: Optional[str] = None, partition: Optional[str] = None
+    ) -> str:
+        """Return the `squeue` command listing the user's jobs on every cluster.
+
+        Job arrays are expanded (`-r`) so pending array tasks are reported
+        individually (e.g., `1234_7` instead of `1234_[7-9]`) and can be
+        matched by task ID.
+
+        Args:
+            name: Only list jobs with the given name.
+            state: Only list jobs in the given state(s).
+            partition: Only list jobs in the given partition(s).
+
+        Returns:
+            The `squeue` command as a string.
         """
 
-        Shell.run_command(f'scancel -M {cluster} {job_id}')
+        command = f'squeue -h -r -u {self.user} -M all -o {self.job_format}'
+        for option, value in (('-n', name), ('-t', state), ('-p', partition)):
+            if value:
+                command += f' {option} {quote(value)}'
+
+        return command
+
+    def find_jobs(
+        self,
+        job_specs: Sequence[str] = (),
+        name: Optional[str] = None,
+        state: Optional[str] = None,
+        partition: Optional[str] = None
+    ) -> dict[str, list[dict[str, str]]]:
+        """Return the user's jobs matching the given selection, grouped by cluster.
+
+        All clusters are searched using a single `squeue -M all` call. The
+        `-M` option is required to find scavenger jobs, which `squeue` does
+        not otherwise report.
+
+        Args:
+            job_specs: Job IDs, array task IDs, or ID ranges to select. All jobs are selected if empty.
+            name: Only select jobs with the given name.
+            state: Only select jobs in the given state(s).
+            partition: Only select jobs in the given partition(s).
+
+        Returns:
+            A dictionary mapping cluster name to job records with `id`, `name`, `state`, and `partition` keys.
+        """
+
+        output = Shell.run_command(self.get_squeue_command(name, state, partition))
+
+        jobs = {}
+        for cluster, lines in sorted(Slurm.split_cluster_sections(output).items()):
+            cluster_jobs = []
+            for line in lines:
+                job_id, job_state, job_partition, job_name = (line.split('|', 3) + ['', '', ''])[:4]
+                if not job_specs or any(self.job_id_matches(spec, job_id) for spec in job_specs):
+                    cluster_jobs.append({'id': job_id, 'name': job_name, 'state': job_state, 'partition': job_partition})
+
+            if cluster_jobs:
+                jobs[cluster] = cluster_jobs
+
+        return jobs
 
     def get_cluster_for_job_id(self, job_id: str) -> Union[str, None]:
         """Return the name of the cluster a given Slurm job is running on.
 
-        Iterates over all known clusters because fetching the cluster directly
-        via `squeue` fails for scavenger jobs.
-
         Args:
             job_id: The ID of the Slurm job to locate.
 
@@ -51,17 +160,42 @@ class CrcScancel(BaseParser):
             The cluster name, or None if the job is not found on any cluster.
         """
 
-        # In principle the cluster name can be fetched by running
-        #   squeue -h -j job_id
-        # However, that approach fails for scavenger jobs. Instead, we iterate
-        # over the clusters until we find the right one.
+        return next(iter(self.find_jobs([job_id])), None)
 
-        for cluster in Slurm.get_cluster_names(include_all_clusters=True):
-            user_job_ids = Shell.run_command(f'squeue -h -u {self.user} -j {job_id} -M {cluster}')
-            if job_id in user_job_ids:
-                return cluster
+    @staticmethod
+    def cancel_jobs_on_cluster(cluster: str, job_ids: Sequence[str]) -> None:
+        """Cancel multiple Slurm jobs on the given cluster using a single `scancel` call.
+
+        Args:
+            cluster: The name of the cluster the jobs are running on.
+            job_ids: The IDs of the Slurm jobs to cancel.
+        """
 
-        return None
+        Shell.run_command(f'scancel -M {cluster} {" ".join(job_ids)}')
+
+    @classmethod
+    def cancel_job_on_cluster(cls, cluster: str, job_id: str) -> None:
+        """Cancel a Slurm job on the given cluster.
+
+        Args:
+            cluster: The name of the cluster the job is running on.
+            job_id: The ID of the Slurm job to cancel.
+        """
+
+        cls.cancel_jobs_on_cluster(cluster, [job_id])
+
+    @staticmethod
+    def print_jobs(jobs: dict[str, list[dict[str, str]]]) -> None:
+        """Print a summary of jobs selected for cancellation.
+
+        Args:
+            jobs: Job records grouped by cluster name.
+        """
+
+        print(f'{"CLUSTER":<10} {"JOB ID":<20} {"STATE":<12} {"PARTITION":<15} NAME')
+        for cluster, cluster_jobs in jobs.items():
+            for job in cluster_jobs:
+                print(f'{cluster:<10} {job["id"]:<20} {job["state"]:<12} {job["partition"]:<15} {job["name"]}')
 
     def app_logic(self, args: Namespace) -> None:
         """Logic to evaluate when executing the application.
@@ -70,11 +204,28 @@ class CrcScancel(BaseParser):
             args: Parsed command line arguments.
         """
 
-        cluster = self.get_cluster_for_job_id(args.job_id)
-        if not cluster:
-            self.error(f'Could not find job {args.job_id} running on any known cluster.')
+        if not (args.job_ids or args.name or args.state or args.partition):
+            self.error('Specify at least one job ID or filter (--name, --state, --partition).')
+
+        jobs = self.find_jobs(args.job_ids, args.name, args.state, args.partition)
+        if not jobs:
+            self.error('Could not find any matching jobs running on any known cluster.')
+
+        num_jobs = sum(len(cluster_jobs) for cluster_jobs in jobs.values())
+        if num_jobs == 1:
+            cluster, (job,) = next(iter(jobs.items()))
+            description = f'job {job["id"]}'
+            print(f'Would you like to cancel {description} on cluster {cluster}? (y/N): ')
+
+        else:
+            self.print_jobs(jobs)
+            description = f'{num_jobs} jobs'
+            print(f'Would you like to cancel these {description} on {len(jobs)} cluster(s)? (y/N): ')
+
+        if Shell.readchar().lower() != 'y':
+            return
+
+        for cluster, cluster_jobs in jobs.items():
+            self.cancel_jobs_on_cluster(cluster, [job['id'] for job in cluster_jobs])
 
-        print(f'Would you like to cancel job {args.job_id} on cluster {cluster}? (y/N): ')
-        if Shell.readchar().lower() == 'y':
-            self.cancel_job_on_cluster(cluster, args.job_id)
-            print(f'Force terminated job {args.job_id}.')
+        print(f'Force terminated {description}.')
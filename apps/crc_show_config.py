@@ -3,11 +3,16 @@
 The `crc-show-config` application wraps `scontrol` to display partition and
 node-level Slurm settings for a given cluster. When a partition is specified,
 configuration for a representative node in that partition is shown.
+
+When a recent cluster state snapshot is published (see `apps.utils.snapshot`),
+configuration for clusters included in the snapshot is read without querying Slurm.
 """
 
 from argparse import Namespace
+from typing import Optional
 
 from .utils.cli import BaseParser
+from .utils.snapshot import ClusterSnapshot, load_snapshot
 from .utils.system_info import Shell, Slurm
 
 
@@ -35,14 +40,17 @@ class CrcShowConfig(BaseParser):
         """
 
         output = Shell.run_command(f'scontrol -M {cluster} show partition {partition}').split()
-        return {k: v for item in output for k, v in [item.split('=')]}
+        return {k: v for item in output for k, v in [item.split('=', 1)]}
 
-    def print_node(self, cluster: str, partition: str) -> None:
-        """Print Slurm node configuration for a representative node in a partition.
+    def get_node_config(self, cluster: str, partition: str) -> str:
+        """Return Slurm node configuration for a representative node in a partition.
 
         Args:
             cluster: The name of the cluster.
             partition: The name of the partition within the cluster.
+
+        Returns:
+            The node configuration reported by `scontrol show node`.
         """
 
         # Retrieve a list of nodes available in a given partition
@@ -54,7 +62,39 @@ class CrcShowConfig(BaseParser):
         # Assume the first node is representative of the partition
         nodes_info = Shell.run_command(f"scontrol show hostname {partition_nodes}")
         node = nodes_info.split()[0]
-        print(Shell.run_command(f"scontrol -M {cluster} show node {node}"))
+        return Shell.run_command(f"scontrol -M {cluster} show node {node}")
+
+    def print_node(self, cluster: str, partition: str) -> None:
+        """Print Slurm node configuration for a representative node in a partition.
+
+        Args:
+            cluster: The name of the cluster.
+            partition: The name of the partition within the cluster.
+        """
+
+        print(self.get_node_config(cluster, partition))
+
+    def print_snapshot(self, snapshot: ClusterSnapshot, cluster: str, partition: Optional[str]) -> None:
+        """Print Slurm configuration from a cluster state snapshot.
+
+        Args:
+            snapshot: A snapshot including the cluster.
+            cluster: The name of the cluster.
+            partition: The name of the partition within the cluster, or None to print the cluster configuration.
+        """
+
+        if not partition:
+            print(snapshot.partition_config(cluster))
+            return
+
+        if partition not in snapshot.partition_names(cluster) or partition in Slurm.ignore_partitions:
+            self.error(f'Partition {partition} is not part of cluster {cluster}.')
+
+        node_config = snapshot.node_config(cluster, partition)
+        if node_config is None:
+            self.error(f'Partition {partition} on cluster {cluster} has no nodes.')
+
+        print(node_config)
 
     def app_logic(self, args: Namespace) -> None:
         """Logic to evaluate when executing the application.
@@ -63,7 +103,11 @@ class CrcShowConfig(BaseParser):
             args: Parsed command line arguments.
         """
 
-        if args.partition:
+        snapshot = load_snapshot()
+        if snapshot is not None and args.cluster in snapshot.clusters:
+            self.print_snapshot(snapshot, args.cluster, args.partition)
+
+        elif args.partition:
             if args.partition not in Slurm.get_partition_names(args.cluster):
                 self.error(f'Partition {args.partition} is not part of cluster {args.cluster}.')
 
@@ -32,4 +32,4 @@ class CrcSinfo(BaseParser):
             print(command)
 
         else:
-            print(Shell.run_command(command))
+            print(Shell.run_snapshot_command(command))
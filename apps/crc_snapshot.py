@@ -0,0 +1,134 @@
+"""Command line application for publishing cluster state snapshots.
+
+The `crc-snapshot` application is intended to run as a scheduled job (e.g.,
+from cron every minute). It collects node status and partition configuration
+from Slurm and atomically publishes a snapshot file (see `apps.utils.snapshot`)
+that `crc-idle` and `crc-show-config` read instead of querying Slurm.
+"""
+
+import re
+import sys
+from argparse import Namespace
+
+from .crc_idle import CrcIdle
+from .crc_show_config import CrcShowConfig
+from .utils.cli import BaseParser
+from .utils.snapshot import get_snapshot_path, SnapshotWriter
+from .utils.system_info import Shell
+
+
+class CrcSnapshot(BaseParser):
+    """Publish a snapshot of Slurm cluster state for fast reads by other applications."""
+
+    def __init__(self) -> None:
+        """Define arguments for the command line interface."""
+
+        super().__init__()
+        default_path = get_snapshot_path()
+        self.add_argument(
+            'output', nargs='?', default=default_path,
+            help=f'the snapshot file to publish [default: {default_path}]')
+        self.add_argument(
+            '-c', '--cluster', nargs='+', default=list(CrcIdle.cluster_types),
+            help='the clusters to include [default: all clusters known to crc-idle]')
+
+    @staticmethod
+    def collect_partitions(cluster: str, config: str) -> list[tuple[str, str]]:
+        """Return the configuration of a representative node for each partition on a cluster.
+
+        Every partition listed in the cluster configuration is included. The
+        node configuration is left empty for partitions without nodes.
+
+        Args:
+            cluster: The name of the cluster.
+            config: The cluster's partition configuration as reported by `scontrol show partition`.
+
+        Returns:
+            Pairs of partition name and node configuration.
+        """
+
+        show_config = CrcShowConfig()
+        partitions = []
+        for partition in re.findall(r'PartitionName=(\S+)', config):
+            try:
+                node_config = show_config.get_node_config(cluster, partition)
+
+            # Partitions without nodes have no representative node
+            except (KeyError, IndexError):
+                node_config = ''
+
+            partitions.append((partition, node_config))
+
+        return partitions
+
+    def collect_cluster(self, cluster: str) -> tuple[dict[str, list], str, list[tuple[str, str]]]:
+        """Collect the current state of a single cluster from Slurm.
+
+        Args:
+            cluster: The name of the cluster.
+
+        Returns:
+            The node columns, partition configuration, and representative node
+            configurations, as accepted by `SnapshotWriter.add_cluster`.
+
+        Raises:
+            RuntimeError: If the cluster reports no node status.
+        """
+
+        idle = CrcIdle()
+        sinfo_output, config = Shell.run_commands(
+            [idle.get_sinfo_command(cluster), f'scontrol -M {cluster} show partition'])
+
+        try:
+            nodes = idle.get_node_columns(cluster, sinfo_output)
+
+        except ValueError:
+            nodes = {}
+
+        if not nodes.get('node'):
+            raise RuntimeError('no node status reported.')
+
+        return nodes, config.strip(), self.collect_partitions(cluster, config)
+
+    def collect_snapshot(self, clusters: list[str]) -> SnapshotWriter:
+        """Collect the current state of the given clusters from Slurm.
+
+        Clusters are collected concurrently and independently. Clusters that
+        report no nodes or fail to respond are omitted, so applications query
+        Slurm directly for them.
+
+        Args:
+            clusters: The names of the clusters to include.
+
+        Returns:
+            A snapshot ready to publish.
+        """
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max(1, len(clusters))) as executor:
+            futures = [executor.submit(self.collect_cluster, cluster) for cluster in clusters]
+
+        writer = SnapshotWriter()
+        for cluster, future in zip(clusters, futures):
+            try:
+                writer.add_cluster(cluster, *future.result())
+
+            # Timeouts and missing commands are raised as OSError subclasses
+            except (OSError, RuntimeError) as excep:
+                print(f'Skipping cluster {cluster}: {excep}', file=sys.stderr)
+
+        return writer
+
+    def app_logic(self, args: Namespace) -> None:
+        """Logic to evaluate when executing the application.
+
+        Args:
+            args: Parsed command line arguments.
+        """
+
+        writer = self.collect_snapshot(args.cluster)
+        if not writer.clusters:
+            self.error('No cluster state was collected. The existing snapshot was left unchanged.')
+
+        writer.publish(args.output)
@@ -3,11 +3,22 @@
 The `crc-squeue` application wraps the Slurm `squeue` command with
 opinionated output formatting. By default it shows only the current user's
 jobs, with an option to show all jobs across the cluster.
+
+In watch mode, output is streamed from a single long-lived `squeue --iterate`
+process and redrawn in place. The refresh interval backs off while the job
+list is unchanged and resets as soon as it changes.
+
+When a snapshot broker is running (see `apps.utils.broker`), one-off
+reports of all users' jobs are served from its shared snapshot instead of
+querying Slurm. Reports of the current user's jobs always query Slurm as
+that user, so they respect any job visibility restrictions.
 """
 
 import getpass
+import re
+import sys
 from argparse import Namespace
-from time import sleep
+from typing import Optional
 
 from .utils.cli import BaseParser
 from .utils.system_info import Shell
@@ -20,13 +31,26 @@ class CrcSqueue(BaseParser):
     output_format_user = "-o '%.8i %.3P %.35j %.2t %.12M %.6D %.4C %.50R %.20S'"
     output_format_all = "-o '%.8i %.3P %.6a %.6u %.35j %.2t %.12M %.6D %.4C %.50R %.20S'"
 
+    # Output fields ignored when checking whether the job list changed between refreshes
+    volatile_fields = ('M',)
+
+    # Timestamp printed by `squeue --iterate` before each report
+    timestamp_pattern = re.compile(r'\w{3} \w{3} [ \d]\d \d\d:\d\d:\d\d \d{4}')
+
+    unchanged_refreshes_before_backoff = 3  # Consecutive unchanged reports before the interval doubles
+
     def __init__(self) -> None:
         """Define arguments for the command line interface."""
 
         super(CrcSqueue, self).__init__()
         self.add_argument('-a', '--all', action='store_true', help='show jobs for all users')
         self.add_argument('-c', '--cluster', nargs='?', default='all', help='only show jobs for the given cluster')
-        self.add_argument('-w', '--watch', action='store_const', const=10, help='refresh output every 10 seconds')
+        self.add_argument(
+            '-w', '--watch', nargs='?', type=int, const=10, metavar='SECONDS',
+            help='refresh output every 10 seconds (or the given interval)')
+        self.add_argument(
+            '--max-interval', type=int, default=60, metavar='SECONDS',
+            help='longest refresh interval used while the job list is unchanged [default: 60]')
         self.add_argument('-z', '--print-command', action='store_true', help='print the equivalent Slurm command and exit')
 
     @classmethod
@@ -51,6 +75,122 @@ class CrcSqueue(BaseParser):
 
         return ' '.join(parts)
 
+    @classmethod
+    def get_change_signature(cls, report: str, output_format: str) -> str:
+        """Return the parts of an `squeue` report that identify a change in the job list.
+
+        Fields listed in `volatile_fields` (e.g., elapsed run time) are
+        removed, so reports only differ when jobs are added, removed, or
+        change state.
+
+        Args:
+            report: A single `squeue` report using the given output format.
+            output_format: The `-o` option used to generate the report.
+
+        Returns:
+            The report with volatile fields removed.
+        """
+
+        # Every field has a fixed width and is followed by a single space
+        spans, position = [], 0
+        for width, field in re.findall(r'%\.(\d+)(\w)', output_format):
+            if field in cls.volatile_fields:
+                spans.append((position, position + int(width)))
+
+            position += int(width) + 1
+
+        lines = []
+        for line in report.splitlines():
+            if cls.timestamp_pattern.fullmatch(line.strip()):
+                continue
+
+            for start, end in reversed(spans):
+                line = line[:start] + line[end:]
+
+            lines.append(line.rstrip())
+
+        return '\n'.join(line for line in lines if line)
+
+    def get_next_interval(self, interval: int, unchanged: int, base: int, maximum: int) -> int:
+        """Return the refresh interval to use after a report.
+
+        Args:
+            interval: The current refresh interval in seconds.
+            unchanged: The number of consecutive reports without changes.
+            base: The requested refresh interval in seconds.
+            maximum: The longest allowed refresh interval in seconds.
+
+        Returns:
+            The refresh interval in seconds.
+        """
+
+        if unchanged == 0:
+            return base
+
+        if unchanged >= self.unchanged_refreshes_before_backoff:
+            return max(base, min(maximum, interval * 2))
+
+        return interval
+
+    @staticmethod
+    def redraw(report: str, interval: int) -> None:
+        """Replace the previous report on screen with a new one.
+
+        Args:
+            report: The report to display.
+            interval: The current refresh interval in seconds.
+        """
+
+        status = f'Refreshing every {interval} seconds (Ctrl-C to exit)'
+        if sys.stdout.isatty():
+            sys.stdout.write(f'\033[H\033[2J{status}\n{report.strip()}\n')
+            sys.stdout.flush()
+
+        else:
+            print(f'{status}\n{report.strip()}\n', flush=True)
+
+    def watch(self, command: str, output_format: str, interval: int, maximum: Optional[int] = None) -> None:
+        """Continuously display `squeue` output from a single long-lived process.
+
+        The `squeue` process is only restarted when the refresh interval changes.
+
+        Args:
+            command: The `squeue` command to run, excluding the `--iterate` option.
+            output_format: The `-o` option included in the command.
+            interval: The requested refresh interval in seconds.
+            maximum: The longest refresh interval used while the job list is unchanged.
+        """
+
+        base = interval
+        maximum = max(base, maximum or base)
+        signature, unchanged = None, 0
+        report_start = previous_signature = previous_unchanged = None
+
+        while True:
+            reports = Shell.stream_output(f'{command} --iterate={interval}', self.timestamp_pattern)
+            for report in reports:
+                self.redraw(report, interval)
+
+                # A report displayed before it was complete is streamed again in full,
+                # in which case it replaces the partial report instead of counting as a new one
+                first_line = report.partition('\n')[0]
+                if first_line != report_start:
+                    report_start = first_line
+                    previous_signature, previous_unchanged = signature, unchanged
+
+                signature = self.get_change_signature(report, output_format)
+                unchanged = previous_unchanged + 1 if signature == previous_signature else 0
+
+                next_interval = self.get_next_interval(interval, unchanged, base, maximum)
+                if next_interval != interval:
+                    interval, unchanged = next_interval, 0
+                    reports.close()
+                    break
+
+            # Stop watching if the squeue process exits on its own
+            else:
+                return
+
     def app_logic(self, args: Namespace) -> None:
         """Logic to evaluate when executing the application.
 
@@ -63,7 +203,12 @@ class CrcSqueue(BaseParser):
             print(command)
             return
 
-        print(Shell.run_command(command))
-        while args.watch:
-            sleep(args.watch)
-            print('\n', Shell.run_command(command))
+        if args.watch is not None:
+            if args.watch < 1 or args.max_interval < 1:
+                self.error('Refresh intervals must be at least one second.')
+
+            output_format = self.output_format_all if args.all else self.output_format_user
+            self.watch(command, output_format, args.watch, args.max_interval)
+            return
+
+        print(Shell.run_snapshot_command(command) if args.all else Shell.run_command(command))
@@ -8,20 +8,21 @@ active allocation.
 import grp
 import os
 from argparse import Namespace
-from getpass import getpass
+from collections import defaultdict
 
 from .utils.cli import BaseParser
 from .utils.keystone import (
     authenticate_keystone_session,
-    get_active_requests,
+    get_active_requests_by_account,
     get_earliest_startdate,
-    get_most_recent_expired_request,
-    get_per_cluster_totals)
+    get_most_recent_expired_requests_by_account,
+    get_per_cluster_totals,
+    ResponseCache)
 from .utils.system_info import Slurm
 
 
 class CrcSus(BaseParser):
-    """Display the service unit balance for a Slurm account."""
+    """Display the service unit balance for one or more Slurm accounts."""
 
     def __init__(self) -> None:
         """Define arguments for the command line interface."""
@@ -31,8 +32,11 @@ class CrcSus(BaseParser):
         default_group = grp.getgrgid(os.getgid()).gr_name
 
         self.add_argument(
-            'account', nargs='?', default=default_group,
-            help=f'Slurm account name [defaults to your primary group: {default_group}]')
+            'accounts', nargs='*', metavar='account', default=[default_group],
+            help=f'Slurm account names [defaults to your primary group: {default_group}]')
+        self.add_argument(
+            '--no-cache', action='store_true',
+            help='always fetch allocation information from Keystone instead of using cached responses')
 
     @staticmethod
     def build_output_string(account: str, used: int, total: int, cluster: str) -> str:
@@ -57,6 +61,38 @@ class CrcSus(BaseParser):
 
         return f'Account {account}\n {status}'
 
+    @staticmethod
+    def get_used_service_units(alloc_requests: dict[str, list[dict]]) -> dict[str, dict[str, int]]:
+        """Return the number of service units used by each account on each cluster.
+
+        Accounts sharing the same reporting period are queried together using
+        a single `sreport` call, and calls for different periods run concurrently.
+
+        Args:
+            alloc_requests: Allocation request records keyed by account name.
+
+        Returns:
+            A dictionary mapping account name, then cluster name, to the number of service units used.
+        """
+
+        accounts_by_start_date = defaultdict(list)
+        for account, requests in alloc_requests.items():
+            accounts_by_start_date[get_earliest_startdate(requests)].append(account)
+
+        queries = []
+        for start_date, accounts in accounts_by_start_date.items():
+            clusters = {cluster for account in accounts for cluster in get_per_cluster_totals(alloc_requests[account])}
+            queries.append((accounts, start_date, sorted(clusters)))
+
+        used_service_units = {}
+        for (accounts, _, _), usage in zip(queries, Slurm.get_bulk_usage_by_period(queries)):
+            for account in accounts:
+                used_service_units[account] = {
+                    cluster: usage_by_user.get('total', 0) for cluster, usage_by_user in usage.get(account, {}).items()
+                }
+
+        return used_service_units
+
     def app_logic(self, args: Namespace) -> None:
         """Logic to evaluate when executing the application.
 
@@ -64,36 +100,40 @@ class CrcSus(BaseParser):
             args: Parsed command line arguments.
         """
 
-        Slurm.check_slurm_account_exists(account_name=args.account)
+        # Preserve the order accounts were given in while dropping duplicates
+        accounts = list(dict.fromkeys(args.accounts))
+        Slurm.check_slurm_accounts_exist(accounts)
 
-        session = authenticate_keystone_session(
-            username=os.environ['USER'],
-            password=getpass('Please enter your CRCD login password:\n')
-        )
+        session = authenticate_keystone_session(username=os.environ['USER'])
+        cache = None if args.no_cache else ResponseCache.from_environment()
 
-        alloc_requests = get_active_requests(session, args.account)
-        if not alloc_requests:
-            try:
-                alloc_requests = [
-                    get_most_recent_expired_request(session, args.account)
-                ]
+        active_requests = get_active_requests_by_account(session, accounts, cache)
+        inactive_accounts = [account for account in accounts if not active_requests[account]]
+        expired_requests = get_most_recent_expired_requests_by_account(session, inactive_accounts, cache)
 
-                print(f'\033[91m\033[1mNo active allocation information found in accounting system for \'{args.account}\'!\n')
-                print('Showing remaining service unit amounts for most recently expired Resource Allocation Request:\033[0m \n')
+        alloc_requests = {}
+        for account in accounts:
+            if active_requests[account]:
+                alloc_requests[account] = active_requests[account]
 
-            except IndexError:
+            elif account in expired_requests:
+                alloc_requests[account] = [expired_requests[account]]
+
+        used_service_units = self.get_used_service_units(alloc_requests)
+        for account in accounts:
+            if account not in alloc_requests:
                 print(
-                    '\033[91m\033[1mNo allocation information found. Either the group does not have any allocations, '
-                    'or you do not have permissions to view them. If you believe this to be a mistake, please submit '
-                    'a help ticket to the CRCD team.\033[0m \n'
+                    f'\033[91m\033[1mNo allocation information found for \'{account}\'. Either the group does not '
+                    'have any allocations, or you do not have permissions to view them. If you believe this to be '
+                    'a mistake, please submit a help ticket to the CRCD team.\033[0m \n'
                 )
 
-                exit()
+                continue
 
-        per_cluster_totals = get_per_cluster_totals(alloc_requests)
-        earliest_date = get_earliest_startdate(alloc_requests)
+            if not active_requests[account]:
+                print(f'\033[91m\033[1mNo active allocation information found in accounting system for \'{account}\'!\n')
+                print('Showing remaining service unit amounts for most recently expired Resource Allocation Request:\033[0m \n')
 
-        for cluster, total in per_cluster_totals.items():
-            usage = Slurm.get_cluster_usage_by_user(args.account, earliest_date, cluster)
-            used = int(usage['total']) if usage else 0
-            print(self.build_output_string(args.account, used, total, cluster))
+            for cluster, total in get_per_cluster_totals(alloc_requests[account]).items():
+                used = used_service_units[account].get(cluster, 0)
+                print(self.build_output_string(account, used, total, cluster))
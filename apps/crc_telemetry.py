@@ -0,0 +1,103 @@
+"""Command line application for summarizing wrapper usage telemetry.
+
+The `crc-telemetry` application aggregates records written to the telemetry
+spool (see `apps.utils.telemetry`) and reports, per wrapper application, how
+often it was run, how long it took, and how many Slurm and Keystone calls it
+issued.
+"""
+
+import math
+import os
+import time
+from argparse import Namespace
+
+from .utils.cli import BaseParser
+from .utils.telemetry import find_spool_files, read_records, SPOOL_DIR_ENV
+
+
+class CrcTelemetry(BaseParser):
+    """Summarize wrapper application usage recorded in the telemetry spool."""
+
+    def __init__(self) -> None:
+        """Define arguments for the command line interface."""
+
+        super().__init__()
+        default_dir = os.environ.get(SPOOL_DIR_ENV)
+        self.add_argument(
+            'spool_dir', nargs='?', default=default_dir,
+            help=f'telemetry spool directory [defaults to ${SPOOL_DIR_ENV}: {default_dir}]')
+        self.add_argument('--days', type=float, help='only include invocations from the given number of past days')
+
+    @staticmethod
+    def percentile(values: list[float], fraction: float) -> float:
+        """Return a percentile of a list of values using the nearest rank method.
+
+        Args:
+            values: A non-empty, sorted list of values.
+            fraction: The percentile to return, between 0 and 1.
+
+        Returns:
+            The value at the requested percentile.
+        """
+
+        return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+    @classmethod
+    def summarize(cls, records: list[dict]) -> dict[str, dict]:
+        """Aggregate telemetry records by application.
+
+        Args:
+            records: Telemetry records to aggregate.
+
+        Returns:
+            Summary statistics keyed by application name.
+        """
+
+        grouped: dict[str, list[dict]] = {}
+        for record in records:
+            grouped.setdefault(record['tool'], []).append(record)
+
+        summary = {}
+        for tool, tool_records in sorted(grouped.items()):
+            durations = sorted(record.get('ms', 0) for record in tool_records)
+            summary[tool] = {
+                'runs': len(tool_records),
+                'errors': sum(1 for record in tool_records if record.get('status')),
+                'median_ms': cls.percentile(durations, 0.5),
+                'p95_ms': cls.percentile(durations, 0.95),
+                'slurm_calls': sum(record.get('slurm', 0) for record in tool_records),
+                'keystone_calls': sum(record.get('keystone', 0) for record in tool_records),
+            }
+
+        return summary
+
+    def app_logic(self, args: Namespace) -> None:
+        """Logic to evaluate when executing the application.
+
+        Args:
+            args: Parsed command line arguments.
+        """
+
+        if not args.spool_dir:
+            self.error(f'No spool directory given and {SPOOL_DIR_ENV} is not set.')
+
+        records = read_records(find_spool_files(args.spool_dir))
+        if args.days is not None:
+            cutoff = time.time() - args.days * 86400
+            records = (record for record in records if record.get('ts', 0) >= cutoff)
+
+        summary = self.summarize(list(records))
+        if not summary:
+            print('No telemetry records found.')
+            return
+
+        from prettytable import PrettyTable
+
+        table = PrettyTable(header=True, padding_width=1)
+        table.field_names = ['TOOL', 'RUNS', 'ERRORS', 'MEDIAN (ms)', 'P95 (ms)', 'SLURM CALLS', 'KEYSTONE CALLS']
+        for tool, stats in summary.items():
+            table.add_row([
+                tool, stats['runs'], stats['errors'], stats['median_ms'], stats['p95_ms'],
+                stats['slurm_calls'], stats['keystone_calls']])
+
+        print(table)
@@ -8,22 +8,20 @@ in an account's active allocation.
 import grp
 import os
 from argparse import Namespace
-from getpass import getpass
-
-from prettytable import PrettyTable
 
 from .utils.cli import BaseParser
 from .utils.keystone import (
     authenticate_keystone_session,
-    get_active_requests,
+    get_active_requests_by_account,
     get_earliest_startdate,
-    get_most_recent_expired_request,
-    get_per_cluster_totals)
+    get_most_recent_expired_requests_by_account,
+    get_per_cluster_totals,
+    ResponseCache)
 from .utils.system_info import Slurm
 
 
 class CrcUsage(BaseParser):
-    """Display allocation and usage summaries for a Slurm account."""
+    """Display allocation and usage summaries for one or more Slurm accounts."""
 
     def __init__(self) -> None:
         """Define arguments for the command line interface."""
@@ -33,8 +31,11 @@ class CrcUsage(BaseParser):
         default_group = grp.getgrgid(os.getgid()).gr_name
 
         self.add_argument(
-            'account', nargs='?', default=default_group,
-            help="Slurm account name (defaults to the current user's primary group name)")
+            'accounts', nargs='*', metavar='account', default=[default_group],
+            help="Slurm account names (defaults to the current user's primary group name)")
+        self.add_argument(
+            '--no-cache', action='store_true',
+            help='always fetch allocation information from Keystone instead of using cached responses')
 
     @staticmethod
     def print_summary_table(alloc_requests: list[dict], account_name: str, per_request_totals: dict) -> None:
@@ -46,6 +47,8 @@ class CrcUsage(BaseParser):
             per_request_totals: Awarded service unit totals keyed by request ID and cluster name.
         """
 
+        from prettytable import PrettyTable
+
         # Print request and allocation information for active allocations from the provided group
         table = PrettyTable(header=True, padding_width=2, max_table_width=79, min_table_width=79)
         table.title = f"Resource Allocation Request Information for '{account_name}'"
@@ -73,11 +76,14 @@ class CrcUsage(BaseParser):
             earliest_date: The start date to use when querying usage from Slurm.
         """
 
+        from prettytable import PrettyTable
+
         table = PrettyTable(header=False, padding_width=2, max_table_width=79, min_table_width=79)
         table.title = 'Summary of Usage Across All Clusters'
 
+        usage_by_cluster = Slurm.get_usage_by_cluster(account_name, earliest_date, awarded_totals)
         for cluster, total_awarded in awarded_totals.items():
-            usage_by_user = Slurm.get_cluster_usage_by_user(account_name, earliest_date, cluster)
+            usage_by_user = usage_by_cluster[cluster]
 
             if not usage_by_user:
                 table.add_row([cluster, 'TOTAL USED: 0', f'AWARDED: {total_awarded}', '% USED: 0'], divider=True)
@@ -108,38 +114,39 @@ class CrcUsage(BaseParser):
             args: Parsed command line arguments.
         """
 
-        Slurm.check_slurm_account_exists(account_name=args.account)
+        # Preserve the order accounts were given in while dropping duplicates
+        accounts = list(dict.fromkeys(args.accounts))
+        Slurm.check_slurm_accounts_exist(accounts)
 
-        session = authenticate_keystone_session(
-            username=os.environ['USER'],
-            password=getpass('Please enter your CRCD login password:\n')
-        )
+        session = authenticate_keystone_session(username=os.environ['USER'])
+        cache = None if args.no_cache else ResponseCache.from_environment()
 
-        alloc_requests = get_active_requests(session, args.account)
+        active_requests = get_active_requests_by_account(session, accounts, cache)
+        inactive_accounts = [account for account in accounts if not active_requests[account]]
+        expired_requests = get_most_recent_expired_requests_by_account(session, inactive_accounts, cache)
 
-        if not alloc_requests:
-            try:
-                alloc_requests = [
-                    get_most_recent_expired_request(session, args.account)
-                ]
+        for account in accounts:
+            alloc_requests = active_requests[account]
 
-                print(f'\033[91m\033[1mNo active allocation information found in accounting system for \'{args.account}\'!\n')
-                print('Attempting to show the most recently expired Resource Allocation Request info:\033[0m \n')
+            if not alloc_requests:
+                if account not in expired_requests:
+                    print(
+                        f'\033[91m\033[1mNo allocation information found for \'{account}\'. Either the group does not '
+                        'have any allocations, or you do not have permissions to view them. If you believe this to be '
+                        'a mistake, please submit a help ticket to the CRCD team.\033[0m \n'
+                    )
 
-            except IndexError:
-                print(
-                    '\033[91m\033[1mNo allocation information found. Either the group does not have any allocations, '
-                    'or you do not have permissions to view them. If you believe this to be a mistake, please submit '
-                    'a help ticket to the CRCD team.\033[0m \n'
-                )
+                    continue
 
-                exit()
+                alloc_requests = [expired_requests[account]]
+                print(f'\033[91m\033[1mNo active allocation information found in accounting system for \'{account}\'!\n')
+                print('Attempting to show the most recently expired Resource Allocation Request info:\033[0m \n')
 
-        self.print_summary_table(
-            alloc_requests, args.account,
-            get_per_cluster_totals(alloc_requests, per_request=True))
+            self.print_summary_table(
+                alloc_requests, account,
+                get_per_cluster_totals(alloc_requests, per_request=True))
 
-        self.print_usage_table(
-            args.account,
-            get_per_cluster_totals(alloc_requests),
-            get_earliest_startdate(alloc_requests))
+            self.print_usage_table(
+                account,
+                get_per_cluster_totals(alloc_requests),
+                get_earliest_startdate(alloc_requests))
@@ -0,0 +1,374 @@
+"""Pluggable backends for running Slurm commands and Keystone API requests.
+
+By default, Slurm commands are executed on the host and Keystone requests
+are sent to the live Keystone API. Installing an alternative backend routes
+all of this traffic through a `Backend` instance instead. This makes it
+possible to run the wrapper applications on machines without Slurm or
+network access, for example when testing or benchmarking.
+
+A backend is installed programmatically using `set_backend`, or via the
+following environment variables:
+
+- `CRC_WRAPPERS_BACKEND`: Set to `replay` to serve recorded responses, or to
+  `rest` to send supported Slurm queries to the Slurm REST API instead of
+  running commands (see the `slurmrestd` module). Defaults to `live`.
+- `CRC_WRAPPERS_REPLAY_FILE`: The fixture file used by the replay backend.
+- `CRC_WRAPPERS_REPLAY_LATENCY`: Artificial latency in seconds added to
+  every replayed command and request.
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+BACKEND_ENV = 'CRC_WRAPPERS_BACKEND'
+BACKEND_NAMES = ('live', 'replay', 'rest')
+REPLAY_FILE_ENV = 'CRC_WRAPPERS_REPLAY_FILE'
+REPLAY_LATENCY_ENV = 'CRC_WRAPPERS_REPLAY_LATENCY'
+
+_active_backend: Optional[Backend] = None
+_environment_backends: dict[tuple[str, float], Backend] = {}  # Backends loaded from the environment
+
+
+class Backend(metaclass=abc.ABCMeta):
+    """Interface for backends serving Slurm commands and Keystone API requests."""
+
+    @abc.abstractmethod
+    def run_command(self, command: str) -> tuple[str, str]:
+        """Run a Slurm command.
+
+        Args:
+            command: The command to execute.
+
+        Returns:
+            A tuple of (stdout, stderr) output.
+        """
+
+    async def run_command_async(self, command: str) -> tuple[str, str]:
+        """Run a Slurm command asynchronously.
+
+        Args:
+            command: The command to execute.
+
+        Returns:
+            A tuple of (stdout, stderr) output.
+        """
+
+        return self.run_command(command)
+
+    @abc.abstractmethod
+    def keystone_get(self, endpoint: str, params: Optional[dict] = None) -> tuple[int, Any]:
+        """Send a GET request to the Keystone API.
+
+        Args:
+            endpoint: The API endpoint to query.
+            params: Query parameters to include in the request.
+
+        Returns:
+            A tuple of the HTTP status code and the decoded JSON response.
+        """
+
+    def create_keystone_client(self) -> BackendKeystoneClient:
+        """Return a Keystone client that sends requests through this backend.
+
+        Returns:
+            A client implementing the subset of the `KeystoneClient` interface used by the wrappers.
+        """
+
+        return BackendKeystoneClient(self)
+
+
+class BackendResponse:
+    """A minimal HTTP response returned by `BackendKeystoneClient`."""
+
+    def __init__(self, status_code: int, data: Any) -> None:
+        """Create a response.
+
+        Args:
+            status_code: The HTTP status code.
+            data: The decoded JSON response body.
+        """
+
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+        self._data = data
+
+    def json(self) -> Any:
+        """Return the decoded JSON response body."""
+
+        return self._data
+
+    def raise_for_status(self) -> None:
+        """Raise an error if the response has an error status code.
+
+        Raises:
+            RuntimeError: If the status code is 400 or greater.
+        """
+
+        if self.status_code >= 400:
+            raise RuntimeError(f'Keystone returned HTTP {self.status_code}')
+
+
+class BackendKeystoneClient:
+    """A Keystone client that sends requests through a backend instead of the network."""
+
+    def __init__(self, backend: Backend) -> None:
+        """Create a client for the given backend.
+
+        Args:
+            backend: The backend serving requests.
+        """
+
+        self.backend = backend
+
+    def login(self, username: str, password: str) -> None:
+        """Accept any credentials."""
+
+    def http_get(self, endpoint: str, params: Optional[dict] = None, **kwargs) -> BackendResponse:
+        """Send a GET request through the backend.
+
+        Args:
+            endpoint: The API endpoint to query.
+            params: Query parameters to include in the request.
+            **kwargs: Ignored request options such as custom headers.
+
+        Returns:
+            The HTTP response.
+        """
+
+        return BackendResponse(*self.backend.keystone_get(endpoint, params))
+
+
+class ReplayBackend(Backend):
+    """Serve previously recorded Slurm command output and Keystone responses.
+
+    Fixtures are stored as JSON documents of the form:
+
+        {
+            "commands": {"<command>": {"stdout": "...", "stderr": "..."}},
+            "keystone": {"<endpoint>?<params>": {"status": 200, "data": {...}}}
+        }
+
+    Keystone request keys are built using `build_request_key`.
+    """
+
+    def __init__(self, fixtures: Optional[dict] = None, latency: float = 0) -> None:
+        """Create a replay backend.
+
+        Args:
+            fixtures: Recorded responses in the fixture file format.
+            latency: Artificial latency in seconds added to every command and request.
+        """
+
+        fixtures = fixtures or {}
+        self.commands: dict[str, dict[str, str]] = dict(fixtures.get('commands', {}))
+        self.keystone: dict[str, dict[str, Any]] = dict(fixtures.get('keystone', {}))
+        self.latency = latency
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], latency: float = 0) -> ReplayBackend:
+        """Load a replay backend from a fixture file.
+
+        Args:
+            path: The path of the fixture file.
+            latency: Artificial latency in seconds added to every command and request.
+
+        Returns:
+            A `ReplayBackend` instance.
+        """
+
+        with open(path) as fixture_file:
+            return cls(json.load(fixture_file), latency=latency)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write all recorded responses to a fixture file.
+
+        Args:
+            path: The destination file path.
+        """
+
+        with open(path, 'w') as fixture_file:
+            json.dump({'commands': self.commands, 'keystone': self.keystone}, fixture_file, indent=2)
+
+    @staticmethod
+    def build_request_key(endpoint: str, params: Optional[dict] = None) -> str:
+        """Return the key identifying a Keystone request.
+
+        Args:
+            endpoint: The API endpoint being queried.
+            params: Query parameters included in the request.
+
+        Returns:
+            A string uniquely identifying the request.
+        """
+
+        return endpoint + '?' + json.dumps(params or {}, sort_keys=True, default=str)
+
+    def add_command(self, command: str, stdout: str, stderr: str = '') -> None:
+        """Record the output of a Slurm command.
+
+        Args:
+            command: The command being recorded.
+            stdout: The output written to stdout.
+            stderr: The output written to stderr.
+        """
+
+        self.commands[command] = {'stdout': stdout, 'stderr': stderr}
+
+    def add_keystone_response(self, endpoint: str, params: Optional[dict], data: Any, status: int = 200) -> None:
+        """Record the response to a Keystone request.
+
+        Args:
+            endpoint: The API endpoint being recorded.
+            params: Query parameters included in the request.
+            data: The decoded JSON response body.
+            status: The HTTP status code.
+        """
+
+        self.keystone[self.build_request_key(endpoint, params)] = {'status': status, 'data': data}
+
+    def _get_command_output(self, command: str) -> tuple[str, str]:
+        """Return the recorded output of a command.
+
+        Args:
+            command: The command to look up.
+
+        Returns:
+            A tuple of (stdout, stderr) output.
+
+        Raises:
+            RuntimeError: If no output was recorded for the command.
+        """
+
+        try:
+            record = self.commands[command]
+
+        except KeyError:
+            raise RuntimeError(f'No recorded output for command: {command}')
+
+        return record.get('stdout', ''), record.get('stderr', '')
+
+    def run_command(self, command: str) -> tuple[str, str]:
+        """Return the recorded output of a command after the configured latency.
+
+        Args:
+            command: The command to look up.
+
+        Returns:
+            A tuple of (stdout, stderr) output.
+        """
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        return self._get_command_output(command)
+
+    async def run_command_async(self, command: str) -> tuple[str, str]:
+        """Return the recorded output of a command without blocking other tasks.
+
+        Args:
+            command: The command to look up.
+
+        Returns:
+            A tuple of (stdout, stderr) output.
+        """
+
+        if self.latency:
+            import asyncio
+
+            await asyncio.sleep(self.latency)
+
+        return self._get_command_output(command)
+
+    def keystone_get(self, endpoint: str, params: Optional[dict] = None) -> tuple[int, Any]:
+        """Return the recorded response to a Keystone request after the configured latency.
+
+        Requests without a recorded response are answered with an HTTP 404 status.
+
+        Args:
+            endpoint: The API endpoint to query.
+            params: Query parameters included in the request.
+
+        Returns:
+            A tuple of the HTTP status code and the decoded JSON response.
+        """
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        record = self.keystone.get(self.build_request_key(endpoint, params))
+        if record is None:
+            return 404, {'detail': 'Not found.'}
+
+        return record.get('status', 200), record.get('data')
+
+
+def set_backend(backend: Optional[Backend]) -> None:
+    """Install a backend for all Slurm commands and Keystone requests.
+
+    Args:
+        backend: The backend to install, or None to restore the default behavior.
+    """
+
+    global _active_backend
+    _active_backend = backend
+
+
+def get_backend_name() -> str:
+    """Return the name of the backend selected in the environment.
+
+    Returns:
+        One of `BACKEND_NAMES`.
+
+    Raises:
+        ValueError: If the environment names an unknown backend.
+    """
+
+    name = os.environ.get(BACKEND_ENV, '').lower() or BACKEND_NAMES[0]
+    if name not in BACKEND_NAMES:
+        raise ValueError(f'Unknown backend {name!r}. Expected one of: {", ".join(BACKEND_NAMES)}')
+
+    return name
+
+
+def get_backend() -> Optional[Backend]:
+    """Return the active backend.
+
+    A backend installed using `set_backend` takes precedence over one
+    configured in the environment. The `live` and `rest` backends both send
+    traffic to the real Slurm and Keystone services, so no `Backend`
+    instance is returned for them.
+
+    Returns:
+        The active `Backend` instance, or None if the default behavior is in use.
+
+    Raises:
+        ValueError: If the environment names an unknown backend.
+    """
+
+    if _active_backend is not None:
+        return _active_backend
+
+    if get_backend_name() != 'replay':
+        return None
+
+    try:
+        latency = float(os.environ.get(REPLAY_LATENCY_ENV, 0))
+
+    except ValueError:
+        latency = 0
+
+    path = os.environ.get(REPLAY_FILE_ENV)
+    if not path:
+        raise ValueError(f'The {REPLAY_FILE_ENV} environment variable must be set to use the replay backend.')
+
+    key = (path, latency)
+    if key not in _environment_backends:
+        _environment_backends[key] = ReplayBackend.from_file(path, latency=latency)
+
+    return _environment_backends[key]
@@ -0,0 +1,353 @@
+"""Shared snapshot broker for read-only Slurm queries on a login node.
+
+When many users run the wrapper applications at once, each invocation
+normally queries the Slurm controller independently. The snapshot broker is
+an optional per-node daemon that runs each distinct `sinfo`/`squeue` query
+once per polling interval and serves the most recent output to every
+wrapper over a Unix domain socket. The number of controller RPCs per
+interval is then bounded by the number of distinct queries, independent of
+the number of users.
+
+Wrappers use the broker transparently when its socket exists, and fall back
+to querying Slurm directly otherwise. The socket path is configured using
+the `CRC_WRAPPERS_BROKER_SOCKET` environment variable. Start the broker
+(e.g., from a systemd unit running as an unprivileged user) with:
+
+    python -m apps.utils.broker --socket /run/crc-wrappers/broker.sock --interval 30
+
+Only the `sinfo` and `squeue` command shapes generated by the wrappers are
+served, and commands are only re-polled while clients keep requesting them.
+Output reflects what the broker's own user is allowed to see. On clusters
+restricting job visibility (`PrivateData=jobs`), listings of all users' jobs
+served by the broker may therefore differ from what the requesting user
+would see. Listings of a user's own jobs never go through the broker.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import time
+from getopt import GetoptError, gnu_getopt
+from shlex import split
+from typing import Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from threading import Event
+
+SOCKET_ENV = 'CRC_WRAPPERS_BROKER_SOCKET'
+DEFAULT_SOCKET = '/run/crc-wrappers/broker.sock'
+CLIENT_TIMEOUT = 2  # Seconds to wait for the broker before falling back to Slurm
+
+# Options accepted for each program served by the broker, as (short options, long options) in `getopt` format.
+# These match the queries generated by the wrappers. Anything else, including options such as `--iterate`
+# that keep a command running indefinitely, is rejected.
+ALLOWED_OPTIONS = {
+    'sinfo': ('hNM:o:p:', ['noheader', 'Node', 'clusters=', 'format=', 'Format=', 'partition=']),
+    'squeue': ('hM:o:', ['noheader', 'clusters=', 'format=']),
+}
+
+
+def get_socket_path() -> Optional[str]:
+    """Return the broker socket path, or None if no broker is running."""
+
+    path = os.environ.get(SOCKET_ENV, DEFAULT_SOCKET)
+    return path if path and os.path.exists(path) else None
+
+
+def is_allowed(command: str) -> bool:
+    """Return whether a command may be served by the broker.
+
+    Args:
+        command: The command to check.
+
+    Returns:
+        True for `sinfo` and `squeue` queries using only the options in `ALLOWED_OPTIONS`.
+    """
+
+    try:
+        program, *arguments = split(command)
+        short_options, long_options = ALLOWED_OPTIONS[program]
+
+        # Options are parsed the way Slurm parses them, so bundled (`-hi5`) and abbreviated forms are caught
+        _, positional = gnu_getopt(arguments, short_options, long_options)
+
+    except (ValueError, KeyError, GetoptError):
+        return False
+
+    return not positional
+
+
+def query_snapshots(commands: Sequence[str], socket_path: Optional[str] = None) -> list[Optional[str]]:
+    """Fetch the output of multiple commands from the broker.
+
+    Args:
+        commands: The commands to fetch output for.
+        socket_path: The broker socket. Defaults to the configured path.
+
+    Returns:
+        The output of each command, with None for commands the broker could not serve.
+    """
+
+    socket_path = socket_path or get_socket_path()
+    if socket_path is None or not commands:
+        return [None] * len(commands)
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(CLIENT_TIMEOUT)
+            connection.connect(socket_path)
+            connection.sendall(json.dumps({'commands': list(commands)}).encode() + b'\n')
+            with connection.makefile('rb') as response:
+                outputs = json.loads(response.readline())['outputs']
+
+    except (OSError, ValueError, KeyError, TypeError):
+        return [None] * len(commands)
+
+    if not isinstance(outputs, list) or len(outputs) != len(commands):
+        return [None] * len(commands)
+
+    return [output if isinstance(output, str) else None for output in outputs]
+
+
+def query_snapshot(command: str, socket_path: Optional[str] = None) -> Optional[str]:
+    """Fetch the output of a single command from the broker.
+
+    Args:
+        command: The command to fetch output for.
+        socket_path: The broker socket. Defaults to the configured path.
+
+    Returns:
+        The command output, or None if the broker could not serve the command.
+    """
+
+    return query_snapshots([command], socket_path)[0]
+
+
+class SnapshotBroker:
+    """Poll Slurm queries on a fixed interval and cache their latest output."""
+
+    def __init__(
+        self,
+        interval: float = 30,
+        max_commands: int = 128,
+        expire_intervals: int = 10,
+        stale_intervals: int = 3,
+        max_new_commands: int = 16
+    ) -> None:
+        """Create a broker.
+
+        Args:
+            interval: Seconds between refreshes of each tracked command.
+            max_commands: The maximum number of distinct commands to track.
+            expire_intervals: Stop polling commands not requested for this many intervals.
+            stale_intervals: Stop serving output not refreshed for this many intervals.
+            max_new_commands: The maximum number of untracked commands a single request may add.
+        """
+
+        import threading
+
+        self.interval = interval
+        self.max_commands = max_commands
+        self.expire_intervals = expire_intervals
+        self.stale_intervals = stale_intervals
+        self.max_new_commands = max_new_commands
+        self.snapshots: dict[str, dict] = {}  # Command -> {'output', 'updated', 'requested'}
+        self._lock = threading.Lock()
+
+    def get(self, command: str) -> Optional[str]:
+        """Return the latest output of a command, running it if it is not yet tracked.
+
+        Args:
+            command: The command to return output for.
+
+        Returns:
+            The command output, or None if the command is not allowed, fails,
+            or has not been refreshed successfully for `stale_intervals` intervals.
+        """
+
+        if not is_allowed(command):
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            snapshot = self.snapshots.get(command)
+            if snapshot is not None:
+                snapshot['requested'] = now
+                if now - snapshot['updated'] > self.interval * self.stale_intervals:
+                    return None
+
+                return snapshot['output']
+
+            if len(self.snapshots) >= self.max_commands:
+                return None
+
+        output = self._run(command)
+        if output is None:
+            return None
+
+        with self._lock:
+            self.snapshots[command] = {'output': output, 'updated': time.monotonic(), 'requested': now}
+
+        return output
+
+    def get_many(self, commands: Sequence[str]) -> list[Optional[str]]:
+        """Return the latest output of multiple commands.
+
+        At most `max_new_commands` commands that are not yet tracked are run,
+        so a single request cannot fill the broker with new commands.
+
+        Args:
+            commands: The commands to return output for.
+
+        Returns:
+            The output of each command, with None for commands that could not be served.
+        """
+
+        outputs, new_commands = [], 0
+        for command in commands:
+            if not isinstance(command, str):
+                outputs.append(None)
+                continue
+
+            with self._lock:
+                is_new = command not in self.snapshots
+
+            if is_new:
+                if new_commands >= self.max_new_commands:
+                    outputs.append(None)
+                    continue
+
+                new_commands += 1
+
+            outputs.append(self.get(command))
+
+        return outputs
+
+    @staticmethod
+    def _run(command: str) -> Optional[str]:
+        """Run a command against Slurm, returning None on failure."""
+
+        from .system_info import Shell
+
+        try:
+            return Shell.run_command(command)
+
+        except Exception:
+            return None
+
+    def refresh(self, max_concurrency: int = 8) -> None:
+        """Re-run every tracked command and drop commands that are no longer requested.
+
+        Commands are refreshed independently, so a command that fails or
+        times out keeps its previous output (until it becomes stale) without
+        affecting the others.
+
+        Args:
+            max_concurrency: Maximum number of commands to run at once.
+        """
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        cutoff = time.monotonic() - self.interval * self.expire_intervals
+        with self._lock:
+            for command in [command for command, snapshot in self.snapshots.items() if snapshot['requested'] < cutoff]:
+                del self.snapshots[command]
+
+            commands = list(self.snapshots)
+
+        if not commands:
+            return
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for command, output in zip(commands, executor.map(self._run, commands)):
+                if output is None:
+                    continue
+
+                with self._lock:
+                    if command in self.snapshots:
+                        self.snapshots[command].update(output=output, updated=time.monotonic())
+
+    def serve(self, socket_path: str, stop_event: Optional[Event] = None) -> None:
+        """Serve snapshots over a Unix domain socket until stopped.
+
+        Args:
+            socket_path: The socket path to listen on. An existing file at this path is replaced.
+            stop_event: An optional `threading.Event` used to stop the broker.
+        """
+
+        import socketserver
+        import threading
+
+        broker = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            """Answer a single JSON request with the requested snapshots."""
+
+            def handle(self) -> None:
+                """Read a request of the form `{"commands": [...]}` and write the matching outputs."""
+
+                try:
+                    request = json.loads(self.rfile.readline())
+                    outputs = broker.get_many(request['commands'])
+
+                except (ValueError, KeyError, TypeError):
+                    outputs = None
+
+                self.wfile.write(json.dumps({'outputs': outputs}).encode() + b'\n')
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+        stop_event = stop_event or threading.Event()
+        server = socketserver.ThreadingUnixStreamServer(socket_path, RequestHandler)
+        server.daemon_threads = True
+        os.chmod(socket_path, 0o666)
+
+        def poll() -> None:
+            while not stop_event.wait(self.interval):
+                self.refresh()
+
+        poller = threading.Thread(target=poll, daemon=True)
+        poller.start()
+        server_thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+        server_thread.start()
+
+        try:
+            stop_event.wait()
+
+        finally:
+            server.shutdown()
+            server.server_close()
+            poller.join()
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+
+def main() -> int:
+    """Run the snapshot broker from the command line."""
+
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(description='Serve shared snapshots of Slurm queries over a Unix socket.')
+    parser.add_argument('--socket', default=os.environ.get(SOCKET_ENV, DEFAULT_SOCKET), help='the socket path to listen on')
+    parser.add_argument('--interval', type=float, default=30, help='seconds between Slurm queries')
+    parser.add_argument('--max-commands', type=int, default=128, help='maximum number of distinct queries to track')
+    args = parser.parse_args()
+
+    if args.interval <= 0 or args.max_commands < 1:
+        parser.error('The interval and maximum number of commands must be positive.')
+
+    try:
+        SnapshotBroker(interval=args.interval, max_commands=args.max_commands).serve(args.socket)
+
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Persistent, file based caching for slowly changing system information.
+
+The `cache` module provides a small key/value store used to avoid repeatedly
+querying external services for information that rarely changes, such as the
+cluster and partition layout reported by Slurm. Cache entries are written
+atomically so concurrent readers never observe partially written files.
+
+The cache location and entry lifetime are configured using the following
+environment variables:
+
+- `CRC_WRAPPERS_CACHE_DIR`: The cache directory. Point this at a shared,
+  world-readable location to maintain a single system-wide cache.
+- `CRC_WRAPPERS_CACHE_TTL`: The entry lifetime in seconds. Set to `0` to
+  disable caching entirely.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+CACHE_DIR_ENV = 'CRC_WRAPPERS_CACHE_DIR'
+CACHE_TTL_ENV = 'CRC_WRAPPERS_CACHE_TTL'
+
+
+def atomic_write(path: Union[str, Path], data: str, mode: int = 0o644) -> None:
+    """Write data to a file so that readers only ever see the old or new contents.
+
+    Data is written to a temporary file in the destination directory and
+    then renamed over the destination path.
+
+    Args:
+        path: The destination file path.
+        data: The text to write.
+        mode: The permissions to apply to the written file.
+    """
+
+    import tempfile
+
+    path = Path(path)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+
+    try:
+        os.fchmod(file_descriptor, mode)
+        with os.fdopen(file_descriptor, 'w') as temp_file:
+            temp_file.write(data)
+
+        os.replace(temp_path, path)
+
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+class FileCache:
+    """A persistent key/value cache with time based expiration.
+
+    Each entry is stored as a separate JSON file named after a hash of the
+    entry key. Errors encountered while reading or writing the cache are
+    treated as cache misses so a broken cache never prevents an application
+    from running.
+    """
+
+    default_ttl = 24 * 60 * 60  # Default entry lifetime in seconds
+
+    def __init__(self, directory: Union[str, Path], ttl: float = default_ttl) -> None:
+        """Create a new cache backed by the given directory.
+
+        Args:
+            directory: The directory used to store cache entries.
+            ttl: The lifetime of cache entries in seconds.
+        """
+
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    @classmethod
+    def from_environment(cls) -> 'FileCache':
+        """Return a cache instance configured from environment variables.
+
+        Defaults to a per-user cache directory under `$XDG_CACHE_HOME`
+        (or `~/.cache`) and the default entry lifetime.
+
+        Returns:
+            A configured `FileCache` instance.
+        """
+
+        directory = os.environ.get(CACHE_DIR_ENV)
+        if not directory:
+            xdg_cache = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+            directory = Path(xdg_cache) / 'crc-wrappers'
+
+        try:
+            ttl = float(os.environ.get(CACHE_TTL_ENV, cls.default_ttl))
+
+        except ValueError:
+            ttl = cls.default_ttl
+
+        return cls(directory, ttl)
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether caching is enabled."""
+
+        return self.ttl > 0
+
+    def _path_for_key(self, key: str) -> Path:
+        """Return the file path used to store a given key."""
+
+        import hashlib
+
+        return self.directory / (hashlib.sha256(key.encode()).hexdigest() + '.json')
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for a key.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if the entry is missing, expired, or unreadable.
+        """
+
+        if not self.enabled:
+            return None
+
+        try:
+            with open(self._path_for_key(key)) as cache_file:
+                entry = json.load(cache_file)
+
+        except (OSError, ValueError):
+            return None
+
+        # Guard against hash collisions and malformed entries
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+
+        if time.time() - entry.get('created', 0) > self.ttl:
+            return None
+
+        return entry.get('value')
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value in the cache.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+        """
+
+        if not self.enabled:
+            return
+
+        entry = json.dumps({'key': key, 'created': time.time(), 'value': value})
+
+        try:
+            self.directory.mkdir(mode=0o755, parents=True, exist_ok=True)
+            atomic_write(self._path_for_key(key), entry)
+
+        except OSError:
+            pass  # Caching is best effort
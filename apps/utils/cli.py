@@ -3,11 +3,47 @@
 import abc
 import os
 import sys
-from argparse import ArgumentParser, HelpFormatter, Namespace
+import time
+from argparse import Action, ArgumentParser, HelpFormatter, Namespace, SUPPRESS
 from textwrap import dedent
+from pathlib import Path
 from typing import List, Optional
 
-from .. import __version__
+from . import profiling, telemetry
+
+
+class LazyVersionAction(Action):
+    """Argument action that prints the package version and exits.
+
+    Behaves like the builtin `version` action, except the package version
+    is only resolved when the flag is actually used.
+    """
+
+    def __init__(
+        self, option_strings: List[str], dest: str = SUPPRESS, default: str = SUPPRESS, help: Optional[str] = None
+    ) -> None:
+        """Define the argument action
+
+        Args:
+            option_strings: Command line flags associated with the action
+            dest: The parsed argument name
+            default: The default argument value
+            help: The argument help text
+        """
+
+        if help is None:
+            help = "show program's version number and exit"
+
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser: ArgumentParser, namespace: Namespace, values, option_string: str = None) -> None:
+        """Print the application version and exit"""
+
+        from .. import __version__
+
+        program_name = os.path.splitext(parser.prog)[0]
+        print(f'{program_name} version {__version__}')
+        parser.exit()
 
 
 class BaseParser(ArgumentParser, metaclass=abc.ABCMeta):
@@ -33,9 +69,13 @@ class BaseParser(ArgumentParser, metaclass=abc.ABCMeta):
         self.description = '\n'.join(dedent(paragraph) for paragraph in self.__doc__.split('\n'))
 
         # Set the application version to match the package version
-        program_name = os.path.splitext(self.prog)[0]
-        version_string = '{} version {}'.format(program_name, __version__)
-        self.add_argument('-v', '--version', action='version', version=version_string)
+        self.add_argument('-v', '--version', action=LazyVersionAction)
+
+        # Diagnostic options for timing slow applications (see the `profiling` module)
+        self.add_argument('--profile', action='store_true', help='print a timing summary to stderr on exit')
+        self.add_argument(
+            '--profile-output', metavar='FILE',
+            help='write profiling results to FILE (.json for a Chrome trace, .prof for cProfile stats)')
 
     @abc.abstractmethod
     def app_logic(self, args: Namespace) -> None:
@@ -77,10 +117,18 @@ class BaseParser(ArgumentParser, metaclass=abc.ABCMeta):
             args: Optionally parse the given arguments instead of reading STDIN
         """
 
+        start = time.perf_counter()
         app = cls()
         args = app.parse_args(args)
+        parsed = time.perf_counter()
         app.print_help_if_no_args()
 
+        output = profiling.get_output_setting(args.profile_output or ('-' if args.profile else None))
+        spool_path = telemetry.get_spool_path()
+        if output is not None or spool_path is not None:
+            app.run_instrumented(args, start, parsed, output, spool_path)
+            return
+
         try:
             app.app_logic(args)
 
@@ -91,3 +139,62 @@ class BaseParser(ArgumentParser, metaclass=abc.ABCMeta):
         # Route errors to the CLI parser's error handler
         except Exception as excep:  # pragma: no cover
             app.error(str(excep))
+
+    def run_instrumented(
+        self,
+        args: Namespace,
+        start: float,
+        parsed: float,
+        profile_output: Optional[str] = None,
+        spool_path: Optional[Path] = None
+    ) -> None:
+        """Execute the application logic while recording profiling and telemetry data
+
+        Args:
+            args: Parsed command line arguments
+            start: The `time.perf_counter` value before the parser was created
+            parsed: The `time.perf_counter` value after arguments were parsed
+            profile_output: Where to write profiling results (see `profiling.write_output`)
+            spool_path: The telemetry spool file to append a usage record to
+        """
+
+        profiler = profiling.Profiler(origin=start)
+        profiler.add_span('parse_args', 'cli', start, parsed)
+        profiling.set_profiler(profiler)
+
+        stats = None
+        if profile_output and profile_output.endswith(('.prof', '.pstats')):
+            import cProfile
+
+            stats = cProfile.Profile()
+
+        status = 0
+        try:
+            with profiler.span('app_logic', 'cli'):
+                if stats is None:
+                    self.app_logic(args)
+
+                else:
+                    stats.runcall(self.app_logic, args)
+
+        except KeyboardInterrupt:  # pragma: no cover
+            status = 130
+            exit('User interrupt detected - exiting...')
+
+        except SystemExit as excep:
+            status = excep.code if isinstance(excep.code, int) else int(excep.code is not None)
+            raise
+
+        except Exception as excep:
+            status = 1
+            self.error(str(excep))
+
+        finally:
+            profiling.set_profiler(None)
+            if profile_output:
+                profiling.write_output(profiler, profile_output, stats)
+
+            if spool_path:
+                duration = time.perf_counter() - start
+                record = telemetry.build_record(os.path.splitext(self.prog)[0], duration, profiler, status)
+                telemetry.append_record(spool_path, record)
@@ -5,10 +5,25 @@ to authenticate with Keystone, retrieve allocation requests, and summarize
 service unit totals per cluster.
 """
 
+from __future__ import annotations
+
+import json
+import os
+import time
 from datetime import date
-from typing import Any
+from getpass import getpass
+from pathlib import Path
+from typing import Any, Collection, Iterable, Iterator, Optional, TYPE_CHECKING, Union
+
+from . import profiling
+from .backends import get_backend
+from .cache import atomic_write
 
-from keystone_client import KeystoneClient
+# The Keystone client is imported at runtime only when a session is created
+if TYPE_CHECKING:  # pragma: no cover
+    from http.cookiejar import CookieJar
+
+    from keystone_client import KeystoneClient
 
 # Default API configuration
 KEYSTONE_URL = "https://api.keystone.crcd.pitt.edu"
@@ -16,18 +31,391 @@ KEYSTONE_AUTH_ENDPOINT = 'authentication/new/'
 RAWUSAGE_RESET_DATE = date.fromisoformat('2024-05-07')
 
 
-def authenticate_keystone_session(username: str, password: str) -> KeystoneClient:
-    """Create and return an authenticated Keystone client session.
+class SessionCache:
+    """Persist authenticated Keystone sessions across application runs.
+
+    Session credentials (the cookies issued by Keystone on login) are stored
+    in a file readable only by the current user, under `$XDG_RUNTIME_DIR`
+    when available or the user's cache directory otherwise. Cached sessions
+    are discarded once expired or rejected by the server.
+
+    Caching is disabled unless the `CRC_WRAPPERS_KEYSTONE_SESSION_CACHE`
+    environment variable is set to a truthy value.
+    """
+
+    enable_env = 'CRC_WRAPPERS_KEYSTONE_SESSION_CACHE'
+    default_lifetime = 8 * 60 * 60  # Lifetime in seconds for credentials without an explicit expiration
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Create a new session cache backed by the given file.
+
+        Args:
+            path: The file used to store session credentials.
+        """
+
+        self.path = Path(path)
+
+    @classmethod
+    def from_environment(cls) -> Optional[SessionCache]:
+        """Return a session cache if caching is enabled in the environment.
+
+        Returns:
+            A `SessionCache` instance, or None if caching is disabled.
+        """
+
+        if os.environ.get(cls.enable_env, '').lower() not in ('1', 'true', 'yes'):
+            return None
+
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+        base_dir = Path(runtime_dir) if runtime_dir else Path.home() / '.cache'
+        return cls(base_dir / 'crc-wrappers' / 'keystone-session.json')
+
+    @staticmethod
+    def _get_cookie_jar(session: KeystoneClient) -> Optional[CookieJar]:
+        """Return the cookie jar used by the client's underlying HTTP transport.
+
+        `KeystoneClient` does not expose its cookies publicly. Clients from
+        keystone-api-client 0.10.x (the version pinned in `pyproject.toml`)
+        keep an `httpx.Client` on the `_client` attribute, whose public
+        `cookies.jar` holds the session credentials. This is the only place
+        the client's internals are accessed, and caching is skipped if the
+        layout changes.
+
+        Args:
+            session: A Keystone client session.
+
+        Returns:
+            The session cookie jar, or None if it cannot be determined.
+        """
+
+        cookies = getattr(getattr(session, '_client', None), 'cookies', None)
+        return getattr(cookies, 'jar', cookies)
+
+    def load(self, session: KeystoneClient, username: str) -> bool:
+        """Restore cached credentials for the given user into a client session.
+
+        Args:
+            session: The Keystone client session to restore credentials into.
+            username: The user the credentials must belong to.
+
+        Returns:
+            Whether valid credentials were restored.
+        """
+
+        from http.cookiejar import Cookie
+
+        jar = self._get_cookie_jar(session)
+        if jar is None:
+            return False
+
+        try:
+            with open(self.path) as cache_file:
+                entry = json.load(cache_file)
+
+        except (OSError, ValueError):
+            return False
+
+        if entry.get('username') != username or entry.get('expires', 0) <= time.time():
+            return False
+
+        for cookie in entry.get('cookies', []):
+            jar.set_cookie(Cookie(
+                version=0, name=cookie['name'], value=cookie['value'], port=None, port_specified=False,
+                domain=cookie['domain'], domain_specified=bool(cookie['domain']),
+                domain_initial_dot=cookie['domain'].startswith('.'), path=cookie['path'], path_specified=True,
+                secure=cookie['secure'], expires=cookie['expires'], discard=False, comment=None,
+                comment_url=None, rest={}))
+
+        return True
+
+    def save(self, session: KeystoneClient, username: str) -> None:
+        """Write the credentials of an authenticated session to the cache.
+
+        Args:
+            session: An authenticated Keystone client session.
+            username: The user the credentials belong to.
+        """
+
+        jar = self._get_cookie_jar(session)
+        if jar is None:
+            return
+
+        cookies = [
+            {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain,
+                'path': cookie.path,
+                'secure': cookie.secure,
+                'expires': cookie.expires,
+            } for cookie in jar
+        ]
+
+        # Expire the cache alongside the earliest expiring credential
+        expirations = [cookie['expires'] for cookie in cookies if cookie['expires']]
+        expires = min(expirations, default=time.time() + self.default_lifetime)
+        entry = json.dumps({'username': username, 'expires': expires, 'cookies': cookies})
+
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            atomic_write(self.path, entry, mode=0o600)
+
+        except OSError:
+            pass  # Caching is best effort
+
+    def clear(self) -> None:
+        """Remove any cached credentials."""
+
+        self.path.unlink(missing_ok=True)
+
+
+class ResponseCache:
+    """A size bounded, persistent cache of Keystone API responses.
+
+    Responses are keyed on the requested endpoint and query parameters.
+    Entries younger than the cache TTL are served without contacting the
+    API. Stale entries are revalidated using the response `ETag` when the
+    server provides one, and the least recently used entries are evicted
+    once the cache exceeds its maximum size.
+
+    The entry lifetime is configured using the `CRC_WRAPPERS_KEYSTONE_CACHE_TTL`
+    environment variable (in seconds). Set the variable to `0` to disable caching.
+    """
+
+    ttl_env = 'CRC_WRAPPERS_KEYSTONE_CACHE_TTL'
+    default_ttl = 60 * 60  # Default entry lifetime in seconds
+    default_max_entries = 256  # Default maximum number of cached responses
+
+    def __init__(self, path: Union[str, Path], ttl: float = default_ttl, max_entries: int = default_max_entries) -> None:
+        """Create a new response cache backed by the given file.
+
+        Args:
+            path: The file used to store cached responses.
+            ttl: The lifetime of cache entries in seconds.
+            max_entries: The maximum number of responses to retain.
+        """
+
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Optional[dict[str, dict]] = None
+
+    @classmethod
+    def from_environment(cls) -> Optional[ResponseCache]:
+        """Return a response cache configured from environment variables.
+
+        Returns:
+            A `ResponseCache` instance, or None if caching is disabled or an
+            alternative backend is installed (see the `backends` module).
+        """
+
+        # Responses served by a backend must not leak into the shared cache, or vice versa
+        if get_backend() is not None:
+            return None
+
+        try:
+            ttl = float(os.environ.get(cls.ttl_env, cls.default_ttl))
+
+        except ValueError:
+            ttl = cls.default_ttl
+
+        if ttl <= 0:
+            return None
+
+        xdg_cache = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        return cls(Path(xdg_cache) / 'crc-wrappers' / 'keystone-responses.json', ttl)
+
+    @staticmethod
+    def build_key(endpoint: str, params: dict) -> str:
+        """Return the cache key for a request.
+
+        Args:
+            endpoint: The API endpoint being queried.
+            params: Query parameters included in the request.
+
+        Returns:
+            A string uniquely identifying the request.
+        """
+
+        return endpoint + '?' + json.dumps(params, sort_keys=True, default=str)
+
+    @property
+    def entries(self) -> dict[str, dict]:
+        """Cached entries ordered from least to most recently used, loaded from disk on first access."""
+
+        if self._entries is None:
+            try:
+                with open(self.path) as cache_file:
+                    self._entries = dict(json.load(cache_file))
+
+            except (OSError, ValueError, TypeError):
+                self._entries = {}
+
+        return self._entries
+
+    def _save(self) -> None:
+        """Write cached entries to disk, evicting the least recently used entries as necessary."""
+
+        while len(self.entries) > self.max_entries:
+            del self.entries[next(iter(self.entries))]
+
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            atomic_write(self.path, json.dumps(self.entries), mode=0o600)
+
+        except OSError:
+            pass  # Caching is best effort
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached entry for a key and mark it as recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            A dictionary with the cached `results`, response `etag`, and
+            `created` timestamp, or None if the key is not cached.
+        """
+
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.entries[key] = entry
+
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        """Return whether a cache entry can be used without revalidation.
+
+        Args:
+            entry: A cache entry returned by `get`.
+        """
+
+        return time.time() - entry.get('created', 0) <= self.ttl
+
+    def set(self, key: str, results: list[dict], etag: Optional[str] = None) -> None:
+        """Store a response in the cache.
+
+        Args:
+            key: The cache key.
+            results: The parsed response results.
+            etag: The response `ETag` header, if any.
+        """
+
+        self.entries.pop(key, None)
+        self.entries[key] = {'created': time.time(), 'etag': etag, 'results': results}
+        self._save()
+
+
+class KeystoneSession:
+    """An authenticated Keystone client with connection reuse and request accounting.
+
+    Wraps a `KeystoneClient` so that all API calls made by an application
+    reuse the keep-alive connections of a single client. Team IDs are memoized
+    for the lifetime of the session, and the number and duration of HTTP
+    requests are recorded. Attributes not defined here are forwarded to
+    the wrapped client.
+    """
+
+    def __init__(
+        self, client: KeystoneClient, username: Optional[str] = None, session_cache: Optional[SessionCache] = None
+    ) -> None:
+        """Wrap an existing Keystone client.
+
+        Args:
+            client: The Keystone client to wrap.
+            username: The user the client is authenticated as.
+            session_cache: The cache the client's credentials were restored from, if any.
+        """
+
+        from threading import Lock
+
+        self.client = client
+        self.username = username
+        self.session_cache = session_cache
+        self.team_ids: dict[str, int] = {}
+        self.request_count = 0
+        self.request_seconds = 0.0
+        self.max_request_seconds = 0.0
+        self._lock = Lock()
+        self._auth_lock = Lock()
+        self._credentials_refreshed = False
+
+    def refresh_credentials(self) -> bool:
+        """Replace cached credentials rejected by the server by logging in again.
+
+        The user is prompted for their password. Credentials are refreshed at
+        most once per session, and only if they were restored from the
+        session cache.
+
+        Returns:
+            Whether the session now holds freshly issued credentials.
+
+        Raises:
+            ValueError: If logging in again fails.
+        """
+
+        with self._auth_lock:
+            if self._credentials_refreshed:
+                return True
+
+            if self.session_cache is None or self.username is None:
+                return False
+
+            self.session_cache.clear()
+            _login(self.client, self.username)
+            self.session_cache.save(self.client, self.username)
+            self._credentials_refreshed = True
+            return True
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward attribute lookups to the wrapped client."""
+
+        return getattr(self.client, name)
+
+    def http_get(self, endpoint: str, params: Optional[dict] = None, **kwargs) -> Any:
+        """Issue a GET request using the wrapped client and record its duration.
+
+        Args:
+            endpoint: The API endpoint to query.
+            params: Query parameters to include in the request.
+            **kwargs: Additional arguments forwarded to the wrapped client.
+
+        Returns:
+            The HTTP response object.
+        """
+
+        start = time.perf_counter()
+        try:
+            with profiling.span(endpoint, 'keystone', params=params) as span:
+                response = self.client.http_get(endpoint, params=params, **kwargs)
+                if span is not None:
+                    span.metadata['status'] = response.status_code
+                    span.metadata['bytes'] = len(getattr(response, 'content', b''))
+
+                return response
+
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.request_count += 1
+                self.request_seconds += elapsed
+                self.max_request_seconds = max(self.max_request_seconds, elapsed)
+
+
+def _login(session: KeystoneClient, username: str, password: Optional[str] = None) -> None:
+    """Log a client session in, prompting for a password if one is not provided.
 
     Args:
+        session: The Keystone client session to authenticate.
         username: The username to authenticate with.
         password: The password to authenticate with.
 
-    Returns:
-        An authenticated Keystone client session.
+    Raises:
+        ValueError: If authentication fails.
     """
 
-    session = KeystoneClient(base_url=KEYSTONE_URL)
+    if password is None:
+        password = getpass('Please enter your CRCD login password:\n')
 
     try:
         session.login(username=username, password=password)
@@ -38,54 +426,273 @@ def authenticate_keystone_session(username: str, password: str) -> KeystoneClien
             'Please check your username and password and try again.'
         )
 
-    return session
 
+def authenticate_keystone_session(username: str, password: Optional[str] = None) -> KeystoneSession:
+    """Create and return an authenticated Keystone client session.
+
+    If session caching is enabled and valid cached credentials exist, they
+    are reused instead of logging in again. Cached credentials rejected by
+    the server are transparently replaced during the first failing request
+    (see `KeystoneSession.refresh_credentials`). Otherwise, the user is
+    prompted for a password if one is not provided. No credentials are
+    required if an alternative backend is installed (see the `backends` module).
+
+    Args:
+        username: The username to authenticate with.
+        password: The password to authenticate with.
+
+    Returns:
+        An authenticated Keystone client session.
+    """
+
+    backend = get_backend()
+    if backend is not None:
+        return KeystoneSession(backend.create_keystone_client())
+
+    from keystone_client import KeystoneClient
+
+    session = KeystoneClient(base_url=KEYSTONE_URL)
+    session_cache = SessionCache.from_environment()
+    if session_cache and session_cache.load(session, username):
+        return KeystoneSession(session, username, session_cache)
+
+    _login(session, username, password)
+    if session_cache:
+        session_cache.save(session, username)
+
+    return KeystoneSession(session, username)
+
+
+def _http_get(session: KeystoneClient, endpoint: str, params: dict, headers: Optional[dict] = None) -> Any:
+    """Issue a GET request, refreshing cached credentials if they are rejected by the server.
+
+    If a `KeystoneSession` restored from the session cache is rejected, the
+    user logs in again and the request is retried once. Otherwise, rejected
+    credentials loaded from the session cache are discarded so the next run
+    logs in again. The session cache is never touched for responses served
+    by an alternative backend.
+
+    Args:
+        session: An authenticated Keystone client session.
+        endpoint: The API endpoint to query.
+        params: Query parameters to include in the request.
+        headers: Optional request headers.
+
+    Returns:
+        The HTTP response object.
+    """
+
+    def send() -> Any:
+        if headers:
+            try:
+                return session.http_get(endpoint, params=params, headers=headers)
+
+            # Fall back to a plain request for clients that do not support custom headers
+            except TypeError:
+                pass
+
+        return session.http_get(endpoint, params=params)
+
+    response = send()
+    if response.status_code not in (401, 403):
+        return response
+
+    if not isinstance(session, KeystoneSession) or get_backend() is not None:
+        return response
+
+    if session.refresh_credentials():
+        return send()
+
+    # Discard cached credentials rejected by the server so the next run logs in again
+    if session.session_cache is not None:
+        session.session_cache.clear()
+
+    return response
+
+
+def _fetch_page(session: KeystoneClient, endpoint: str, params: dict) -> dict:
+    """Fetch and parse a single page of API results.
+
+    Args:
+        session: An authenticated Keystone client session.
+        endpoint: The API endpoint to query.
+        params: Query parameters to include in the request.
+
+    Returns:
+        The parsed JSON response.
+    """
+
+    response = _http_get(session, endpoint, params)
+    response.raise_for_status()
+    return response.json()
+
+
+def _parse_next_link(url: Optional[str], base_url: str = KEYSTONE_URL) -> Optional[tuple[str, dict]]:
+    """Split a pagination link into an API endpoint and query parameters.
+
+    The link is resolved against the base URL of the API, and the returned
+    endpoint is relative to it, so any path prefix in the base URL is kept.
+
+    Args:
+        url: The `next` link from a paginated API response.
+        base_url: The base URL the client sends requests to.
+
+    Returns:
+        A tuple with the endpoint and query parameters, or None if there is no next page.
+    """
+
+    if not url:
+        return None
+
+    from urllib.parse import parse_qsl, urljoin, urlsplit
+
+    parts = urlsplit(urljoin(base_url.rstrip('/') + '/', url))
+    path = parts.path
+    prefix = urlsplit(base_url).path.rstrip('/')
+    if prefix and path.startswith(prefix + '/'):
+        path = path[len(prefix):]
+
+    return path, dict(parse_qsl(parts.query))
+
+
+def _iter_page_results(session: KeystoneClient, page: dict, prefetch: bool = False) -> Iterator[dict]:
+    """Yield records from a page of API results and all pages following it.
+
+    Args:
+        session: An authenticated Keystone client session.
+        page: A parsed API response.
+        prefetch: Whether to fetch the next page in the background while
+            records from the current page are being consumed.
+
+    Yields:
+        Individual records from the `results` list of each page.
+    """
+
+    # Single page responses have nothing to fetch in the background
+    executor = None
+    if prefetch and page.get('next'):
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=1)
+
+    try:
+        while True:
+            next_page = _parse_next_link(page.get('next'))
+            future = executor.submit(_fetch_page, session, *next_page) if executor and next_page else None
+
+            yield from page['results']
+
+            if next_page is None:
+                return
+
+            page = future.result() if future else _fetch_page(session, *next_page)
+
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_results(session: KeystoneClient, endpoint: str, params: dict, prefetch: bool = False) -> Iterator[dict]:
+    """Yield every record returned by an API endpoint, following pagination links.
+
+    Records are yielded as each page arrives, so callers can process large
+    result sets incrementally.
+
+    Args:
+        session: An authenticated Keystone client session.
+        endpoint: The API endpoint to query.
+        params: Query parameters to include in the request.
+        prefetch: Whether to fetch the next page in the background while
+            records from the current page are being consumed.
+
+    Yields:
+        Individual records from the endpoint's paginated `results`.
+    """
+
+    yield from _iter_page_results(session, _fetch_page(session, endpoint, params), prefetch)
 
-def _get_results(session: KeystoneClient, endpoint: str, params: dict) -> list[dict]:
+
+def _get_results(
+    session: KeystoneClient, endpoint: str, params: dict, cache: Optional[ResponseCache] = None
+) -> list[dict]:
     """Issue a GET request against the given endpoint and return the parsed results list.
 
+    Results from all pages are combined into a single list.
+
     Args:
         session: An authenticated Keystone client session.
         endpoint: The API endpoint to query.
         params: Query parameters to include in the request.
+        cache: Optionally serve and store results using the given response cache.
 
     Returns:
-        The `results` list from the endpoint's JSON response.
+        The combined `results` list from the endpoint's JSON responses.
     """
 
-    request = session.http_get(endpoint, params=params)
+    if cache is None:
+        return list(iter_results(session, endpoint, params, prefetch=True))
+
+    key = cache.build_key(endpoint, params)
+    entry = cache.get(key)
+    if entry is not None and cache.is_fresh(entry):
+        return entry['results']
+
+    # Ask the server to confirm whether a stale entry is still valid
+    headers = {'If-None-Match': entry['etag']} if entry and entry.get('etag') else None
+    request = _http_get(session, endpoint, params, headers=headers)
+    if request.status_code == 304 and entry is not None:
+        cache.set(key, entry['results'], entry['etag'])
+        return entry['results']
+
     request.raise_for_status()
-    return request.json()['results']
+    page = request.json()
+    results = list(_iter_page_results(session, page, prefetch=True))
+
+    # The ETag only covers the first page, so multi-page results are refetched instead of revalidated
+    etag = None if page.get('next') else request.headers.get('ETag')
+    cache.set(key, results, etag)
+    return results
 
 
-def get_team_id(session: KeystoneClient, account_name: str) -> int:
+def get_team_id(session: KeystoneClient, account_name: str, cache: Optional[ResponseCache] = None) -> int:
     """Return the account ID associated with a given account name.
 
     Args:
         session: An authenticated Keystone client session.
         account_name: The name of the account to query.
+        cache: Optionally serve and store results using the given response cache.
 
     Returns:
         The unique ID value for the given account.
     """
 
-    results = _get_results(session, '/users/teams/', params={'name': account_name})
-    return results[0]['id']
+    if isinstance(session, KeystoneSession) and account_name in session.team_ids:
+        return session.team_ids[account_name]
+
+    results = _get_results(session, '/users/teams/', params={'name': account_name}, cache=cache)
+    team_id = results[0]['id']
+
+    if isinstance(session, KeystoneSession):
+        session.team_ids[account_name] = team_id
 
+    return team_id
 
-def get_active_requests(session: KeystoneClient, account_name: str) -> list[dict]:
+
+def get_active_requests(
+    session: KeystoneClient, account_name: str, cache: Optional[ResponseCache] = None
+) -> list[dict]:
     """Return all active allocation requests for a given Slurm account.
 
     Args:
         session: An authenticated Keystone client session.
         account_name: The name of the Slurm account to query.
+        cache: Optionally serve and store results using the given response cache.
 
     Returns:
         A list of active allocation request records.
     """
 
     today = date.today().isoformat()
-    team_id = get_team_id(session, account_name)
+    team_id = get_team_id(session, account_name, cache)
 
     return _get_results(
         session,
@@ -95,22 +702,26 @@ def get_active_requests(session: KeystoneClient, account_name: str) -> list[dict
             'status': 'AP',
             'active__lte': today,
             'expire__gt': today,
-        })
+        },
+        cache=cache)
 
 
-def get_most_recent_expired_request(session: KeystoneClient, account_name: str) -> dict:
+def get_most_recent_expired_request(
+    session: KeystoneClient, account_name: str, cache: Optional[ResponseCache] = None
+) -> dict:
     """Return the single most recently expired allocation request for a given account.
 
     Args:
         session: An authenticated Keystone client session.
         account_name: The name of the Slurm account to query.
+        cache: Optionally serve and store results using the given response cache.
 
     Returns:
         The most recently expired allocation request record.
     """
 
     today = date.today().isoformat()
-    team_id = get_team_id(session, account_name)
+    team_id = get_team_id(session, account_name, cache)
 
     results = _get_results(
         session,
@@ -120,19 +731,134 @@ def get_most_recent_expired_request(session: KeystoneClient, account_name: str)
             'status': 'AP',
             'expire__lte': today,
             'order': '-expire',
-        })
+        },
+        cache=cache)
 
     return results[0]
 
 
-def get_earliest_startdate(alloc_requests: list[dict]) -> date:
+def get_team_ids(
+    session: KeystoneClient, account_names: Collection[str], cache: Optional[ResponseCache] = None
+) -> dict[str, int]:
+    """Return the account IDs associated with multiple account names using a single query.
+
+    Args:
+        session: An authenticated Keystone client session.
+        account_names: The names of the accounts to query.
+        cache: Optionally serve and store results using the given response cache.
+
+    Returns:
+        A dictionary mapping account names to their unique ID values.
+        Accounts not found in Keystone are omitted.
+    """
+
+    known_ids = session.team_ids if isinstance(session, KeystoneSession) else {}
+    team_ids = {name: known_ids[name] for name in account_names if name in known_ids}
+
+    missing_names = [name for name in account_names if name not in team_ids]
+    if missing_names:
+        results = _get_results(session, '/users/teams/', params={'name__in': ','.join(missing_names)}, cache=cache)
+        team_ids.update((team['name'], team['id']) for team in results)
+        known_ids.update(team_ids)
+
+    return team_ids
+
+
+def _get_requests_by_account(
+    session: KeystoneClient, account_names: Collection[str], params: dict, cache: Optional[ResponseCache] = None
+) -> dict[str, list[dict]]:
+    """Return allocation requests matching the given filters, grouped by account name.
+
+    Args:
+        session: An authenticated Keystone client session.
+        account_names: The names of the accounts to query.
+        params: Additional query parameters to include in the request.
+        cache: Optionally serve and store results using the given response cache.
+
+    Returns:
+        A dictionary mapping each account name to a list of allocation request records.
+    """
+
+    requests_by_account = {name: [] for name in account_names}
+    team_ids = get_team_ids(session, account_names, cache)
+    if not team_ids:
+        return requests_by_account
+
+    account_by_team = {team_id: name for name, team_id in team_ids.items()}
+    params = {'team__in': ','.join(map(str, account_by_team)), **params}
+    for request in _get_results(session, '/allocations/requests/', params=params, cache=cache):
+        requests_by_account[account_by_team[request['team']]].append(request)
+
+    return requests_by_account
+
+
+def get_active_requests_by_account(
+    session: KeystoneClient, account_names: Collection[str], cache: Optional[ResponseCache] = None
+) -> dict[str, list[dict]]:
+    """Return all active allocation requests for multiple Slurm accounts.
+
+    Requests are fetched for all accounts at once, requiring a constant
+    number of API calls regardless of the number of accounts.
+
+    Args:
+        session: An authenticated Keystone client session.
+        account_names: The names of the Slurm accounts to query.
+        cache: Optionally serve and store results using the given response cache.
+
+    Returns:
+        A dictionary mapping each account name to a list of active allocation request records.
+    """
+
+    today = date.today().isoformat()
+    return _get_requests_by_account(
+        session,
+        account_names,
+        params={
+            'status': 'AP',
+            'active__lte': today,
+            'expire__gt': today,
+        },
+        cache=cache)
+
+
+def get_most_recent_expired_requests_by_account(
+    session: KeystoneClient, account_names: Collection[str], cache: Optional[ResponseCache] = None
+) -> dict[str, dict]:
+    """Return the most recently expired allocation request for multiple Slurm accounts.
+
+    Args:
+        session: An authenticated Keystone client session.
+        account_names: The names of the Slurm accounts to query.
+        cache: Optionally serve and store results using the given response cache.
+
+    Returns:
+        A dictionary mapping account names to their most recently expired
+        allocation request. Accounts without expired requests are omitted.
+    """
+
+    today = date.today().isoformat()
+    requests_by_account = _get_requests_by_account(
+        session,
+        account_names,
+        params={
+            'status': 'AP',
+            'expire__lte': today,
+            'order': '-expire',
+        },
+        cache=cache)
+
+    # Results are ordered by expiration date, so the first request is the most recent
+    return {name: requests[0] for name, requests in requests_by_account.items() if requests}
+
+
+def get_earliest_startdate(alloc_requests: Iterable[dict]) -> date:
     """Return the earliest start date across a set of allocation requests.
 
     The result is clamped to the most recent raw usage reset date to ensure
     reported usage does not exceed 100% of the awarded allocation.
 
     Args:
-        alloc_requests: A list of allocation request records.
+        alloc_requests: An iterable of allocation request records.
 
     Returns:
         The earliest valid start date for usage reporting.
@@ -147,14 +873,14 @@ def get_earliest_startdate(alloc_requests: list[dict]) -> date:
     return max(earliest_date, RAWUSAGE_RESET_DATE)
 
 
-def get_per_cluster_totals(alloc_requests: list[dict], per_request: bool = False) -> dict[str, Any]:
+def get_per_cluster_totals(alloc_requests: Iterable[dict], per_request: bool = False) -> dict[str, Any]:
     """Return the total awarded service units per cluster across a set of allocation requests.
 
     When `per_request` is True, totals are nested under each request ID. Otherwise,
     totals are aggregated across all requests.
 
     Args:
-        alloc_requests: A list of allocation request records.
+        alloc_requests: An iterable of allocation request records, such as those yielded by `iter_results`.
         per_request: Whether to return totals broken out by request ID.
 
     Returns:
@@ -0,0 +1,237 @@
+"""Lightweight timing instrumentation for diagnosing slow applications.
+
+When profiling is enabled, wall-clock spans are recorded for argument
+parsing, application logic, every Slurm command, and every HTTP request.
+Recorded spans can be printed as a summary or written to disk in the Chrome
+trace event format (viewable at `chrome://tracing` or https://ui.perfetto.dev).
+Full function level profiles can also be written in the `cProfile` format.
+
+Profiling is enabled using the `--profile` (print a summary to stderr) or
+`--profile-output FILE` command line options of any application, or by
+setting the `CRC_WRAPPERS_PROFILE` environment variable to `1` (print a
+summary) or to an output file path. The output format is chosen from the
+file extension:
+
+- `.json`: Chrome trace events
+- `.prof` or `.pstats`: `cProfile` statistics
+- Anything else: A plain text summary
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, TextIO
+
+PROFILE_ENV = 'CRC_WRAPPERS_PROFILE'
+
+_active_profiler: Optional[Profiler] = None
+
+
+class Span:
+    """A single timed operation."""
+
+    def __init__(self, name: str, category: str, start: float, **metadata: Any) -> None:
+        """Create a new span.
+
+        Args:
+            name: A description of the operation (e.g., the command being run).
+            category: The type of operation (e.g., `command` or `http`).
+            start: The `time.perf_counter` value when the operation started.
+            **metadata: Additional details about the operation.
+        """
+
+        self.name = name
+        self.category = category
+        self.start = start
+        self.duration = 0.0
+        self.thread_id = threading.get_ident()
+        self.metadata = metadata
+
+
+class Profiler:
+    """Record timed spans and summarize where time is spent."""
+
+    def __init__(self, origin: Optional[float] = None) -> None:
+        """Create a profiler with no recorded spans.
+
+        Args:
+            origin: The `time.perf_counter` value used as time zero in trace output. Defaults to now.
+        """
+
+        self.origin = time.perf_counter() if origin is None else origin
+        self.spans: list[Span] = []
+
+    @contextmanager
+    def span(self, name: str, category: str, **metadata: Any) -> Iterator[Span]:
+        """Record the duration of the enclosed block.
+
+        Args:
+            name: A description of the operation.
+            category: The type of operation.
+            **metadata: Additional details about the operation.
+
+        Yields:
+            The recorded span. Metadata may be added to it within the block.
+        """
+
+        span = Span(name, category, time.perf_counter(), **metadata)
+        try:
+            yield span
+
+        finally:
+            span.duration = time.perf_counter() - span.start
+            self.spans.append(span)
+
+    def add_span(self, name: str, category: str, start: float, end: float, **metadata: Any) -> Span:
+        """Record an operation that has already finished.
+
+        Args:
+            name: A description of the operation.
+            category: The type of operation.
+            start: The `time.perf_counter` value when the operation started.
+            end: The `time.perf_counter` value when the operation finished.
+            **metadata: Additional details about the operation.
+
+        Returns:
+            The recorded span.
+        """
+
+        span = Span(name, category, start, **metadata)
+        span.duration = end - start
+        self.spans.append(span)
+        return span
+
+    def write_summary(self, stream: TextIO) -> None:
+        """Write a plain text summary of recorded spans.
+
+        Args:
+            stream: The stream to write to.
+        """
+
+        spans = sorted(self.spans, key=lambda span: span.start)
+        stream.write('\nPROFILE SUMMARY\n')
+        for category in dict.fromkeys(span.category for span in spans):
+            category_spans = [span for span in spans if span.category == category]
+            total = sum(span.duration for span in category_spans)
+            stream.write(f'{category:<12} {len(category_spans):>5} call(s) {total * 1000:>11.1f} ms total\n')
+
+        stream.write('\nSLOWEST OPERATIONS\n')
+        for span in sorted(spans, key=lambda span: span.duration, reverse=True)[:10]:
+            details = ', '.join(f'{key}={value}' for key, value in span.metadata.items())
+            stream.write(f'{span.duration * 1000:>10.1f} ms  [{span.category}] {span.name}')
+            stream.write(f' ({details})\n' if details else '\n')
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write recorded spans as Chrome trace events.
+
+        Args:
+            path: The output file path.
+        """
+
+        import json
+
+        events = [
+            {
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': (span.start - self.origin) * 1e6,
+                'dur': span.duration * 1e6,
+                'pid': os.getpid(),
+                'tid': span.thread_id,
+                'args': {key: str(value) for key, value in span.metadata.items()},
+            }
+            for span in self.spans
+        ]
+
+        with open(path, 'w') as trace_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Return the active profiler, or None if profiling is disabled."""
+
+    return _active_profiler
+
+
+def set_profiler(profiler: Optional[Profiler]) -> None:
+    """Install a profiler to receive spans from instrumented code.
+
+    Args:
+        profiler: The profiler to install, or None to disable profiling.
+    """
+
+    global _active_profiler
+    _active_profiler = profiler
+
+
+@contextmanager
+def span(name: str, category: str, **metadata: Any) -> Iterator[Optional[Span]]:
+    """Record the duration of the enclosed block if profiling is enabled.
+
+    Args:
+        name: A description of the operation.
+        category: The type of operation.
+        **metadata: Additional details about the operation.
+
+    Yields:
+        The recorded span, or None if profiling is disabled.
+    """
+
+    profiler = _active_profiler
+    if profiler is None:
+        yield None
+        return
+
+    with profiler.span(name, category, **metadata) as recorded_span:
+        yield recorded_span
+
+
+def get_output_setting(option: Optional[str]) -> Optional[str]:
+    """Return where profiling output should be written.
+
+    Args:
+        option: The output requested on the command line, if any.
+
+    Returns:
+        A file path, `-` to print a summary to stderr, or None if profiling is disabled.
+    """
+
+    if option:
+        return option
+
+    setting = os.environ.get(PROFILE_ENV, '')
+    if setting.lower() in ('', '0', 'false', 'no'):
+        return None
+
+    if setting.lower() in ('1', 'true', 'yes'):
+        return '-'
+
+    return setting
+
+
+def write_output(profiler: Profiler, output: str, stats: Any = None) -> None:
+    """Write profiling results in the format implied by the output path.
+
+    Args:
+        profiler: The profiler holding recorded spans.
+        output: A file path, or `-` to print a summary to stderr.
+        stats: A `cProfile.Profile` instance, required for `.prof` and `.pstats` outputs.
+    """
+
+    if output == '-':
+        profiler.write_summary(sys.stderr)
+
+    elif output.endswith('.json'):
+        profiler.write_chrome_trace(output)
+
+    elif output.endswith(('.prof', '.pstats')):
+        stats.dump_stats(output)
+
+    else:
+        with open(output, 'w') as summary_file:
+            profiler.write_summary(summary_file)
@@ -0,0 +1,316 @@
+"""Client for querying Slurm through the Slurm REST API daemon (slurmrestd).
+
+The `slurmrestd` module provides an alternative to running Slurm command line
+utilities for each query. Requests are sent over persistent keep-alive
+connections, avoiding the cost of starting a new process for every lookup.
+
+The REST backend is enabled by setting `CRC_WRAPPERS_BACKEND=rest` and
+is configured using the following environment variables:
+
+- `CRC_WRAPPERS_SLURMRESTD_URL`: The base URL of the REST API. Use a
+  `unix://` URL to connect over a local socket (e.g., `unix:///run/slurmrestd.sock`).
+  Each slurmrestd instance only serves its own cluster, so the URL must
+  contain a `{cluster}` placeholder to query more than one cluster.
+- `CRC_WRAPPERS_SLURMRESTD_DB_URL`: The base URL used for Slurm database
+  queries, which are not specific to a cluster. Defaults to the URL above.
+- `CRC_WRAPPERS_SLURMRESTD_VERSION`: The REST API version to request.
+- `SLURM_JWT`: An optional authentication token sent with each request.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from threading import Lock
+from typing import Optional
+from urllib.parse import quote, urlsplit
+
+from . import profiling
+
+URL_ENV = 'CRC_WRAPPERS_SLURMRESTD_URL'
+DB_URL_ENV = 'CRC_WRAPPERS_SLURMRESTD_DB_URL'
+VERSION_ENV = 'CRC_WRAPPERS_SLURMRESTD_VERSION'
+TOKEN_ENV = 'SLURM_JWT'
+
+
+class UnixHTTPConnection(HTTPConnection):
+    """An HTTP connection sent over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None) -> None:
+        """Create a connection to the given socket.
+
+        Args:
+            socket_path: The path of the Unix domain socket.
+            timeout: Socket timeout in seconds.
+        """
+
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        """Connect to the Unix domain socket."""
+
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class SlurmRestClient:
+    """Query the Slurm REST API over persistent connections.
+
+    One keep-alive connection is maintained for each slurmrestd instance and
+    reused for all requests sent to it.
+    """
+
+    default_version = 'v0.0.40'  # REST API version used when not configured
+    default_timeout = 30  # Seconds to wait for a response
+
+    def __init__(
+        self,
+        url: str,
+        db_url: Optional[str] = None,
+        version: str = default_version,
+        token: Optional[str] = None,
+        username: Optional[str] = None,
+        timeout: float = default_timeout
+    ) -> None:
+        """Create a new REST API client.
+
+        Args:
+            url: The base URL of the REST API, optionally containing a `{cluster}` placeholder.
+            db_url: The base URL used for Slurm database queries. Defaults to `url`.
+            version: The REST API version to request.
+            token: An authentication token to include with each request.
+            username: The name of the user to authenticate as.
+            timeout: Seconds to wait for a response.
+        """
+
+        self.url = url.rstrip('/')
+        self.db_url = db_url.rstrip('/') if db_url else self.url
+        self.version = version
+        self.token = token
+        self.username = username
+        self.timeout = timeout
+
+        self._url_cluster: Optional[str] = None  # The only cluster served when the URL has no placeholder
+        self._connections: dict[str, HTTPConnection] = {}
+        self._locks: dict[str, Lock] = {}
+        self._pool_lock = Lock()
+
+    @classmethod
+    def from_environment(cls) -> SlurmRestClient:
+        """Return a client configured from environment variables.
+
+        Returns:
+            A configured `SlurmRestClient` instance.
+
+        Raises:
+            RuntimeError: If no REST API URL is configured.
+        """
+
+        url = os.environ.get(URL_ENV)
+        if not url:
+            raise RuntimeError(f'The {URL_ENV} environment variable must be set to use the Slurm REST backend.')
+
+        return cls(
+            url,
+            db_url=os.environ.get(DB_URL_ENV),
+            version=os.environ.get(VERSION_ENV) or cls.default_version,
+            token=os.environ.get(TOKEN_ENV),
+            username=os.environ.get('USER'))
+
+    def _get_base_url(self, cluster: Optional[str] = None) -> str:
+        """Return the base URL of the slurmrestd instance serving a cluster.
+
+        Args:
+            cluster: The name of the cluster, or None for Slurm database requests.
+
+        Returns:
+            The base URL with any `{cluster}` placeholder filled in.
+
+        Raises:
+            RuntimeError: If the database URL depends on a cluster name, or if
+                a URL without a `{cluster}` placeholder is used for more than one cluster.
+        """
+
+        if cluster is not None and '{cluster}' in self.url:
+            return self.url.format(cluster=cluster)
+
+        if cluster is not None:
+            with self._pool_lock:
+                self._url_cluster = self._url_cluster or cluster
+
+            # A single slurmrestd instance would silently answer for the wrong cluster
+            if cluster != self._url_cluster:
+                raise RuntimeError(
+                    f'The {URL_ENV} environment variable must contain a {{cluster}} placeholder '
+                    f'to query more than one cluster (requested {cluster!r} after {self._url_cluster!r}).')
+
+            return self.url
+
+        if '{cluster}' in self.db_url:
+            raise RuntimeError(f'The {DB_URL_ENV} environment variable must be set when the URL is cluster specific.')
+
+        return self.db_url
+
+    def _create_connection(self, base_url: str) -> HTTPConnection:
+        """Return a new connection to a slurmrestd instance.
+
+        Args:
+            base_url: The base URL of the instance.
+
+        Returns:
+            An unopened HTTP connection.
+        """
+
+        parts = urlsplit(base_url)
+        if parts.scheme == 'unix':
+            return UnixHTTPConnection(parts.path, timeout=self.timeout)
+
+        if parts.scheme == 'https':
+            return HTTPSConnection(parts.netloc, timeout=self.timeout)
+
+        return HTTPConnection(parts.netloc, timeout=self.timeout)
+
+    def _get_connection(self, base_url: str) -> tuple[HTTPConnection, Lock]:
+        """Return the pooled connection for a slurmrestd instance and the lock guarding it.
+
+        Args:
+            base_url: The base URL of the instance.
+
+        Returns:
+            A tuple with the connection and its lock.
+        """
+
+        with self._pool_lock:
+            if base_url not in self._connections:
+                self._connections[base_url] = self._create_connection(base_url)
+                self._locks[base_url] = Lock()
+
+            return self._connections[base_url], self._locks[base_url]
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+
+        with self._pool_lock:
+            for connection in self._connections.values():
+                connection.close()
+
+            self._connections.clear()
+            self._locks.clear()
+
+    def get(self, path: str, cluster: Optional[str] = None) -> dict:
+        """Send a GET request to the REST API and return the decoded response.
+
+        Args:
+            path: The request path relative to the API root (e.g., `/slurm/{version}/nodes`).
+            cluster: The name of the cluster the request is intended for.
+
+        Returns:
+            The decoded JSON response.
+
+        Raises:
+            RuntimeError: If the request fails or returns an error status.
+        """
+
+        base_url = self._get_base_url(cluster)
+        request_path = urlsplit(base_url).path if not base_url.startswith('unix:') else ''
+        request_path += path.format(version=self.version)
+
+        headers = {'Accept': 'application/json'}
+        if self.token:
+            headers['X-SLURM-USER-TOKEN'] = self.token
+
+        if self.username:
+            headers['X-SLURM-USER-NAME'] = self.username
+
+        connection, lock = self._get_connection(base_url)
+        with lock, profiling.span(request_path, 'slurmrestd') as span:
+            # Retry once in case the server closed an idle keep-alive connection
+            for attempt in range(2):
+                try:
+                    connection.request('GET', request_path, headers=headers)
+                    response = connection.getresponse()
+                    body = response.read()
+                    break
+
+                except (OSError, HTTPException) as excep:
+                    connection.close()
+                    if attempt:
+                        raise RuntimeError(f'Could not connect to slurmrestd at {base_url}: {excep}') from excep
+
+            if span is not None:
+                span.metadata.update(status=response.status, bytes=len(body))
+
+        try:
+            data = json.loads(body) if body else {}
+
+        except ValueError:
+            data = {}
+
+        if not isinstance(data, dict):
+            data = {}
+
+        if response.status >= 400:
+            errors = '; '.join(error.get('description', '') for error in data.get('errors', []))
+            raise RuntimeError(f'slurmrestd returned HTTP {response.status} for {path}: {errors or response.reason}')
+
+        return data
+
+    def get_cluster_names(self) -> set[str]:
+        """Return the names of all clusters registered in the Slurm database.
+
+        Returns:
+            A set of cluster names.
+        """
+
+        return {cluster['name'] for cluster in self.get('/slurmdb/{version}/clusters/').get('clusters', [])}
+
+    def get_partition_names(self, cluster: str) -> set[str]:
+        """Return the names of all partitions on a cluster.
+
+        Args:
+            cluster: The name of the cluster to query.
+
+        Returns:
+            A set of partition names.
+        """
+
+        response = self.get('/slurm/{version}/partitions/', cluster=cluster)
+        return {partition['name'] for partition in response.get('partitions', [])}
+
+    def get_nodes(self, cluster: str) -> list[dict]:
+        """Return status records for all nodes on a cluster.
+
+        Args:
+            cluster: The name of the cluster to query.
+
+        Returns:
+            A list of node records using the same schema as `scontrol --json show nodes`.
+        """
+
+        return self.get('/slurm/{version}/nodes/', cluster=cluster).get('nodes', [])
+
+    def account_exists(self, account_name: str) -> bool:
+        """Return whether a Slurm account exists.
+
+        Args:
+            account_name: The name of the account.
+
+        Returns:
+            True if the account is found in the Slurm database.
+        """
+
+        try:
+            response = self.get(f'/slurmdb/{{version}}/account/{quote(account_name)}')
+
+        except RuntimeError as excep:
+            # Unknown accounts are reported as an error by some API versions
+            if 'HTTP 404' in str(excep):
+                return False
+
+            raise
+
+        return bool(response.get('accounts'))
@@ -0,0 +1,392 @@
+"""Memory-mapped cluster state snapshot files.
+
+A snapshot is a compact, fixed-layout binary file holding node status
+(partition, state, GRES, idle resources, and free memory) and partition
+configuration for one or more clusters. Snapshots are published by a
+scheduled job running `crc-snapshot`, and read by applications such as
+`crc-idle` and `crc-show-config` without querying Slurm.
+
+Node status is stored column-wise. Reading a snapshot maps the file into
+memory and exposes each column as a zero-copy `memoryview`, so no parsing is
+needed beyond decoding the few strings that are displayed.
+
+Snapshots are configured using the following environment variables:
+
+- `CRC_WRAPPERS_SNAPSHOT`: The snapshot file path (default
+  `/var/cache/crc-wrappers/cluster-state.snapshot`).
+- `CRC_WRAPPERS_SNAPSHOT_MAX_AGE`: The age in seconds after which a snapshot
+  is considered stale and applications query Slurm directly (default 120).
+
+File layout (native byte order, verified using a byte order mark):
+
+    header      magic, byte order mark, version, counts, creation time
+    int64       node columns: idle, free_mem
+    uint32      node columns: node, partition, state, gres (string indices)
+    uint32      cluster table: name, config, node start/end, partition start/end
+    uint32      partition table: name and representative node config (string indices)
+    uint32      string offsets, followed by the UTF-8 string data
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import time
+from array import array
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Union
+
+SNAPSHOT_ENV = 'CRC_WRAPPERS_SNAPSHOT'
+MAX_AGE_ENV = 'CRC_WRAPPERS_SNAPSHOT_MAX_AGE'
+DEFAULT_SNAPSHOT = '/var/cache/crc-wrappers/cluster-state.snapshot'
+DEFAULT_MAX_AGE = 120
+
+MAGIC = b'CRCSNAP\0'
+VERSION = 1
+
+# Magic, byte order mark, version, cluster/node/partition/string counts, creation time
+_HEADER = struct.Struct('=8sIIIIIId')
+_BYTE_ORDER_MARK = 0x01020304
+
+INT_COLUMNS = ('idle', 'free_mem')
+STRING_COLUMNS = ('node', 'partition', 'state', 'gres')
+_CLUSTER_FIELDS = 6  # name, config, node start, node end, partition start, partition end
+_PARTITION_FIELDS = 2  # name, node config
+
+
+def get_snapshot_path() -> Path:
+    """Return the configured snapshot file path."""
+
+    return Path(os.environ.get(SNAPSHOT_ENV) or DEFAULT_SNAPSHOT)
+
+
+def get_max_age() -> float:
+    """Return the age in seconds after which a snapshot is considered stale."""
+
+    try:
+        return float(os.environ.get(MAX_AGE_ENV, DEFAULT_MAX_AGE))
+
+    except ValueError:
+        return DEFAULT_MAX_AGE
+
+
+class SnapshotWriter:
+    """Build a snapshot file from cluster state collected from Slurm."""
+
+    def __init__(self) -> None:
+        """Create an empty snapshot."""
+
+        self._string_index: dict[str, int] = {}
+        self._strings: list[str] = []
+        self._int_columns = {name: array('q') for name in INT_COLUMNS}
+        self._string_columns = {name: array('I') for name in STRING_COLUMNS}
+        self._clusters = array('I')
+        self._partitions = array('I')
+
+    @property
+    def clusters(self) -> tuple[str, ...]:
+        """The names of clusters added to the snapshot."""
+
+        return tuple(self._strings[index] for index in self._clusters[::_CLUSTER_FIELDS])
+
+    def _intern(self, value: str) -> int:
+        """Return the string table index of a value, adding it if necessary."""
+
+        index = self._string_index.get(value)
+        if index is None:
+            index = self._string_index[value] = len(self._strings)
+            self._strings.append(value)
+
+        return index
+
+    def add_cluster(
+        self, cluster: str, nodes: dict[str, Sequence], config: str = '', partitions: Iterable[tuple[str, str]] = ()
+    ) -> None:
+        """Add the state of a cluster to the snapshot.
+
+        Args:
+            cluster: The cluster name.
+            nodes: Node status columns keyed by the names in `STRING_COLUMNS` and `INT_COLUMNS`.
+            config: The cluster's partition configuration as reported by `scontrol show partition`.
+            partitions: Pairs of partition name and the configuration of a representative
+                node, which is empty for partitions without nodes.
+
+        Raises:
+            ValueError: If the node columns have different lengths.
+        """
+
+        lengths = {len(nodes[name]) for name in STRING_COLUMNS + INT_COLUMNS}
+        if len(lengths) > 1:
+            raise ValueError('Node status columns must have the same length')
+
+        node_start = len(self._int_columns['idle'])
+        for name in INT_COLUMNS:
+            self._int_columns[name].extend(nodes[name])
+
+        for name in STRING_COLUMNS:
+            self._string_columns[name].extend(self._intern(value) for value in nodes[name])
+
+        partition_start = len(self._partitions) // _PARTITION_FIELDS
+        for partition, node_config in partitions:
+            self._partitions.extend((self._intern(partition), self._intern(node_config)))
+
+        self._clusters.extend((
+            self._intern(cluster), self._intern(config),
+            node_start, len(self._int_columns['idle']),
+            partition_start, len(self._partitions) // _PARTITION_FIELDS))
+
+    def to_bytes(self, created: Optional[float] = None) -> bytes:
+        """Return the snapshot in its binary file format.
+
+        Args:
+            created: The snapshot creation time. Defaults to the current time.
+
+        Returns:
+            The encoded snapshot.
+        """
+
+        encoded = [value.encode() for value in self._strings]
+        offsets = array('I', [0])
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+
+        header = _HEADER.pack(
+            MAGIC, _BYTE_ORDER_MARK, VERSION,
+            len(self._clusters) // _CLUSTER_FIELDS, len(self._int_columns['idle']),
+            len(self._partitions) // _PARTITION_FIELDS, len(self._strings),
+            time.time() if created is None else created)
+
+        sections = [header]
+        sections.extend(self._int_columns[name].tobytes() for name in INT_COLUMNS)
+        sections.extend(self._string_columns[name].tobytes() for name in STRING_COLUMNS)
+        sections.extend((self._clusters.tobytes(), self._partitions.tobytes(), offsets.tobytes()))
+        sections.extend(encoded)
+        return b''.join(sections)
+
+    def publish(self, path: Union[str, Path]) -> None:
+        """Atomically replace the snapshot file at the given path.
+
+        The snapshot is written to a temporary file in the same directory and
+        renamed into place, so readers never observe a partially written file.
+
+        Args:
+            path: The snapshot file path.
+        """
+
+        import tempfile
+
+        path = Path(path)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                temp_file.write(self.to_bytes())
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+class ClusterSnapshot:
+    """Read-only view of a snapshot file."""
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]) -> None:
+        """Validate a snapshot and map its sections.
+
+        Args:
+            buffer: The snapshot contents, typically a memory-mapped file.
+
+        Raises:
+            ValueError: If the buffer is not a snapshot of a supported version.
+        """
+
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ValueError('Snapshot is truncated')
+
+        magic, byte_order_mark, version, num_clusters, num_nodes, num_partitions, num_strings, created = \
+            _HEADER.unpack_from(view)
+
+        if magic != MAGIC or byte_order_mark != _BYTE_ORDER_MARK:
+            raise ValueError('Not a snapshot file for this platform')
+
+        if version != VERSION:
+            raise ValueError(f'Unsupported snapshot version: {version}')
+
+        self.created = created
+        self._buffer = buffer
+        offset = _HEADER.size
+
+        def take(typecode: str, count: int) -> memoryview:
+            nonlocal offset
+            size = count * array(typecode).itemsize
+            if offset + size > len(view):
+                raise ValueError('Snapshot is truncated')
+
+            section = view[offset:offset + size].cast(typecode)
+            offset += size
+            return section
+
+        self._int_columns = {name: take('q', num_nodes) for name in INT_COLUMNS}
+        self._string_columns = {name: take('I', num_nodes) for name in STRING_COLUMNS}
+        self._clusters = take('I', num_clusters * _CLUSTER_FIELDS)
+        self._partitions = take('I', num_partitions * _PARTITION_FIELDS)
+        self._offsets = take('I', num_strings + 1)
+        self._strings = view[offset:]
+        if len(self._strings) < self._offsets[-1]:
+            raise ValueError('Snapshot is truncated')
+
+        self._string_cache: dict[int, str] = {}
+        self._cluster_index = {
+            self.string(self._clusters[i]): i for i in range(0, len(self._clusters), _CLUSTER_FIELDS)}
+
+    @property
+    def age(self) -> float:
+        """The number of seconds since the snapshot was created."""
+
+        return time.time() - self.created
+
+    @property
+    def clusters(self) -> tuple[str, ...]:
+        """The names of clusters included in the snapshot."""
+
+        return tuple(self._cluster_index)
+
+    def string(self, index: int) -> str:
+        """Return a value from the snapshot string table.
+
+        Args:
+            index: The string table index, as stored in string columns.
+
+        Returns:
+            The decoded string.
+        """
+
+        value = self._string_cache.get(index)
+        if value is None:
+            data = self._strings[self._offsets[index]:self._offsets[index + 1]]
+            value = self._string_cache[index] = str(data, 'utf-8')
+
+        return value
+
+    def _cluster_record(self, cluster: str) -> memoryview:
+        """Return the cluster table entry for a cluster, raising `KeyError` if it is not included."""
+
+        start = self._cluster_index[cluster]
+        return self._clusters[start:start + _CLUSTER_FIELDS]
+
+    def node_columns(self, cluster: str) -> dict[str, memoryview]:
+        """Return zero-copy node status columns for a cluster.
+
+        Integer columns hold values directly. String columns hold string table
+        indices, which are decoded using `string`.
+
+        Args:
+            cluster: The cluster name.
+
+        Returns:
+            Columns keyed by the names in `INT_COLUMNS` and `STRING_COLUMNS`.
+
+        Raises:
+            KeyError: If the cluster is not included in the snapshot.
+        """
+
+        _, _, start, end, _, _ = self._cluster_record(cluster)
+        columns = {name: column[start:end] for name, column in self._int_columns.items()}
+        columns.update((name, column[start:end]) for name, column in self._string_columns.items())
+        return columns
+
+    def partition_config(self, cluster: str) -> str:
+        """Return the partition configuration of a cluster as reported by `scontrol show partition`.
+
+        Raises:
+            KeyError: If the cluster is not included in the snapshot.
+        """
+
+        return self.string(self._cluster_record(cluster)[1])
+
+    def _partition_records(self, cluster: str) -> Iterable[tuple[int, int]]:
+        """Yield the name and node configuration string indices of each partition in a cluster."""
+
+        _, _, _, _, start, end = self._cluster_record(cluster)
+        for index in range(start * _PARTITION_FIELDS, end * _PARTITION_FIELDS, _PARTITION_FIELDS):
+            yield self._partitions[index], self._partitions[index + 1]
+
+    def partition_names(self, cluster: str) -> list[str]:
+        """Return the names of all partitions on a cluster.
+
+        Raises:
+            KeyError: If the cluster is not included in the snapshot.
+        """
+
+        return [self.string(name) for name, _ in self._partition_records(cluster)]
+
+    def node_config(self, cluster: str, partition: str) -> Optional[str]:
+        """Return the configuration of a representative node in a partition.
+
+        Args:
+            cluster: The cluster name.
+            partition: The partition name.
+
+        Returns:
+            The node configuration as reported by `scontrol show node`, or None
+            if the partition is unknown or has no nodes.
+
+        Raises:
+            KeyError: If the cluster is not included in the snapshot.
+        """
+
+        for name, node_config in self._partition_records(cluster):
+            if self.string(name) == partition:
+                return self.string(node_config) or None
+
+        return None
+
+
+def read_snapshot(path: Union[str, Path]) -> ClusterSnapshot:
+    """Memory-map and validate a snapshot file.
+
+    Args:
+        path: The snapshot file path.
+
+    Returns:
+        The mapped snapshot.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is empty or not a valid snapshot.
+    """
+
+    with open(path, 'rb') as snapshot_file:
+        return ClusterSnapshot(mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def load_snapshot(
+    path: Optional[Union[str, Path]] = None, max_age: Optional[float] = None
+) -> Optional[ClusterSnapshot]:
+    """Return the current snapshot, or None if it is missing, invalid, or stale.
+
+    Args:
+        path: The snapshot file path. Defaults to the configured path.
+        max_age: The maximum snapshot age in seconds. Defaults to the configured value.
+
+    Returns:
+        The mapped snapshot, or None if applications should query Slurm directly.
+    """
+
+    max_age = get_max_age() if max_age is None else max_age
+    if max_age <= 0:
+        return None
+
+    try:
+        snapshot = read_snapshot(path or get_snapshot_path())
+
+    except (OSError, ValueError):
+        return None
+
+    return snapshot if snapshot.age <= max_age else None
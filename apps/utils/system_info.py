@@ -1,17 +1,50 @@
 """Utility classes for interacting with the Slurm scheduler."""
 
+import os
 import re
 import sys
-import termios
-import tty
+import time
 from datetime import date
 from shlex import split
-from subprocess import PIPE, Popen
-from typing import Set, Tuple, Union
+from typing import Collection, Dict, Iterator, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING, Union
+
+from . import profiling
+from .backends import get_backend, get_backend_name
+from .cache import FileCache
+
+# The REST API client is imported at runtime only when the REST backend is selected
+if TYPE_CHECKING:  # pragma: no cover
+    from .slurmrestd import SlurmRestClient
 
 
 class Shell:
-    """Methods for interacting with the runtime shell."""
+    """Methods for interacting with the runtime shell.
+
+    Commands are run with a per-command timeout and an overall deadline, and
+    are retried with jittered exponential backoff when stderr reports a
+    transient Slurm controller error. Default limits can be overridden using
+    the following environment variables (set to `0` to disable a limit):
+
+    - `CRC_WRAPPERS_COMMAND_TIMEOUT`: Seconds to wait for a single attempt.
+    - `CRC_WRAPPERS_COMMAND_RETRIES`: Number of retries after the first attempt.
+    - `CRC_WRAPPERS_COMMAND_DEADLINE`: Seconds to wait across all attempts.
+    """
+
+    timeout_env = 'CRC_WRAPPERS_COMMAND_TIMEOUT'
+    retries_env = 'CRC_WRAPPERS_COMMAND_RETRIES'
+    deadline_env = 'CRC_WRAPPERS_COMMAND_DEADLINE'
+
+    default_timeout = 60  # Seconds to wait for a single attempt
+    default_retries = 3  # Number of retries after the first attempt
+    default_deadline = 180  # Seconds to wait across all attempts
+    backoff_base = 0.5  # Initial retry delay in seconds
+    backoff_max = 10  # Maximum retry delay in seconds
+
+    # Messages written to stderr by Slurm when the controller is temporarily unavailable
+    transient_errors = (
+        'Socket timed out',
+        'Unable to contact slurm controller',
+    )
 
     @staticmethod
     def readchar() -> str:
@@ -21,6 +54,10 @@ class Shell:
             The character entered by the user.
         """
 
+        # Terminal control modules are only needed for interactive prompts
+        import termios
+        import tty
+
         # Get the current settings of the standard input file descriptor
         file_descriptor = sys.stdin.fileno()
         old_settings = termios.tcgetattr(file_descriptor)
@@ -37,32 +74,487 @@ class Shell:
         return character
 
     @staticmethod
-    def run_command(command: str, include_err: bool = False) -> Union[str, Tuple[str, str]]:
+    def _get_env_limit(name: str, default: float) -> Optional[float]:
+        """Return a numeric limit from the environment, or None if the limit is disabled.
+
+        Args:
+            name: The name of the environment variable.
+            default: The value to use if the variable is unset or invalid.
+
+        Returns:
+            The configured limit, or None if it is not positive.
+        """
+
+        try:
+            value = float(os.environ.get(name, default))
+
+        except ValueError:
+            value = default
+
+        return value if value > 0 else None
+
+    @classmethod
+    def _get_limits(
+        cls, timeout: Optional[float], retries: Optional[int], deadline: Optional[float]
+    ) -> Tuple[Optional[float], int, Optional[float]]:
+        """Return the timeout, retry and deadline limits, falling back on configured defaults.
+
+        Args:
+            timeout: Seconds to wait for a single attempt, or None to use the default.
+            retries: Number of retries after the first attempt, or None to use the default.
+            deadline: Seconds to wait across all attempts, or None to use the default.
+
+        Returns:
+            A tuple of (timeout, retries, deadline). Disabled limits are returned as None.
+        """
+
+        if timeout is None:
+            timeout = cls._get_env_limit(cls.timeout_env, cls.default_timeout)
+
+        if retries is None:
+            retries = int(cls._get_env_limit(cls.retries_env, cls.default_retries) or 0)
+
+        if deadline is None:
+            deadline = cls._get_env_limit(cls.deadline_env, cls.default_deadline)
+
+        return timeout, retries, deadline
+
+    @classmethod
+    def _is_transient_error(cls, std_err: str) -> bool:
+        """Return whether stderr output indicates a transient Slurm error worth retrying.
+
+        Args:
+            std_err: The decoded stderr output of a command.
+
+        Returns:
+            True if the error is expected to resolve on its own.
+        """
+
+        return any(message in std_err for message in cls.transient_errors)
+
+    @classmethod
+    def _backoff_delay(cls, attempt: int) -> float:
+        """Return a randomized delay before retrying a command.
+
+        Uses exponential backoff with full jitter so concurrent wrappers do not
+        retry against the controller in lockstep.
+
+        Args:
+            attempt: The number of attempts made so far, starting at 1.
+
+        Returns:
+            The delay in seconds.
+        """
+
+        import random
+
+        return random.uniform(0, min(cls.backoff_max, cls.backoff_base * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def _get_attempt_timeout(timeout: Optional[float], remaining: Optional[float]) -> Optional[float]:
+        """Return the timeout for a single attempt given the time remaining before the deadline.
+
+        Args:
+            timeout: The per-attempt timeout, or None for no limit.
+            remaining: Seconds remaining before the deadline, or None for no deadline.
+
+        Returns:
+            The smaller of the two limits, or None if neither is set.
+        """
+
+        limits = [limit for limit in (timeout, remaining) if limit is not None]
+        return max(0.0, min(limits)) if limits else None
+
+    @staticmethod
+    def _record_output(
+        span: Optional[profiling.Span],
+        exit_code: Optional[int],
+        std_out: Union[str, bytes],
+        std_err: Union[str, bytes]
+    ) -> None:
+        """Attach the result of a command to a profiling span.
+
+        Args:
+            span: The span recording the command, or None if profiling is disabled.
+            exit_code: The exit code of the command, if known.
+            std_out: The stdout output of the command.
+            std_err: The stderr output of the command.
+        """
+
+        if span is not None:
+            span.metadata.update(exit_code=exit_code, stdout_bytes=len(std_out), stderr_bytes=len(std_err))
+
+    @classmethod
+    def run_command(
+        cls,
+        command: str,
+        include_err: bool = False,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> Union[str, Tuple[str, str]]:
         """Run a shell command and return its output.
 
+        Commands reporting a transient Slurm error are retried until the retry
+        limit or overall deadline is reached. Limits left as None use the
+        configured defaults.
+
+        Args:
+            command: The command to execute.
+            include_err: Whether to include stderr in the return value.
+            timeout: Maximum number of seconds to wait for a single attempt.
+            retries: Maximum number of times to retry the command.
+            deadline: Maximum number of seconds to spend across all attempts.
+
+        Returns:
+            The stdout output as a string, or a tuple of (stdout, stderr) if
+            `include_err` is True.
+
+        Raises:
+            TimeoutError: If an attempt exceeds the timeout or the overall deadline.
+        """
+
+        backend = get_backend()
+        if backend is not None:
+            with profiling.span(command, 'command') as span:
+                out_decoded, err_decoded = backend.run_command(command)
+                cls._record_output(span, None, out_decoded, err_decoded)
+
+            return (out_decoded, err_decoded) if include_err else out_decoded
+
+        from subprocess import PIPE, Popen, TimeoutExpired
+
+        timeout, retries, deadline = cls._get_limits(timeout, retries, deadline)
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            remaining = None if deadline is None else deadline - (time.monotonic() - start)
+            with profiling.span(command, 'command', attempt=attempt) as span:
+                process = Popen(split(command), stdout=PIPE, stderr=PIPE, shell=False)
+
+                try:
+                    std_out, std_err = process.communicate(timeout=cls._get_attempt_timeout(timeout, remaining))
+
+                except TimeoutExpired:
+                    process.kill()
+                    process.communicate()
+                    raise TimeoutError(f'Command did not finish in time: {command}')
+
+                cls._record_output(span, process.returncode, std_out, std_err)
+
+            out_decoded = std_out.decode().strip()
+            err_decoded = std_err.decode().strip()
+            if not cls._is_transient_error(err_decoded):
+                break
+
+            delay = cls._backoff_delay(attempt)
+            if attempt > retries or (deadline is not None and time.monotonic() - start + delay >= deadline):
+                break
+
+            time.sleep(delay)
+
+        if include_err:
+            return out_decoded, err_decoded
+
+        return out_decoded
+
+    @classmethod
+    async def run_command_async(
+        cls,
+        command: str,
+        include_err: bool = False,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> Union[str, Tuple[str, str]]:
+        """Run a shell command asynchronously and return its output.
+
+        Applies the same timeout, retry and deadline handling as `run_command`.
+        The running command is terminated if the awaiting task is cancelled.
+
         Args:
             command: The command to execute.
             include_err: Whether to include stderr in the return value.
+            timeout: Maximum number of seconds to wait for a single attempt.
+            retries: Maximum number of times to retry the command.
+            deadline: Maximum number of seconds to spend across all attempts.
 
         Returns:
             The stdout output as a string, or a tuple of (stdout, stderr) if
             `include_err` is True.
+
+        Raises:
+            TimeoutError: If an attempt exceeds the timeout or the overall deadline.
         """
 
-        process = Popen(split(command), stdout=PIPE, stderr=PIPE, shell=False)
-        std_out, std_err = process.communicate()
+        backend = get_backend()
+        if backend is not None:
+            with profiling.span(command, 'command') as span:
+                out_decoded, err_decoded = await backend.run_command_async(command)
+                cls._record_output(span, None, out_decoded, err_decoded)
+
+            return (out_decoded, err_decoded) if include_err else out_decoded
+
+        import asyncio
+        from subprocess import PIPE
+
+        timeout, retries, deadline = cls._get_limits(timeout, retries, deadline)
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            remaining = None if deadline is None else deadline - (time.monotonic() - start)
+            with profiling.span(command, 'command', attempt=attempt) as span:
+                process = await asyncio.create_subprocess_exec(*split(command), stdout=PIPE, stderr=PIPE)
+
+                try:
+                    std_out, std_err = await asyncio.wait_for(
+                        process.communicate(), cls._get_attempt_timeout(timeout, remaining))
 
-        out_decoded = std_out.decode().strip()
-        err_decoded = std_err.decode().strip()
+                except BaseException as exception:
+                    # Do not leave orphaned processes behind on timeout or cancellation
+                    if process.returncode is None:
+                        process.kill()
+                        await process.wait()
+
+                    if isinstance(exception, TimeoutError):
+                        raise TimeoutError(f'Command did not finish in time: {command}') from exception
+
+                    raise
+
+                cls._record_output(span, process.returncode, std_out, std_err)
+
+            out_decoded = std_out.decode().strip()
+            err_decoded = std_err.decode().strip()
+            if not cls._is_transient_error(err_decoded):
+                break
+
+            delay = cls._backoff_delay(attempt)
+            if attempt > retries or (deadline is not None and time.monotonic() - start + delay >= deadline):
+                break
+
+            await asyncio.sleep(delay)
 
         if include_err:
             return out_decoded, err_decoded
 
         return out_decoded
 
+    @classmethod
+    async def gather_commands(
+        cls,
+        commands: Sequence[str],
+        include_err: bool = False,
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None
+    ) -> List[Union[str, Tuple[str, str]]]:
+        """Run multiple shell commands concurrently and return their output.
+
+        If any command fails or times out, all remaining commands are cancelled
+        and the error is re-raised.
+
+        Args:
+            commands: The commands to execute.
+            include_err: Whether to include stderr in the returned values.
+            max_concurrency: Maximum number of commands to run at once.
+            timeout: Maximum number of seconds to wait for a single attempt of each command.
+
+        Returns:
+            The output of each command, in the same order as `commands`.
+        """
+
+        import asyncio
+
+        if max_concurrency < 1:
+            raise ValueError('The maximum concurrency must be a positive integer.')
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(command: str) -> Union[str, Tuple[str, str]]:
+            async with semaphore:
+                return await cls.run_command_async(command, include_err=include_err, timeout=timeout)
+
+        tasks = [asyncio.create_task(run(command)) for command in commands]
+        try:
+            return await asyncio.gather(*tasks)
+
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    @classmethod
+    def run_commands(
+        cls,
+        commands: Sequence[str],
+        include_err: bool = False,
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None
+    ) -> List[Union[str, Tuple[str, str]]]:
+        """Run multiple shell commands concurrently from synchronous code.
+
+        See `gather_commands` for a description of the arguments.
+
+        Returns:
+            The output of each command, in the same order as `commands`.
+        """
+
+        if not commands:
+            return []
+
+        import asyncio
+
+        return asyncio.run(cls.gather_commands(
+            commands, include_err=include_err, max_concurrency=max_concurrency, timeout=timeout))
+
+    @classmethod
+    def run_snapshot_commands(cls, commands: Sequence[str], max_concurrency: int = 8) -> List[str]:
+        """Return the output of read-only Slurm queries, using the snapshot broker where available.
+
+        Output served by the broker may be up to `stale_intervals` (by default
+        three) broker polling intervals old if refreshes fail or fall behind.
+        Commands the broker cannot serve (or all commands, if no broker is
+        running or an alternative backend is installed) are run concurrently
+        using `run_commands`.
+
+        Args:
+            commands: The commands to execute.
+            max_concurrency: Maximum number of commands run directly at the same time.
+
+        Returns:
+            The stdout output of each command, in the same order as `commands`.
+        """
+
+        # Commands are answered by the installed backend rather than a broker querying the real cluster
+        if get_backend() is not None:
+            return cls.run_commands(commands, max_concurrency=max_concurrency)
+
+        from .broker import query_snapshots
+
+        outputs = query_snapshots(commands)
+        missing = [index for index, output in enumerate(outputs) if output is None]
+        if missing:
+            direct_outputs = cls.run_commands([commands[index] for index in missing], max_concurrency=max_concurrency)
+            for index, output in zip(missing, direct_outputs):
+                outputs[index] = output
+
+        return outputs
+
+    @classmethod
+    def run_snapshot_command(cls, command: str) -> str:
+        """Return the output of a read-only Slurm query, using the snapshot broker where available.
+
+        Args:
+            command: The command to execute.
+
+        Returns:
+            The stdout output of the command.
+        """
+
+        if get_backend() is not None:
+            return cls.run_command(command)
+
+        from .broker import query_snapshot
+
+        output = query_snapshot(command)
+        return cls.run_command(command) if output is None else output
+
+    @staticmethod
+    def stream_output(command: str, separator: re.Pattern, idle_timeout: float = 0.2) -> Iterator[str]:
+        """Run a long-lived command and yield each report it periodically prints.
+
+        This suits commands that periodically print a complete report (e.g.,
+        `squeue --iterate`, which prints a timestamp before each report).
+        Reports are split on lines matching `separator`. So a report can be
+        displayed before the next one begins, the output received so far is
+        also yielded once the command writes nothing for `idle_timeout`
+        seconds. If more of the same report arrives afterwards (e.g., from a
+        slow controller), the whole report is yielded again. The command is
+        terminated when the generator is closed. stderr is passed through to
+        the terminal.
+
+        If an alternative backend is installed, the command is run once
+        through the backend and its output yielded as a single report.
+
+        Args:
+            command: The command to execute.
+            separator: Pattern matching the (stripped) first line of each report.
+            idle_timeout: Seconds of inactivity after which a partial report is yielded.
+
+        Yields:
+            The text of each report, starting with its separator line.
+        """
+
+        backend = get_backend()
+        if backend is not None:
+            yield backend.run_command(command)[0]
+            return
+
+        import select
+        from subprocess import PIPE, Popen
+
+        process = Popen(split(command), stdout=PIPE, shell=False)
+        file_descriptor = process.stdout.fileno()
+        report, partial_line, pending = b'', b'', False
+
+        try:
+            while True:
+                ready, _, _ = select.select([file_descriptor], [], [], idle_timeout if pending else None)
+                if not ready:
+                    yield (report + partial_line).decode(errors='replace')
+                    pending = False
+                    continue
+
+                chunk = os.read(file_descriptor, 65536)
+                if not chunk:
+                    break
+
+                *lines, partial_line = (partial_line + chunk).split(b'\n')
+                for line in lines:
+                    if report and separator.fullmatch(line.decode(errors='replace').strip()):
+                        if pending:
+                            yield report.decode(errors='replace')
+
+                        report = b''
+
+                    report += line + b'\n'
+                    pending = True
+
+                pending = pending or bool(partial_line)
+
+            if pending:
+                yield (report + partial_line).decode(errors='replace')
+
+        finally:
+            if process.poll() is None:
+                process.terminate()
+
+            process.stdout.close()
+            process.wait()
+
 
 class Slurm:
-    """Methods for querying Slurm cluster and partition configuration."""
+    """Methods for querying Slurm cluster and partition configuration.
+
+    Set the `CRC_WRAPPERS_SLURM_JSON` environment variable to a truthy value
+    to query Slurm using structured `--json` output where supported. Queries
+    fall back to parsing plain text output if JSON output is unavailable, as
+    is the case for older Slurm releases.
+
+    By default, Slurm is queried using its command line utilities. Set the
+    `CRC_WRAPPERS_BACKEND` environment variable to `rest` to instead send
+    supported queries to the Slurm REST API (see the `backends` and
+    `slurmrestd` modules).
+    """
+
+    json_env = 'CRC_WRAPPERS_SLURM_JSON'
+
+    _rest_clients: dict = {}  # REST API clients reused across queries, keyed by configuration
 
     ignore_clusters = {'azure'}
     ignore_partitions = {
@@ -93,6 +585,143 @@ class Slurm:
 
         return True
 
+    @staticmethod
+    def _run_cached_command(command: str) -> str:
+        """Run a shell command, reusing previously cached output when available.
+
+        Intended for commands reporting information that rarely changes, such
+        as the cluster and partition layout. Empty output is never cached.
+
+        Args:
+            command: The command to execute.
+
+        Returns:
+            The stdout output as a string.
+        """
+
+        # Output served by an alternative backend must not leak into the shared cache, or vice versa
+        if get_backend() is not None:
+            return Shell.run_command(command)
+
+        cache = FileCache.from_environment()
+        output = cache.get(command)
+        if output is None:
+            output = Shell.run_command(command)
+            if output:
+                cache.set(command, output)
+
+        return output
+
+    @classmethod
+    def get_rest_client(cls) -> Optional['SlurmRestClient']:
+        """Return a client for the Slurm REST API if the REST backend is selected.
+
+        Clients are reused for the lifetime of the process so connections to
+        the REST API are kept alive between queries.
+
+        Returns:
+            A `SlurmRestClient` instance, or None if the REST backend is not
+            selected or a backend was installed using `set_backend`.
+        """
+
+        # Installed backends serve recorded command output, so queries must be issued as commands
+        if get_backend() is not None or get_backend_name() != 'rest':
+            return None
+
+        from .slurmrestd import SlurmRestClient
+
+        client = SlurmRestClient.from_environment()
+        key = (client.url, client.db_url, client.version, client.token, client.username)
+        return cls._rest_clients.setdefault(key, client)
+
+    @classmethod
+    def use_json(cls) -> bool:
+        """Return whether Slurm should be queried using structured JSON output.
+
+        Returns:
+            True if JSON output is enabled in the environment.
+        """
+
+        return os.environ.get(cls.json_env, '').lower() in ('1', 'true', 'yes')
+
+    @staticmethod
+    def parse_json(output: str) -> Optional[dict]:
+        """Parse JSON output from a Slurm command.
+
+        Uses the `orjson` package for faster parsing when it is installed.
+
+        Args:
+            output: The raw command output.
+
+        Returns:
+            The parsed JSON document, or None if the output is not a valid JSON object.
+        """
+
+        try:
+            from orjson import loads  # pragma: no cover
+
+        except ImportError:
+            from json import loads
+
+        try:
+            data = loads(output)
+
+        except ValueError:
+            return None
+
+        return data if isinstance(data, dict) else None
+
+    @staticmethod
+    def split_cluster_sections(output: str) -> Dict[str, List[str]]:
+        """Group the output of a multi-cluster (`-M`) Slurm command by cluster.
+
+        Slurm prints a `CLUSTER: <name>` header before the output of each
+        cluster. Lines preceding the first header are discarded.
+
+        Args:
+            output: The command output.
+
+        Returns:
+            A dictionary mapping each cluster name to its non-empty output lines.
+        """
+
+        sections: Dict[str, List[str]] = {}
+        lines = None
+        for line in output.splitlines():
+            line = line.strip()
+            if line.startswith('CLUSTER:'):
+                lines = sections.setdefault(line.removeprefix('CLUSTER:').strip(), [])
+
+            elif line and lines is not None:
+                lines.append(line)
+
+        return sections
+
+    @classmethod
+    def _get_json_names(cls, command: str, key: str) -> Optional[Set[str]]:
+        """Return the names of all records listed under a key in a Slurm command's JSON output.
+
+        Command output is cached in the same way as `_run_cached_command`.
+
+        Args:
+            command: The Slurm command to execute, including the `--json` option.
+            key: The key of the record list in the JSON document.
+
+        Returns:
+            A set of record names, or None if JSON output is disabled or unavailable.
+        """
+
+        if not cls.use_json():
+            return None
+
+        data = cls.parse_json(cls._run_cached_command(command))
+
+        try:
+            return {record['name'] for record in data[key]}
+
+        except (KeyError, TypeError):
+            return None
+
     @classmethod
     def get_cluster_names(cls, include_all_clusters: bool = False) -> Set[str]:
         """Return the names of clusters configured in Slurm.
@@ -105,9 +734,17 @@ class Slurm:
             A set of cluster name strings.
         """
 
-        # Get cluster names using squeue to fetch all running jobs for a non-existent username
-        output = Shell.run_command('squeue -u fakeuser -M all')
-        cluster_names = set(re.findall(r'CLUSTER: (.*)\n', output))
+        rest_client = cls.get_rest_client()
+        if rest_client is not None:
+            cluster_names = rest_client.get_cluster_names()
+
+        else:
+            cluster_names = cls._get_json_names('sacctmgr --json show clusters', 'clusters')
+
+        if cluster_names is None:
+            # Get cluster names using squeue to fetch all running jobs for a non-existent username
+            output = cls._run_cached_command('squeue -u fakeuser -M all')
+            cluster_names = set(re.findall(r'CLUSTER: (.*)\n', output))
 
         if not include_all_clusters:
             cluster_names -= cls.ignore_clusters
@@ -127,8 +764,16 @@ class Slurm:
             A set of partition name strings.
         """
 
-        output = Shell.run_command(f'scontrol -M {cluster_name} show partition')
-        partition_names = set(re.findall(r'PartitionName=(.*)\n', output))
+        rest_client = cls.get_rest_client()
+        if rest_client is not None:
+            partition_names = rest_client.get_partition_names(cluster_name)
+
+        else:
+            partition_names = cls._get_json_names(f'scontrol -M {cluster_name} --json show partition', 'partitions')
+
+        if partition_names is None:
+            output = cls._run_cached_command(f'scontrol -M {cluster_name} show partition')
+            partition_names = set(re.findall(r'PartitionName=(.*)\n', output))
 
         if not include_all_partitions:
             partition_names -= cls.ignore_partitions
@@ -146,10 +791,43 @@ class Slurm:
             RuntimeError: If no account with the given name is found.
         """
 
-        cmd = f'sacctmgr -n list account account={account_name} format=account%30'
-        if not Shell.run_command(cmd):
+        rest_client = cls.get_rest_client()
+        if rest_client is not None:
+            exists = rest_client.account_exists(account_name)
+
+        else:
+            cmd = f'sacctmgr -n list account account={account_name} format=account%30'
+            exists = bool(Shell.run_command(cmd))
+
+        if not exists:
             raise RuntimeError(f"No Slurm account was found with the name '{account_name}'.")
 
+    @classmethod
+    def check_slurm_accounts_exist(cls, account_names: Sequence[str]) -> None:
+        """Raise an error if any of the given Slurm accounts do not exist.
+
+        All accounts are checked concurrently.
+
+        Args:
+            account_names: The Slurm account names to verify.
+
+        Raises:
+            RuntimeError: If no account is found for one of the given names.
+        """
+
+        rest_client = cls.get_rest_client()
+        if rest_client is not None:
+            # Requests share a single keep-alive connection, so there is nothing to gain from running them concurrently
+            for account_name in account_names:
+                cls.check_slurm_account_exists(account_name)
+
+            return
+
+        commands = [f'sacctmgr -n list account account={name} format=account%30' for name in account_names]
+        for account_name, output in zip(account_names, Shell.run_commands(commands)):
+            if not output:
+                raise RuntimeError(f"No Slurm account was found with the name '{account_name}'.")
+
     @classmethod
     def get_cluster_usage_by_user(cls, account_name: str, start_date: date, cluster: str) -> Union[dict, None]:
         """Return billable usage in hours for a Slurm account, broken down by user.
@@ -191,3 +869,106 @@ class Slurm:
                 out_data[user] = int(usage)
 
         return out_data
+
+    @classmethod
+    def get_bulk_usage_by_user(
+        cls, account_names: Collection[str], start_date: date, clusters: Collection[str]
+    ) -> dict[str, dict[str, dict[str, int]]]:
+        """Return billable usage in hours for multiple accounts and clusters using a single `sreport` call.
+
+        Args:
+            account_names: The names of the Slurm accounts to query.
+            start_date: The start of the reporting period.
+            clusters: The names of the clusters to query usage on.
+
+        Returns:
+            A nested dictionary mapping account name, then cluster name, to a
+            dictionary of per-user usage hours with a `'total'` key for the
+            account-wide sum. Accounts and clusters without usage are omitted.
+        """
+
+        if not account_names or not clusters:
+            return {}
+
+        command = cls._get_bulk_usage_command(account_names, start_date, clusters)
+        return cls._parse_bulk_usage(Shell.run_command(command))
+
+    @classmethod
+    def get_bulk_usage_by_period(
+        cls, queries: Sequence[Tuple[Collection[str], date, Collection[str]]], max_concurrency: int = 8
+    ) -> List[dict[str, dict[str, dict[str, int]]]]:
+        """Return billable usage for several reporting periods, running the `sreport` calls concurrently.
+
+        Each query is answered using a single `sreport` call as in
+        `get_bulk_usage_by_user`. Queries run on a bounded pool, so the total
+        run time is set by the slowest reporting period rather than the sum of all periods.
+
+        Args:
+            queries: Tuples of account names, reporting period start date, and cluster names.
+            max_concurrency: The maximum number of concurrent `sreport` calls.
+
+        Returns:
+            The result of each query in the format returned by `get_bulk_usage_by_user`,
+            in the same order as `queries`.
+        """
+
+        commands = [
+            cls._get_bulk_usage_command(accounts, start_date, clusters)
+            for accounts, start_date, clusters in queries if accounts and clusters
+        ]
+
+        outputs = iter(Shell.run_commands(commands, max_concurrency=max_concurrency))
+        return [
+            cls._parse_bulk_usage(next(outputs)) if accounts and clusters else {}
+            for accounts, _, clusters in queries
+        ]
+
+    @staticmethod
+    def _get_bulk_usage_command(account_names: Collection[str], start_date: date, clusters: Collection[str]) -> str:
+        """Return the `sreport` command reporting usage for multiple accounts and clusters."""
+
+        return (
+            f"sreport -nP cluster accountutilizationbyuser Cluster={','.join(clusters)} "
+            f"Account={','.join(account_names)} -t Hours Start={start_date.isoformat()} "
+            f"-T Billing Format=Cluster,Account,Proper,Used"
+        )
+
+    @staticmethod
+    def _parse_bulk_usage(output: str) -> dict[str, dict[str, dict[str, int]]]:
+        """Parse `sreport` output from `_get_bulk_usage_command` into a nested usage dictionary."""
+
+        out_data: dict[str, dict[str, dict[str, int]]] = {}
+        for line in output.split('\n'):
+            if not line:
+                continue
+
+            cluster, account, user, usage = line.split('|')
+            cluster_usage = out_data.setdefault(account, {}).setdefault(cluster, {})
+
+            # Slurm outputs the total as a value associated with no username
+            cluster_usage[user or 'total'] = int(usage)
+
+        return out_data
+
+    @classmethod
+    def get_usage_by_cluster(
+        cls, account_name: str, start_date: date, clusters: Collection[str]
+    ) -> dict[str, Union[dict, None]]:
+        """Return billable usage for a Slurm account on multiple clusters.
+
+        All clusters are queried using a single `sreport` call.
+
+        Args:
+            account_name: The name of the Slurm account to query.
+            start_date: The start of the reporting period.
+            clusters: The names of the clusters to query usage on.
+
+        Returns:
+            A dictionary mapping each cluster name to a dictionary of per-user
+            usage hours, or None if no data is available for that cluster.
+            Clusters are returned in the same order as `clusters`.
+        """
+
+        clusters = list(clusters)
+        usage = cls.get_bulk_usage_by_user([account_name], start_date, clusters).get(account_name, {})
+        return {cluster: usage.get(cluster) for cluster in clusters}
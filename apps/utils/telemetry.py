@@ -0,0 +1,184 @@
+"""Opt-in usage telemetry for wrapper application invocations.
+
+When enabled, every application run appends a single compact JSON record to
+a per-user spool file. Records contain the tool name, wall-clock duration,
+the number of Slurm and Keystone calls issued, and the exit status. Spooled
+records are summarized using the `crc-telemetry` application.
+
+Telemetry is configured using the following environment variables:
+
+- `CRC_WRAPPERS_TELEMETRY_DIR`: The spool directory. Telemetry is disabled
+  unless this is set. A site-wide directory should be world writable with
+  the sticky bit set, since each user writes to their own spool file.
+- `CRC_WRAPPERS_TELEMETRY_MAX_BYTES`: The size at which a spool file is
+  rotated. One rotated file is kept per user (default 1 MiB).
+
+Spooling is best effort. Records are written with a single non-blocking
+append and any filesystem error is silently ignored. Spool files are never
+opened through symbolic links, and concurrent runs by the same user rotate
+a full spool file at most once.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from .profiling import Profiler
+
+SPOOL_DIR_ENV = 'CRC_WRAPPERS_TELEMETRY_DIR'
+MAX_BYTES_ENV = 'CRC_WRAPPERS_TELEMETRY_MAX_BYTES'
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+# Profiling span categories counted as calls to each service
+SLURM_CATEGORIES = ('command', 'slurmrestd')
+KEYSTONE_CATEGORIES = ('keystone',)
+
+
+def get_spool_path() -> Optional[Path]:
+    """Return the spool file for the current user, or None if telemetry is disabled."""
+
+    spool_dir = os.environ.get(SPOOL_DIR_ENV)
+    if not spool_dir:
+        return None
+
+    return Path(spool_dir) / f'telemetry-{os.getuid()}.jsonl'
+
+
+def get_max_bytes() -> int:
+    """Return the size in bytes at which spool files are rotated."""
+
+    try:
+        return int(os.environ.get(MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+
+    except ValueError:
+        return DEFAULT_MAX_BYTES
+
+
+def build_record(tool: str, duration: float, profiler: Profiler, status: int) -> dict:
+    """Build a telemetry record for a finished invocation.
+
+    Args:
+        tool: The name of the application that was run.
+        duration: The wall-clock runtime in seconds.
+        profiler: The profiler that recorded calls made by the application.
+        status: The exit status of the application.
+
+    Returns:
+        A dictionary suitable for appending to the spool.
+    """
+
+    slurm_calls = keystone_calls = 0
+    for span in profiler.spans:
+        if span.category in SLURM_CATEGORIES:
+            slurm_calls += 1
+
+        elif span.category in KEYSTONE_CATEGORIES:
+            keystone_calls += 1
+
+    return {
+        'ts': int(time.time()),
+        'tool': tool,
+        'ms': round(duration * 1000, 1),
+        'slurm': slurm_calls,
+        'keystone': keystone_calls,
+        'status': status,
+    }
+
+
+def append_record(path: Path, record: dict, max_bytes: Optional[int] = None) -> None:
+    """Append a record to a spool file, rotating the file if it is too large.
+
+    Args:
+        path: The spool file path.
+        record: The record to append.
+        max_bytes: The size at which the spool file is rotated. Defaults to the configured value.
+    """
+
+    max_bytes = get_max_bytes() if max_bytes is None else max_bytes
+    line = json.dumps(record, separators=(',', ':')).encode() + b'\n'
+
+    try:
+        # A single write to a file opened in append mode is not interleaved with other writers
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_NONBLOCK | os.O_NOFOLLOW
+        fd = os.open(path, flags, 0o600)
+        try:
+            os.write(fd, line)
+            if 0 < max_bytes <= os.fstat(fd).st_size:
+                _rotate(path, fd)
+
+        finally:
+            os.close(fd)
+
+    except OSError:
+        pass
+
+
+def _rotate(path: Path, fd: int) -> None:
+    """Rotate a full spool file unless another process is already rotating it.
+
+    The rotation happens while an exclusive lock is held on the open file,
+    and only if `path` still refers to that file. Otherwise, a run that saw
+    the same full file could rotate the new, nearly empty spool file over the
+    rotated copy.
+
+    Args:
+        path: The spool file path.
+        fd: An open file descriptor for the spool file.
+    """
+
+    import fcntl
+
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    except BlockingIOError:
+        return  # Another process is rotating the file
+
+    if os.stat(path, follow_symlinks=False).st_ino == os.fstat(fd).st_ino:
+        os.replace(path, path.with_name(path.name + '.1'))
+
+
+def read_records(paths: Iterable[Union[str, Path]]) -> Iterator[dict]:
+    """Yield telemetry records from spool files, skipping malformed lines.
+
+    Args:
+        paths: The spool files to read.
+
+    Yields:
+        Decoded telemetry records.
+    """
+
+    for path in paths:
+        try:
+            with open(path, 'rb') as spool_file:
+                for line in spool_file:
+                    try:
+                        record = json.loads(line)
+
+                    except ValueError:
+                        continue
+
+                    if isinstance(record, dict) and 'tool' in record:
+                        yield record
+
+        except OSError:
+            continue
+
+
+def find_spool_files(spool_dir: Union[str, Path]) -> Iterator[Path]:
+    """Return all current and rotated spool files in a directory.
+
+    Args:
+        spool_dir: The spool directory.
+
+    Yields:
+        Spool file paths, with rotated files listed last.
+    """
+
+    spool_dir = Path(spool_dir)
+    yield from sorted(spool_dir.glob('telemetry-*.jsonl'))
+    yield from sorted(spool_dir.glob('telemetry-*.jsonl.1'))
@@ -0,0 +1,124 @@
+"""Measure how Slurm and Keystone output parsers scale with input size.
+
+Each benchmark parses synthetic output generated at increasing sizes and
+reports the median time per call. Command output is served by a replay
+backend, so no Slurm installation is required.
+
+Usage:
+    python -m benchmarks.bench_parsers [--repeat N] [--scale FACTOR]
+
+The `--scale` factor multiplies the default input sizes (e.g., 10,000 nodes).
+"""
+
+import statistics
+import sys
+import timeit
+from argparse import ArgumentParser
+from datetime import date
+from typing import Callable
+
+from apps.crc_idle import CrcIdle
+from apps.crc_job_stats import CrcJobStats
+from apps.utils.backends import ReplayBackend, set_backend
+from apps.utils.keystone import get_per_cluster_totals
+from apps.utils.system_info import Slurm
+from benchmarks.synthetic import (
+    allocation_requests,
+    cpu_sinfo_output,
+    gpu_sinfo_output,
+    scontrol_job_output,
+    sreport_output)
+
+
+def time_call(func: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Return the median and minimum runtime of a function in milliseconds.
+
+    Args:
+        func: The function to benchmark.
+        repeat: The number of measurements to take.
+
+    Returns:
+        A tuple with the median and minimum runtime.
+    """
+
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    timings = [elapsed / number * 1000 for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return statistics.median(timings), min(timings)
+
+
+def get_benchmarks(backend: ReplayBackend, scale: float) -> dict[str, Callable[[], object]]:
+    """Record synthetic command output and return the benchmarks using it.
+
+    Args:
+        backend: The backend to record command output into.
+        scale: Factor applied to the default input sizes.
+
+    Returns:
+        A dictionary mapping benchmark names to the functions being measured.
+    """
+
+    num_nodes = int(10_000 * scale)
+    num_users = int(1_000 * scale)
+    num_fields = int(1_000 * scale)
+    num_requests = int(5_000 * scale)
+
+    idle = CrcIdle()
+    backend.add_command(idle.get_sinfo_command('smp', 'part0'), cpu_sinfo_output(num_nodes, partition='part0'))
+    backend.add_command(idle.get_sinfo_command('gpu', 'part0'), gpu_sinfo_output(num_nodes, partition='part0'))
+    backend.add_command(idle.get_sinfo_command('smp'), cpu_sinfo_output(num_nodes, num_partitions=20))
+    backend.add_command(idle.get_sinfo_command('gpu'), gpu_sinfo_output(num_nodes, num_partitions=20))
+
+    job_stats = CrcJobStats()
+    job_stats.cluster, job_stats.job_id = 'smp', '1234567'
+    backend.add_command('scontrol -M smp show job 1234567', scontrol_job_output(num_fields))
+
+    start_date = allocation_requests(1)[0]['active']
+    sreport_cmd = (
+        f"sreport -nP cluster accountutilizationbyuser Cluster=smp Account=sam -t Hours "
+        f"Start={start_date} -T Billing Format=Proper,Used")
+    backend.add_command(sreport_cmd, sreport_output(num_users))
+
+    requests = allocation_requests(num_requests)
+
+    return {
+        f'CrcIdle.count_idle_resources cores ({num_nodes} nodes)':
+            lambda: idle.count_idle_resources('smp', 'part0'),
+        f'CrcIdle.count_idle_resources GPUs ({num_nodes} nodes)':
+            lambda: idle.count_idle_resources('gpu', 'part0'),
+        f'CrcIdle.count_idle_resources_by_partition cores ({num_nodes} nodes)':
+            lambda: idle.count_idle_resources_by_partition('smp'),
+        f'CrcIdle.count_idle_resources_by_partition GPUs ({num_nodes} nodes)':
+            lambda: idle.count_idle_resources_by_partition('gpu'),
+        f'CrcJobStats.get_job_info ({num_fields} fields)':
+            job_stats.get_job_info,
+        f'Slurm.get_cluster_usage_by_user ({num_users} users)':
+            lambda: Slurm.get_cluster_usage_by_user('sam', date.fromisoformat(start_date), 'smp'),
+        f'get_per_cluster_totals ({num_requests} requests)':
+            lambda: get_per_cluster_totals(requests),
+        f'get_per_cluster_totals per request ({num_requests} requests)':
+            lambda: get_per_cluster_totals(requests, per_request=True),
+    }
+
+
+def main() -> int:
+    """Run the benchmarks and print a summary table."""
+
+    parser = ArgumentParser(description='Measure parser performance on large synthetic inputs.')
+    parser.add_argument('--repeat', type=int, default=5, help='number of measurements per benchmark')
+    parser.add_argument('--scale', type=float, default=1, help='factor applied to the default input sizes')
+    args = parser.parse_args()
+
+    backend = ReplayBackend()
+    set_backend(backend)
+
+    print(f'{"BENCHMARK":<70} {"MEDIAN (ms)":>12} {"MIN (ms)":>10}')
+    for name, func in get_benchmarks(backend, args.scale).items():
+        median, minimum = time_call(func, args.repeat)
+        print(f'{name:<70} {median:>12.3f} {minimum:>10.3f}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Measure the import time of each wrapper application.
+
+Every console script registered in `pyproject.toml` is imported in a fresh
+interpreter using `python -X importtime`, and the cumulative import time of
+the application module is reported. Modules known to be expensive to import
+are flagged if they are loaded at startup.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat N] [--max-ms LIMIT]
+
+The script exits with a non-zero status if any application exceeds the
+`--max-ms` limit or imports a module listed in `HEAVY_MODULES`.
+"""
+
+import re
+import statistics
+import subprocess
+import sys
+import tomllib
+from argparse import ArgumentParser
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that should only be imported on the code paths that need them
+HEAVY_MODULES = ('keystone_client', 'prettytable', 'requests', 'importlib.metadata')
+
+IMPORT_TIME_PATTERN = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)')
+
+
+def get_entry_modules() -> dict[str, str]:
+    """Return a mapping of console script names to their application modules."""
+
+    with open(PROJECT_ROOT / 'pyproject.toml', 'rb') as file:
+        scripts = tomllib.load(file)['tool']['poetry']['scripts']
+
+    return {name: target.split(':')[0] for name, target in scripts.items()}
+
+
+def measure_import(module: str) -> tuple[float, set[str]]:
+    """Import a module in a fresh interpreter and return its import time.
+
+    Args:
+        module: The dotted module path to import.
+
+    Returns:
+        The cumulative import time in milliseconds and the set of imported modules.
+    """
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+
+    cumulative_us = 0
+    imported = set()
+    for match in IMPORT_TIME_PATTERN.finditer(result.stderr):
+        _, cumulative, _, name = match.groups()
+        imported.add(name)
+        if name == module:
+            cumulative_us = int(cumulative)
+
+    return cumulative_us / 1000, imported
+
+
+def main() -> int:
+    """Run the benchmark and print a summary table."""
+
+    parser = ArgumentParser(description='Measure import time for each wrapper application.')
+    parser.add_argument('--repeat', type=int, default=5, help='number of measurements per application')
+    parser.add_argument('--max-ms', type=float, help='fail if the median import time exceeds this limit')
+    args = parser.parse_args()
+
+    failed = False
+    print(f'{"APPLICATION":<20} {"MEDIAN (ms)":>12} {"MIN (ms)":>10}  HEAVY IMPORTS')
+    for name, module in get_entry_modules().items():
+        timings = []
+        heavy = set()
+        for _ in range(args.repeat):
+            elapsed, imported = measure_import(module)
+            timings.append(elapsed)
+            heavy |= imported.intersection(HEAVY_MODULES)
+
+        median = statistics.median(timings)
+        print(f'{name:<20} {median:>12.2f} {min(timings):>10.2f}  {", ".join(sorted(heavy)) or "-"}')
+
+        if heavy or (args.max_ms is not None and median > args.max_ms):
+            failed = True
+
+    return int(failed)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
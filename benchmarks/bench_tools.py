@@ -0,0 +1,92 @@
+"""Measure the end-to-end runtime of each wrapper application at scale.
+
+Applications are run against a synthetic backend that answers Slurm commands
+and Keystone requests with generated data after a configurable artificial
+latency. This makes runtimes reproducible on machines without Slurm and
+shows how each application scales with cluster size and command latency.
+
+Usage:
+    python -m benchmarks.bench_tools [--repeat N] [--latency SECONDS] [--nodes N] [--partitions N]
+
+On-disk caches are disabled while benchmarking so every run issues the full
+set of queries.
+"""
+
+import io
+import os
+import statistics
+import sys
+import time
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from typing import Type
+
+from apps.crc_idle import CrcIdle
+from apps.crc_show_config import CrcShowConfig
+from apps.crc_sus import CrcSus
+from apps.crc_usage import CrcUsage
+from apps.utils.backends import set_backend
+from apps.utils.cli import BaseParser
+from benchmarks.synthetic import SyntheticBackend
+
+# Applications and command line arguments to benchmark
+SCENARIOS: dict[str, tuple[Type[BaseParser], list[str]]] = {
+    'crc-idle': (CrcIdle, []),
+    'crc-idle --bulk': (CrcIdle, ['--bulk']),
+    'crc-show-config': (CrcShowConfig, ['-c', 'smp']),
+    'crc-sus (1 account)': (CrcSus, ['sam']),
+    'crc-sus (10 accounts)': (CrcSus, [f'account{index}' for index in range(10)]),
+    'crc-usage (1 account)': (CrcUsage, ['sam', '--no-cache']),
+}
+
+
+def run_scenario(app_class: Type[BaseParser], argv: list[str]) -> float:
+    """Run an application once and return its runtime in milliseconds.
+
+    Args:
+        app_class: The application to run.
+        argv: Command line arguments passed to the application.
+
+    Returns:
+        The wall-clock runtime, excluding construction of the argument parser.
+    """
+
+    app = app_class()
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        app.app_logic(app.parse_args(argv))
+
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    """Run the benchmarks and print a summary table."""
+
+    parser = ArgumentParser(description='Measure end-to-end runtime for each wrapper application.')
+    parser.add_argument('--repeat', type=int, default=5, help='number of measurements per application')
+    parser.add_argument('--latency', type=float, default=0.05, help='artificial latency per command in seconds')
+    parser.add_argument('--nodes', type=int, default=1000, help='number of nodes on each cluster')
+    parser.add_argument('--partitions', type=int, default=10, help='number of partitions on each cluster')
+    parser.add_argument('--users', type=int, default=100, help='number of users reporting usage per account')
+    args = parser.parse_args()
+
+    os.environ['CRC_WRAPPERS_CACHE_TTL'] = '0'
+    os.environ.setdefault('USER', 'benchmark')
+
+    set_backend(SyntheticBackend(
+        num_nodes=args.nodes,
+        num_partitions=args.partitions,
+        num_users=args.users,
+        latency=args.latency))
+
+    print(f'Latency: {args.latency * 1000:.0f} ms, nodes: {args.nodes}, partitions: {args.partitions}')
+    print(f'{"SCENARIO":<30} {"MEDIAN (ms)":>12} {"MIN (ms)":>10}')
+    for name, (app_class, argv) in SCENARIOS.items():
+        timings = [run_scenario(app_class, argv) for _ in range(args.repeat)]
+        print(f'{name:<30} {statistics.median(timings):>12.1f} {min(timings):>10.1f}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""Synthetic Slurm and Keystone data for benchmarking at scale.
+
+Generators in this module produce command output in the same formats as
+the Slurm utilities queried by the wrapper applications. The
+`SyntheticBackend` class serves this output (and matching Keystone API
+responses) through the pluggable backend interface, so wrapper applications
+can be run end to end on machines without Slurm or network access.
+"""
+
+import re
+from datetime import date, timedelta
+from typing import Any, Optional
+
+from apps.utils.backends import ReplayBackend
+
+GPU_CLUSTERS = ('gpu',)
+
+
+def get_node_partition(node: int, num_partitions: int) -> str:
+    """Return the partition a synthetic node belongs to."""
+
+    return f'part{node % num_partitions}'
+
+
+def get_node_indices(num_nodes: int, num_partitions: int, partition: Optional[str] = None) -> range:
+    """Return the indices of synthetic nodes, optionally limited to a single partition.
+
+    Args:
+        num_nodes: The total number of nodes on the cluster.
+        num_partitions: The number of partitions nodes are spread across.
+        partition: Only return nodes belonging to this partition.
+
+    Returns:
+        A range of node indices.
+    """
+
+    if partition is None:
+        return range(num_nodes)
+
+    return range(int(partition.removeprefix('part')), num_nodes, num_partitions)
+
+
+def cpu_sinfo_output(num_nodes: int, num_partitions: int = 1, partition: Optional[str] = None) -> str:
+    """Return `sinfo` output describing CPU nodes.
+
+    Output uses the `CrcIdle.cpu_format` format for single partition queries
+    and `CrcIdle.cpu_format_by_partition` otherwise.
+    """
+
+    states = ('idle', 'mix', 'alloc', 'drain', 'down*')
+    lines = []
+    for node in get_node_indices(num_nodes, num_partitions, partition):
+        allocated = node % 49
+        node_data = f'{allocated}/{48 - allocated}/0/48,{(node * 37) % 190000},{states[node % len(states)]}'
+        if partition is None:
+            lines.append(f'node{node:05d},{get_node_partition(node, num_partitions)},{node_data}')
+
+        else:
+            lines.append(f'node{node:05d},{node_data}')
+
+    return '\n'.join(lines)
+
+
+def gpu_sinfo_output(num_nodes: int, num_partitions: int = 1, partition: Optional[str] = None) -> str:
+    """Return `sinfo` output describing GPU nodes.
+
+    Output uses the `CrcIdle.gpu_format` format for single partition queries
+    and `CrcIdle.gpu_format_by_partition` otherwise.
+    """
+
+    states = ('idle', 'mix', 'alloc', 'drain')
+    lines = []
+    for node in get_node_indices(num_nodes, num_partitions, partition):
+        node_data = f'gpu:4_gpu:{node % 5}_{states[node % len(states)]}_{(node * 37) % 190000} '
+        if partition is None:
+            lines.append(f'gpu-n{node:05d}_{get_node_partition(node, num_partitions)}_{node_data}')
+
+        else:
+            lines.append(f'gpu-n{node:05d}_{node_data}')
+
+    return '\n'.join(lines)
+
+
+def scontrol_job_output(num_fields: int) -> str:
+    """Return `scontrol show job` output with the given number of extra fields.
+
+    Several values are file paths containing whitespace, which require
+    additional processing when parsed.
+    """
+
+    fields = [
+        'JobId=1234567', 'JobName=benchmark', 'SubmitTime=2024-01-01T00:00:00',
+        'EndTime=2024-01-02T00:00:00', 'RunTime=01:00:00', 'AllocTRES=cpu=48,mem=180G,node=1',
+        'Partition=smp', 'NodeList=node00001', 'Command=/ihome/user/my job/run script.sh',
+    ]
+
+    for index in range(num_fields):
+        value = f'/ihome/user/output dir {index}/file.txt' if index % 10 == 0 else f'value{index}'
+        fields.append(f'Field{index}={value}')
+
+    return ' '.join(fields)
+
+
+def sreport_output(num_users: int, cluster: Optional[str] = None, account: Optional[str] = None) -> str:
+    """Return `sreport cluster accountutilizationbyuser` output.
+
+    Output uses the `Proper,Used` format expected by `Slurm.get_cluster_usage_by_user`,
+    or the `Cluster,Account,Proper,Used` format used by `Slurm.get_bulk_usage_by_user`
+    when a cluster and account are given.
+    """
+
+    prefix = f'{cluster}|{account}|' if cluster and account else ''
+    usage = [(f'user{user:05d}', user * 3) for user in range(num_users)]
+
+    lines = [f'{prefix}|{sum(hours for _, hours in usage)}']
+    lines.extend(f'{prefix}{user}|{hours}' for user, hours in usage)
+    return '\n'.join(lines)
+
+
+def allocation_requests(num_requests: int, clusters: tuple[str, ...] = ('smp', 'mpi', 'htc', 'gpu')) -> list[dict]:
+    """Return Keystone allocation request records, each awarding service units on every cluster."""
+
+    start = (date.today() - timedelta(days=30)).isoformat()
+    expire = (date.today() + timedelta(days=335)).isoformat()
+    return [
+        {
+            'id': request,
+            'team': request,
+            'title': f'Request {request}',
+            'active': start,
+            'expire': expire,
+            '_allocations': [
+                {'_cluster': {'name': cluster}, 'awarded': 1000 * (index + 1), 'final': None}
+                for index, cluster in enumerate(clusters)
+            ],
+        }
+        for request in range(num_requests)
+    ]
+
+
+class SyntheticBackend(ReplayBackend):
+    """Serve synthetic Slurm command output and Keystone responses at a configurable scale.
+
+    Commands are answered by pattern, so any cluster, partition, or account
+    name queried by an application receives a plausible response.
+    """
+
+    def __init__(
+        self,
+        num_nodes: int = 1000,
+        num_partitions: int = 10,
+        num_users: int = 100,
+        clusters: tuple[str, ...] = ('smp', 'gpu', 'mpi', 'htc', 'teach'),
+        latency: float = 0
+    ) -> None:
+        """Create a synthetic backend.
+
+        Args:
+            num_nodes: The number of nodes on each cluster.
+            num_partitions: The number of partitions on each cluster.
+            num_users: The number of users reporting usage for each account.
+            clusters: The names of the clusters to simulate.
+            latency: Artificial latency in seconds added to every command and request.
+        """
+
+        super().__init__(latency=latency)
+        self.num_nodes = num_nodes
+        self.num_partitions = num_partitions
+        self.num_users = num_users
+        self.clusters = clusters
+
+    def _get_command_output(self, command: str) -> tuple[str, str]:
+        """Return synthetic output for a Slurm command.
+
+        Args:
+            command: The command to answer.
+
+        Returns:
+            A tuple of (stdout, stderr) output.
+        """
+
+        if command in self.commands:
+            return super()._get_command_output(command)
+
+        if command.startswith('squeue -u fakeuser -M all'):
+            return '\n'.join(f'CLUSTER: {cluster}\n' for cluster in self.clusters), ''
+
+        if match := re.fullmatch(r'scontrol -M (\S+) show partition', command):
+            return '\n'.join(f'PartitionName=part{index}\n' for index in range(self.num_partitions)), ''
+
+        if match := re.fullmatch(r'scontrol -M (\S+) show partition (\S+)', command):
+            partition = match.group(2)
+            first_node = get_node_indices(self.num_nodes, self.num_partitions, partition)[0]
+            return f'PartitionName={partition} Nodes=node{first_node:05d}', ''
+
+        if match := re.fullmatch(r'scontrol show hostname (\S+)', command):
+            return match.group(1), ''
+
+        if match := re.fullmatch(r'scontrol -M (\S+) show node (\S+)', command):
+            return f'NodeName={match.group(2)} CPUTot=48 RealMemory=190000 State=IDLE', ''
+
+        if match := re.match(r'sinfo -h -M (\S+)(?: -p (\S+))? -N', command):
+            cluster, partition = match.groups()
+            generator = gpu_sinfo_output if cluster in GPU_CLUSTERS else cpu_sinfo_output
+            return generator(self.num_nodes, self.num_partitions, partition), ''
+
+        if match := re.match(r'sacctmgr -n list account account=(\S+)', command):
+            return match.group(1), ''
+
+        if match := re.match(r'sreport -nP cluster accountutilizationbyuser Cluster=(\S+) Account=(\S+)', command):
+            clusters, accounts = (group.split(',') for group in match.groups())
+            output = (
+                sreport_output(self.num_users, cluster, account) for account in accounts for cluster in clusters)
+            return '\n'.join(output), ''
+
+        raise RuntimeError(f'No synthetic output for command: {command}')
+
+    def keystone_get(self, endpoint: str, params: Optional[dict] = None) -> tuple[int, Any]:
+        """Return a synthetic response to a Keystone request.
+
+        Args:
+            endpoint: The API endpoint to query.
+            params: Query parameters included in the request.
+
+        Returns:
+            A tuple of the HTTP status code and the decoded JSON response.
+        """
+
+        if self.latency:
+            import time
+
+            time.sleep(self.latency)
+
+        params = params or {}
+        if endpoint == '/users/teams/':
+            names = params['name__in'].split(',') if 'name__in' in params else [params['name']]
+            return 200, {'results': [{'id': index, 'name': name} for index, name in enumerate(names)]}
+
+        if endpoint == '/allocations/requests/' and 'expire__gt' in params:
+            team_ids = [int(team) for team in str(params.get('team__in', params.get('team'))).split(',')]
+            requests = allocation_requests(len(team_ids), self.clusters)
+            for request, team_id in zip(requests, team_ids):
+                request['team'] = team_id
+
+            return 200, {'results': requests}
+
+        return 200, {'results': []}
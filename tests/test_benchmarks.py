@@ -0,0 +1,40 @@
+"""Smoke tests for the benchmark suite."""
+
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from apps.utils.backends import ReplayBackend, set_backend
+from benchmarks.bench_parsers import get_benchmarks
+from benchmarks.bench_tools import run_scenario, SCENARIOS
+from benchmarks.synthetic import SyntheticBackend
+
+
+class ParserBenchmarks(TestCase):
+    """Test the parser benchmarks run against their synthetic inputs"""
+
+    def test_benchmarks_run(self) -> None:
+        """Test each benchmark executes without error at a small scale"""
+
+        backend = ReplayBackend()
+        set_backend(backend)
+        self.addCleanup(set_backend, None)
+
+        for name, func in get_benchmarks(backend, scale=0.01).items():
+            with self.subTest(benchmark=name):
+                func()
+
+
+@patch.dict(os.environ, {'CRC_WRAPPERS_CACHE_TTL': '0', 'CRC_WRAPPERS_KEYSTONE_CACHE_TTL': '0', 'USER': 'user'})
+class ToolBenchmarks(TestCase):
+    """Test every application runs end to end against the synthetic backend"""
+
+    def test_scenarios_run(self) -> None:
+        """Test each scenario completes without error"""
+
+        set_backend(SyntheticBackend(num_nodes=20, num_partitions=2, num_users=5))
+        self.addCleanup(set_backend, None)
+
+        for name, (app_class, argv) in SCENARIOS.items():
+            with self.subTest(scenario=name):
+                self.assertGreater(run_scenario(app_class, argv), 0)
@@ -5,6 +5,7 @@ from unittest import TestCase
 from unittest.mock import call, Mock, patch
 
 from apps.crc_idle import CrcIdle
+from apps.utils.snapshot import ClusterSnapshot, SnapshotWriter
 from apps.utils.system_info import Slurm
 
 
@@ -36,6 +37,18 @@ class ArgumentParsing(TestCase):
         self.assertFalse(args.gpu)
         self.assertFalse(args.teach)
 
+    def test_workers_parsing(self) -> None:
+        """Test the number of concurrent workers is parsed as an integer"""
+
+        app = CrcIdle()
+        args, unknown_args = app.parse_known_args([])
+        self.assertFalse(unknown_args)
+        self.assertEqual(CrcIdle.default_workers, args.workers)
+
+        args, unknown_args = app.parse_known_args(['-j', '3'])
+        self.assertFalse(unknown_args)
+        self.assertEqual(3, args.workers)
+
     @patch('apps.utils.Slurm.get_cluster_names', new=lambda: tuple(CrcIdle.cluster_types.keys()))
     def test_clusters_default_to_false(self) -> None:
         """Test all cluster flags default to a `False` value"""
@@ -132,6 +145,237 @@ class CountIdleResources(TestCase):
         expected = {0: {'count': 2, 'min_free_mem': 0, 'max_free_mem': 0}}
         self.assertEqual(expected, result)
 
+
+class NodeAggregation(TestCase):
+    """Test the shared column-wise aggregation of node status"""
+
+    def test_min_max_free_memory(self) -> None:
+        """Test nodes are counted per group with their free memory range"""
+
+        result = CrcIdle._aggregate_nodes(['a', 'a', 'a', 'b'], [4, 4, 4, 4], [300, 100, 200, 50])
+        self.assertEqual({
+            'a': {4: {'count': 3, 'min_free_mem': 100, 'max_free_mem': 300}},
+            'b': {4: {'count': 1, 'min_free_mem': 50, 'max_free_mem': 50}},
+        }, result)
+
+    def test_empty_output(self) -> None:
+        """Test empty `sinfo` output produces no statistics"""
+
+        self.assertEqual({}, CrcIdle._parse_cpu_output(''))
+        self.assertEqual({}, CrcIdle._parse_gpu_output_by_partition(''))
+
+    def test_non_numeric_free_memory(self) -> None:
+        """Test non-numeric free memory on an available node is treated as zero"""
+
+        result = CrcIdle._parse_cpu_output('node1,0/4/0/4,N/A,idle\nnode2,0/4/0/4,100,idle')
+        self.assertEqual({4: {'count': 2, 'min_free_mem': 0, 'max_free_mem': 100}}, result)
+
+    def test_malformed_record(self) -> None:
+        """Test records with an unexpected number of fields are rejected"""
+
+        with self.assertRaises(ValueError):
+            CrcIdle._parse_cpu_output('node1,0/4/0/4,100')
+
+    def test_dispatch_by_cluster_type(self) -> None:
+        """Test commands and parsers are selected by the cluster resource type"""
+
+        app = CrcIdle()
+        self.assertIn('--Format=', app.get_sinfo_command('gpu'))
+        self.assertIn('-o ', app.get_sinfo_command('smp'))
+
+        with patch.dict(app.cluster_types, {'smp': 'unknown'}), self.assertRaises(ValueError):
+            app.parse_idle_resources('smp', '')
+
+
+class CountIdleResourcesByPartition(TestCase):
+    """Test counting idle resources for all partitions with a single query"""
+
+    @patch('apps.utils.Shell.run_command')
+    def test_count_idle_cpu_resources(self, mock_run_command: Mock) -> None:
+        """Test nodes are grouped by partition, including nodes in multiple partitions"""
+
+        mock_run_command.return_value = (
+            "node1,smp*,2/4/0/6,3500,mix\n"
+            "node1,high-mem,2/4/0/6,3500,mix\n"
+            "node2,smp*,3/2/0/5,4000,mix\n"
+            "node3,smp*,0/8/0/8,N/A,drain"
+        )
+
+        result = CrcIdle().count_idle_resources_by_partition('smp')
+        expected = {
+            'smp': {
+                4: {'count': 1, 'min_free_mem': 3500, 'max_free_mem': 3500},
+                2: {'count': 1, 'min_free_mem': 4000, 'max_free_mem': 4000},
+                0: {'count': 1, 'min_free_mem': 0, 'max_free_mem': 0},
+            },
+            'high-mem': {4: {'count': 1, 'min_free_mem': 3500, 'max_free_mem': 3500}},
+        }
+
+        self.assertEqual(expected, result)
+        self.assertEqual(1, mock_run_command.call_count)
+        self.assertNotIn('-p', mock_run_command.call_args.args[0].split())
+
+    @patch('apps.utils.Shell.run_command')
+    def test_count_idle_gpu_resources(self, mock_run_command: Mock) -> None:
+        """Test GPU nodes are grouped by partition names containing underscores"""
+
+        mock_run_command.return_value = (
+            "node1_a100_4_2_idle_3500 \n"
+            "node2_a100_nvlink_4_4_alloc_4000 \n"
+            "node3_a100_nvlink_4_0_drain_N/A "
+        )
+
+        result = CrcIdle().count_idle_resources_by_partition('gpu')
+        expected = {
+            'a100': {2: {'count': 1, 'min_free_mem': 3500, 'max_free_mem': 3500}},
+            'a100_nvlink': {0: {'count': 2, 'min_free_mem': 0, 'max_free_mem': 4000}},
+        }
+
+        self.assertEqual(expected, result)
+
+    @patch('apps.utils.Shell.run_command')
+    def test_cluster_header_ignored(self, mock_run_command: Mock) -> None:
+        """Test ``CLUSTER:`` headers in multi-cluster output are skipped"""
+
+        mock_run_command.return_value = "CLUSTER: smp\nnode1,smp,2/4/0/6,3500,mix"
+        result = CrcIdle().count_idle_resources_by_partition('smp')
+        self.assertEqual({'smp': {4: {'count': 1, 'min_free_mem': 3500, 'max_free_mem': 3500}}}, result)
+
+
+class AppLogic(TestCase):
+    """Test the concurrent execution of partition queries"""
+
+    @patch('apps.utils.Slurm.get_partition_names', new=lambda cluster: {'p3', 'p1', 'p2'})
+    @patch.object(CrcIdle, 'print_partition_summary')
+    @patch('apps.utils.Shell.run_commands')
+    def test_summaries_printed_in_order(self, mock_run_commands: Mock, mock_print: Mock) -> None:
+        """Test partition summaries are printed in a deterministic order"""
+
+        mock_run_commands.side_effect = lambda commands, max_concurrency: ['' for _ in commands]
+
+        app = CrcIdle()
+        app.app_logic(app.parse_args(['--smp', '--gpu', '-j', '4']))
+
+        printed = [c.args[:2] for c in mock_print.call_args_list]
+        expected = [(cluster, partition) for cluster in ('smp', 'gpu') for partition in ('p1', 'p2', 'p3')]
+        self.assertEqual(expected, printed)
+
+    @patch('apps.utils.Slurm.get_partition_names', new=lambda cluster: {'p1'})
+    @patch.object(CrcIdle, 'print_partition_summary')
+    @patch('apps.utils.Shell.run_commands')
+    def test_queries_issued_in_one_batch(self, mock_run_commands: Mock, mock_print: Mock) -> None:
+        """Test all partition queries are submitted together with the requested concurrency"""
+
+        mock_run_commands.return_value = ['node1,0/4/0/4,3500,idle', '']
+
+        app = CrcIdle()
+        app.app_logic(app.parse_args(['--smp', '--mpi', '-j', '4']))
+
+        mock_run_commands.assert_called_once_with(
+            [app.get_sinfo_command('smp', 'p1'), app.get_sinfo_command('mpi', 'p1')], max_concurrency=4)
+        mock_print.assert_has_calls([
+            call('smp', 'p1', {4: {'count': 1, 'min_free_mem': 3500, 'max_free_mem': 3500}}),
+            call('mpi', 'p1', {}),
+        ])
+
+    @patch('apps.utils.Slurm.get_partition_names', new=lambda cluster: {'p2', 'p1'})
+    @patch.object(CrcIdle, 'print_partition_summary')
+    @patch('apps.utils.Shell.run_commands')
+    def test_bulk_mode(self, mock_run_commands: Mock, mock_print: Mock) -> None:
+        """Test bulk mode queries each cluster once and prints empty partitions"""
+
+        mock_run_commands.return_value = ['node1,p1*,0/1/0/1,0,idle', 'node2,p1,0/1/0/1,0,idle']
+
+        app = CrcIdle()
+        app.app_logic(app.parse_args(['--smp', '--mpi', '--bulk']))
+
+        mock_run_commands.assert_called_once_with(
+            [app.get_sinfo_command('smp'), app.get_sinfo_command('mpi')], max_concurrency=CrcIdle.default_workers)
+
+        idle = {1: {'count': 1, 'min_free_mem': 0, 'max_free_mem': 0}}
+        mock_print.assert_has_calls([
+            call('smp', 'p1', idle),
+            call('smp', 'p2', {}),
+            call('mpi', 'p1', idle),
+            call('mpi', 'p2', {}),
+        ], any_order=False)
+
+    def test_error_on_invalid_workers(self) -> None:
+        """Test an error is raised for a non-positive number of workers"""
+
+        app = CrcIdle()
+        with self.assertRaises(SystemExit):
+            app.app_logic(app.parse_args(['-j', '0']))
+
+
+class JsonOutput(TestCase):
+    """Test idle resources are counted from structured JSON output"""
+
+    def test_parse_cpu_nodes(self) -> None:
+        """Test idle cores are counted per partition and unavailable nodes are reported as empty"""
+
+        data = {'nodes': [
+            {'partitions': ['p1', 'p2'], 'state': ['MIXED'], 'cpus': 48, 'alloc_cpus': 16,
+             'free_mem': {'set': True, 'number': 2048}},
+            {'partitions': ['p1'], 'state': 'DOWN', 'cpus': 48, 'alloc_cpus': 0, 'free_memory': 4096},
+        ]}
+
+        result = CrcIdle().parse_idle_resources_json('smp', data)
+        self.assertEqual({
+            'p1': {32: {'count': 1, 'min_free_mem': 2048, 'max_free_mem': 2048},
+                   0: {'count': 1, 'min_free_mem': 0, 'max_free_mem': 0}},
+            'p2': {32: {'count': 1, 'min_free_mem': 2048, 'max_free_mem': 2048}},
+        }, result)
+
+    def test_unavailable_cpus_excluded(self) -> None:
+        """Test cores unavailable to jobs are not counted as idle, matching the text parser"""
+
+        data = {'nodes': [
+            {'partitions': ['p1'], 'state': 'MIXED', 'cpus': 48, 'effective_cpus': 46, 'alloc_cpus': 16, 'free_mem': 0},
+            {'partitions': ['p2'], 'state': 'MIXED', 'cpus': 48, 'alloc_cpus': 16, 'alloc_idle_cpus': 28,
+             'free_mem': 0},
+        ]}
+
+        result = CrcIdle().parse_idle_resources_json('smp', data)
+        self.assertEqual([30], list(result['p1']))
+        self.assertEqual([28], list(result['p2']))
+
+    def test_parse_gpu_nodes(self) -> None:
+        """Test idle GPUs are counted from typed and untyped GRES strings"""
+
+        data = {'nodes': [
+            {'partitions': ['a100'], 'state': ['IDLE'], 'free_mem': 100,
+             'gres': 'gpu:a100:4(S:0-1)', 'gres_used': 'gpu:a100:1(IDX:0)'},
+            {'partitions': ['a100'], 'state': ['IDLE', 'DRAIN'], 'free_mem': 100,
+             'gres': 'gpu:4', 'gres_used': 'gpu:0'},
+        ]}
+
+        result = CrcIdle().parse_idle_resources_json('gpu', data)
+        self.assertEqual({'a100': {
+            3: {'count': 1, 'min_free_mem': 100, 'max_free_mem': 100},
+            0: {'count': 1, 'min_free_mem': 0, 'max_free_mem': 0},
+        }}, result)
+
+    @patch.dict('os.environ', {'CRC_WRAPPERS_SLURM_JSON': '1'})
+    @patch('apps.utils.Slurm.get_partition_names', new=lambda cluster: {'p1'})
+    @patch.object(CrcIdle, 'print_partition_summary')
+    @patch('apps.utils.Shell.run_commands')
+    def test_text_fallback(self, mock_run_commands: Mock, mock_print: Mock) -> None:
+        """Test clusters without JSON support are queried using text output"""
+
+        json_output = '{"nodes": [{"partitions": ["p1"], "state": "IDLE", "cpus": 4, "alloc_cpus": 0, "free_mem": 0}]}'
+        mock_run_commands.side_effect = [[json_output, 'invalid option --json'], ['node1,0/2/0/2,0,idle']]
+
+        app = CrcIdle()
+        app.app_logic(app.parse_args(['--smp', '--mpi']))
+
+        mock_run_commands.assert_called_with([app.get_sinfo_command('mpi', 'p1')], max_concurrency=app.default_workers)
+        mock_print.assert_has_calls([
+            call('smp', 'p1', {4: {'count': 1, 'min_free_mem': 0, 'max_free_mem': 0}}),
+            call('mpi', 'p1', {2: {'count': 1, 'min_free_mem': 0, 'max_free_mem': 0}}),
+        ])
+
+
 class PrintPartitionSummary(TestCase):
     """Test the printing of a partition summary"""
 
@@ -178,3 +422,44 @@ class PrintPartitionSummary(TestCase):
             call(' No idle resources'),
             call('')
         ], any_order=False)
+
+
+class SnapshotSummaries(TestCase):
+    """Test clusters included in a snapshot are summarized without querying Slurm"""
+
+    def setUp(self) -> None:
+        """Build a snapshot of the smp cluster from text ``sinfo`` output"""
+
+        self.output = 'node1,p1*,0/4/0/4,3500,idle\nnode2,p1,0/4/0/4,1200,drain\nnode3,p2,2/2/0/4,800,mix'
+        writer = SnapshotWriter()
+        writer.add_cluster('smp', CrcIdle().get_node_columns('smp', self.output), '', [('p1', ''), ('p2', '')])
+        self.snapshot = ClusterSnapshot(writer.to_bytes())
+
+    def test_matches_text_parser(self) -> None:
+        """Test snapshot statistics match those parsed from the original output"""
+
+        app = CrcIdle()
+        self.assertEqual(
+            app.parse_idle_resources_by_partition('smp', self.output),
+            app.parse_idle_resources_snapshot('smp', self.snapshot))
+
+    @patch('apps.utils.Slurm.get_partition_names', new=lambda cluster: {'p1'})
+    @patch.object(CrcIdle, 'print_partition_summary')
+    @patch('apps.utils.Shell.run_commands', return_value=[''])
+    def test_live_queries_for_other_clusters(self, mock_run_commands: Mock, mock_print: Mock) -> None:
+        """Test only clusters missing from the snapshot are queried"""
+
+        app = CrcIdle()
+        with patch('apps.crc_idle.load_snapshot', return_value=self.snapshot):
+            app.app_logic(app.parse_args(['--smp', '--mpi']))
+
+        mock_run_commands.assert_called_once_with(
+            [app.get_sinfo_command('mpi', 'p1')], max_concurrency=CrcIdle.default_workers)
+
+        mock_print.assert_has_calls([
+            call('smp', 'p1', {
+                4: {'count': 1, 'min_free_mem': 3500, 'max_free_mem': 3500},
+                0: {'count': 1, 'min_free_mem': 0, 'max_free_mem': 0}}),
+            call('smp', 'p2', {2: {'count': 1, 'min_free_mem': 800, 'max_free_mem': 800}}),
+            call('mpi', 'p1', {}),
+        ])
@@ -1,6 +1,7 @@
 """Tests for the ``crc-scancel`` application."""
 
 from unittest import TestCase
+from unittest.mock import call, Mock, patch
 
 from apps.crc_scancel import CrcScancel
 
@@ -19,4 +20,164 @@ class ArgumentParsing(TestCase):
         args, unknown_args = CrcScancel().parse_known_args([job_id])
 
         self.assertFalse(unknown_args)
-        self.assertEqual(job_id, args.job_id)
+        self.assertEqual([job_id], args.job_ids)
+
+    def test_multiple_job_selections(self) -> None:
+        """Test job IDs, array task IDs, and ID ranges are accepted together"""
+
+        args = CrcScancel().parse_args(['1234', '1234_5', '1200-1250'])
+        self.assertEqual(['1234', '1234_5', '1200-1250'], args.job_ids)
+
+    def test_invalid_job_ids_rejected(self) -> None:
+        """Test malformed job IDs and reversed ranges raise an error"""
+
+        for value in ('abc', '12-', '1250-1200'):
+            with self.subTest(value=value), self.assertRaises(SystemExit):
+                CrcScancel().parse_args([value])
+
+
+class JobIdMatches(TestCase):
+    """Test the matching of reported job IDs against job selections"""
+
+    def test_job_id(self) -> None:
+        """Test a job ID selects the job and its array tasks but not other jobs"""
+
+        self.assertTrue(CrcScancel.job_id_matches('1234', '1234'))
+        self.assertTrue(CrcScancel.job_id_matches('1234', '1234_7'))
+        self.assertTrue(CrcScancel.job_id_matches('1234', '1234_[1-10]'))
+        self.assertFalse(CrcScancel.job_id_matches('1234', '12345'))
+
+    def test_array_task(self) -> None:
+        """Test an array task ID only selects that task"""
+
+        self.assertTrue(CrcScancel.job_id_matches('1234_7', '1234_7'))
+        self.assertFalse(CrcScancel.job_id_matches('1234_7', '1234_8'))
+
+    def test_range(self) -> None:
+        """Test an ID range selects jobs with IDs inside the inclusive range"""
+
+        self.assertTrue(CrcScancel.job_id_matches('1200-1250', '1200'))
+        self.assertTrue(CrcScancel.job_id_matches('1200-1250', '1250_3'))
+        self.assertFalse(CrcScancel.job_id_matches('1200-1250', '1251'))
+
+    def test_heterogeneous_job(self) -> None:
+        """Test job IDs and ranges select every component of a heterogeneous job"""
+
+        self.assertTrue(CrcScancel.job_id_matches('1234', '1234+0'))
+        self.assertTrue(CrcScancel.job_id_matches('1234', '1234+1'))
+        self.assertTrue(CrcScancel.job_id_matches('1200-1250', '1234+1'))
+        self.assertFalse(CrcScancel.job_id_matches('123', '1234+0'))
+        self.assertFalse(CrcScancel.job_id_matches('1234_0', '1234+0'))
+
+
+class FindJobs(TestCase):
+    """Test the lookup of jobs across clusters"""
+
+    output = (
+        'CLUSTER: gpu\n'
+        '1300|PENDING|a100|train model\n'
+        'CLUSTER: smp\n'
+        '1234|RUNNING|smp|sim\n'
+        '1235_1|RUNNING|smp|sim|v2\n'
+        '1400|PENDING|high-mem|post\n'
+    )
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_all_clusters_queried_at_once(self, mock_run_command: Mock) -> None:
+        """Test every cluster is searched using a single ``squeue`` call"""
+
+        mock_run_command.return_value = self.output
+        jobs = CrcScancel().find_jobs(['1234', '1300'])
+
+        mock_run_command.assert_called_once()
+        self.assertIn('-M all', mock_run_command.call_args.args[0])
+        self.assertEqual(['1300'], [job['id'] for job in jobs['gpu']])
+        self.assertEqual(['1234'], [job['id'] for job in jobs['smp']])
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_pending_array_tasks_expanded(self, mock_run_command: Mock) -> None:
+        """Test array tasks are listed individually so pending tasks can be selected by task ID"""
+
+        mock_run_command.return_value = 'CLUSTER: smp\n1500_7|PENDING|smp|array\n1500_8|PENDING|smp|array\n'
+        jobs = CrcScancel().find_jobs(['1500_7'])
+
+        self.assertIn(' -r ', mock_run_command.call_args.args[0])
+        self.assertEqual({'smp': [{'id': '1500_7', 'name': 'array', 'state': 'PENDING', 'partition': 'smp'}]}, jobs)
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_filters_passed_to_squeue(self, mock_run_command: Mock) -> None:
+        """Test name, state, and partition filters are applied by ``squeue``"""
+
+        mock_run_command.return_value = self.output
+        jobs = CrcScancel().find_jobs(name='my job', state='PENDING', partition='smp')
+
+        command = mock_run_command.call_args.args[0]
+        self.assertIn("-n 'my job'", command)
+        self.assertIn('-t PENDING', command)
+        self.assertIn('-p smp', command)
+        self.assertEqual(4, sum(len(cluster_jobs) for cluster_jobs in jobs.values()))
+
+    @patch('apps.utils.system_info.Shell.run_command', return_value=output)
+    def test_job_names_with_separator(self, _: Mock) -> None:
+        """Test job names containing the field separator are parsed intact"""
+
+        jobs = CrcScancel().find_jobs(['1235'])
+        self.assertEqual({'id': '1235_1', 'state': 'RUNNING', 'partition': 'smp', 'name': 'sim|v2'}, jobs['smp'][0])
+
+
+class GetClusterForJobId(TestCase):
+    """Test the lookup of the cluster a job is running on"""
+
+    @patch('apps.utils.system_info.Shell.run_command', return_value='CLUSTER: gpu\n\nCLUSTER: smp\n1234|RUNNING|smp|sim\n')
+    def test_job_found(self, _: Mock) -> None:
+        """Test the cluster reporting the job is returned"""
+
+        self.assertEqual('smp', CrcScancel().get_cluster_for_job_id('1234'))
+
+    @patch('apps.utils.system_info.Shell.run_command', return_value='CLUSTER: smp\n')
+    def test_job_not_found(self, _: Mock) -> None:
+        """Test None is returned when no cluster reports the job"""
+
+        self.assertIsNone(CrcScancel().get_cluster_for_job_id('1234'))
+
+
+class AppLogic(TestCase):
+    """Test the confirmation and cancellation of selected jobs"""
+
+    output = 'CLUSTER: gpu\n1300|PENDING|a100|a\nCLUSTER: smp\n1234|RUNNING|smp|b\n1235|RUNNING|smp|c\n'
+
+    @patch('builtins.print')
+    @patch('apps.utils.system_info.Shell.readchar', return_value='y')
+    @patch('apps.utils.system_info.Shell.run_command', return_value=output)
+    def test_one_scancel_per_cluster(self, mock_run_command: Mock, _: Mock, __: Mock) -> None:
+        """Test confirmed jobs are cancelled with a single batched call per cluster"""
+
+        CrcScancel.execute(['1200-1300'])
+        self.assertEqual(
+            [call('scancel -M gpu 1300'), call('scancel -M smp 1234 1235')],
+            mock_run_command.call_args_list[1:])
+
+    @patch('builtins.print')
+    @patch('apps.utils.system_info.Shell.readchar', return_value='n')
+    @patch('apps.utils.system_info.Shell.run_command', return_value=output)
+    def test_declined(self, mock_run_command: Mock, _: Mock, __: Mock) -> None:
+        """Test nothing is cancelled when the confirmation is declined"""
+
+        CrcScancel.execute(['1234'])
+        mock_run_command.assert_called_once()
+
+    @patch('apps.utils.system_info.Shell.run_command', return_value=output)
+    def test_error_without_selection(self, mock_run_command: Mock) -> None:
+        """Test an error is raised when no job IDs or filters are given"""
+
+        with self.assertRaises(SystemExit):
+            CrcScancel.execute([])
+
+        mock_run_command.assert_not_called()
+
+    @patch('apps.utils.system_info.Shell.run_command', return_value='CLUSTER: smp\n')
+    def test_error_when_no_jobs_match(self, _: Mock) -> None:
+        """Test an error is raised when no jobs match the selection"""
+
+        with self.assertRaises(SystemExit):
+            CrcScancel.execute(['1234'])
@@ -1,8 +1,10 @@
 """Tests for the ``crc-scontrol`` application."""
 
 from unittest import TestCase
+from unittest.mock import call, Mock, patch
 
 from apps.crc_show_config import CrcShowConfig
+from apps.utils.snapshot import ClusterSnapshot, SnapshotWriter
 
 
 class ArgumentParsing(TestCase):
@@ -19,3 +21,64 @@ class ArgumentParsing(TestCase):
 
         args, _ = CrcShowConfig().parse_known_args(['-c', 'cluster'])
         self.assertFalse(args.print_command)
+
+
+class GetPartitionInfo(TestCase):
+    """Test partition settings are parsed from ``scontrol`` output"""
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_values_containing_equals_signs(self, mock_run_command: Mock) -> None:
+        """Test settings whose values contain ``=`` (e.g., ``TRES``) are parsed"""
+
+        mock_run_command.return_value = 'PartitionName=p1\n   Nodes=n[1-2] TRES=cpu=8,mem=16G,node=2'
+        info = CrcShowConfig.get_partition_info('smp', 'p1')
+        self.assertEqual({'PartitionName': 'p1', 'Nodes': 'n[1-2]', 'TRES': 'cpu=8,mem=16G,node=2'}, info)
+
+
+class SnapshotConfig(TestCase):
+    """Test configuration is printed from a snapshot without querying Slurm"""
+
+    def setUp(self) -> None:
+        """Build a snapshot of the smp cluster"""
+
+        nodes = {'node': ['n1'], 'partition': ['p1'], 'state': ['idle'], 'gres': [''], 'idle': [4], 'free_mem': [0]}
+        writer = SnapshotWriter()
+        writer.add_cluster('smp', nodes, 'PartitionName=p1 Nodes=n1', [('p1', 'NodeName=n1 CPUTot=4'), ('empty', '')])
+        patcher = patch('apps.crc_show_config.load_snapshot', return_value=ClusterSnapshot(writer.to_bytes()))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('builtins.print')
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_partition_and_node_config(self, mock_run_command: Mock, mock_print: Mock) -> None:
+        """Test cluster and node configuration are read from the snapshot"""
+
+        app = CrcShowConfig()
+        app.app_logic(app.parse_args(['-c', 'smp']))
+        app.app_logic(app.parse_args(['-c', 'smp', '-p', 'p1']))
+
+        mock_run_command.assert_not_called()
+        mock_print.assert_has_calls([call('PartitionName=p1 Nodes=n1'), call('NodeName=n1 CPUTot=4')])
+
+    def test_unknown_partition(self) -> None:
+        """Test an error is raised for partitions missing from the snapshot"""
+
+        app = CrcShowConfig()
+        with self.assertRaises(SystemExit):
+            app.app_logic(app.parse_args(['-c', 'smp', '-p', 'p2']))
+
+    def test_partition_without_nodes(self) -> None:
+        """Test a distinct error is raised for known partitions without nodes"""
+
+        app = CrcShowConfig()
+        with self.assertRaisesRegex(SystemExit, 'has no nodes'):
+            app.app_logic(app.parse_args(['-c', 'smp', '-p', 'empty']))
+
+    @patch('builtins.print')
+    @patch('apps.utils.system_info.Shell.run_command', return_value='PartitionName=p1')
+    def test_other_clusters_queried(self, mock_run_command: Mock, _: Mock) -> None:
+        """Test clusters missing from the snapshot are queried directly"""
+
+        app = CrcShowConfig()
+        app.app_logic(app.parse_args(['-c', 'mpi']))
+        mock_run_command.assert_called_once_with('scontrol -M mpi show partition')
@@ -0,0 +1,80 @@
+"""Tests for the ``crc-snapshot`` application."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from apps.crc_idle import CrcIdle
+from apps.crc_snapshot import CrcSnapshot
+from apps.utils.backends import ReplayBackend, set_backend
+from apps.utils.snapshot import read_snapshot
+
+
+class PublishSnapshot(TestCase):
+    """Test cluster state is collected from Slurm and published"""
+
+    def setUp(self) -> None:
+        """Install a replay backend with recorded output for the smp and mpi clusters"""
+
+        app = CrcIdle()
+        backend = ReplayBackend()
+        backend.add_command(app.get_sinfo_command('smp'), 'node1,p1*,0/4/0/4,3500,idle\nnode2,p1,2/2/0/4,800,mix')
+        backend.add_command(app.get_sinfo_command('mpi'), '')
+        backend.add_command(
+            'scontrol -M smp show partition',
+            'PartitionName=p1\n   Nodes=node[1-2] TRES=cpu=8,node=2\n\nPartitionName=empty\n   Nodes=(null)\n')
+        backend.add_command('scontrol -M mpi show partition', '')
+        backend.add_command('scontrol -M smp show partition p1', 'PartitionName=p1 Nodes=node[1-2] TRES=cpu=8,node=2')
+        backend.add_command('scontrol -M smp show partition empty', 'PartitionName=empty Nodes=(null)')
+        backend.add_command('scontrol show hostname (null)', '')
+        backend.add_command('scontrol show hostname node[1-2]', 'node1\nnode2')
+        backend.add_command('scontrol -M smp show node node1', 'NodeName=node1 CPUTot=4')
+        set_backend(backend)
+        self.addCleanup(set_backend, None)
+        self.backend = backend
+
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / 'state.snapshot'
+
+    @patch('builtins.print')
+    def test_snapshot_published(self, _: Mock) -> None:
+        """Test clusters reporting nodes are published and others are omitted"""
+
+        app = CrcSnapshot()
+        app.app_logic(app.parse_args([str(self.path), '-c', 'smp', 'mpi']))
+
+        snapshot = read_snapshot(self.path)
+        self.assertEqual(('smp',), snapshot.clusters)
+        self.assertEqual(['p1', 'empty'], snapshot.partition_names('smp'))
+        self.assertEqual('NodeName=node1 CPUTot=4', snapshot.node_config('smp', 'p1'))
+        self.assertIsNone(snapshot.node_config('smp', 'empty'))
+        self.assertEqual([4, 2], snapshot.node_columns('smp')['idle'].tolist())
+
+    @patch('sys.stderr')
+    def test_failed_cluster_skipped(self, mock_stderr: Mock) -> None:
+        """Test a cluster failing to respond is skipped without affecting other clusters"""
+
+        def run_command(command: str) -> tuple[str, str]:
+            if '-M mpi' in command:
+                raise TimeoutError(f'Command did not finish in time: {command}')
+
+            return original_run_command(command)
+
+        original_run_command = self.backend.run_command
+        with patch.object(self.backend, 'run_command', side_effect=run_command):
+            writer = CrcSnapshot().collect_snapshot(['mpi', 'smp'])
+
+        self.assertEqual(('smp',), writer.clusters)
+        self.assertIn('Skipping cluster mpi', ''.join(call.args[0] for call in mock_stderr.write.call_args_list))
+
+    @patch('builtins.print')
+    def test_error_when_nothing_collected(self, _: Mock) -> None:
+        """Test the existing snapshot is left unchanged when no cluster state is collected"""
+
+        app = CrcSnapshot()
+        with self.assertRaises(SystemExit):
+            app.app_logic(app.parse_args([str(self.path), '-c', 'mpi']))
+
+        self.assertFalse(self.path.exists())
@@ -130,3 +130,103 @@ class CommandExecution(TestCase):
         app.execute(cli_args)
         self.assertEqual(mock_stdout.getvalue().strip(), command)
         mock_shell.assert_not_called()
+
+
+class WatchMode(TestCase):
+    """Test streaming and redrawing output in watch mode"""
+
+    header = f'{"JOBID":>8} {"PAR":>3} {"NAME":>35} {"ST":>2} {"TIME":>12} {"NODES":>6} {"CPUS":>4}'
+    job = f'{"1234":>8} {"smp":>3} {"sim":>35} {{state:>2}} {{time:>12}} {"1":>6} {"4":>4}'
+    report = 'Fri Oct 17 10:00:{second:02d} 2026\n' + header + '\n' + job + '\n'
+
+    def test_watch_interval_parsed(self) -> None:
+        """Test a custom refresh interval may be given to ``--watch``"""
+
+        args = CrcSqueue().parse_args(['--watch', '30'])
+        self.assertEqual(30, args.watch)
+
+    def test_signature_ignores_elapsed_time(self) -> None:
+        """Test reports differing only in elapsed time and timestamp have the same signature"""
+
+        output_format = CrcSqueue.output_format_user
+        first = CrcSqueue.get_change_signature(self.report.format(second=0, state='R', time='1:00'), output_format)
+        second = CrcSqueue.get_change_signature(self.report.format(second=10, state='R', time='1:10'), output_format)
+        self.assertEqual(first, second)
+
+        changed = self.report.format(second=10, state='CG', time='1:10')
+        self.assertNotEqual(first, CrcSqueue.get_change_signature(changed, output_format))
+
+    def test_interval_backoff(self) -> None:
+        """Test the interval doubles after repeated unchanged reports and resets on change"""
+
+        app = CrcSqueue()
+        self.assertEqual(10, app.get_next_interval(10, 1, base=10, maximum=60))
+        self.assertEqual(20, app.get_next_interval(10, 3, base=10, maximum=60))
+        self.assertEqual(60, app.get_next_interval(40, 3, base=10, maximum=60))
+        self.assertEqual(10, app.get_next_interval(40, 0, base=10, maximum=60))
+
+    @patch('apps.crc_squeue.CrcSqueue.redraw')
+    @patch('apps.utils.system_info.Shell.stream_output')
+    def test_single_process_restarted_on_backoff(self, mock_stream: Mock, mock_redraw: Mock) -> None:
+        """Test ``squeue`` is only restarted when the refresh interval changes"""
+
+        unchanged_reports = [
+            self.report.format(second=second, state='R', time=f'1:{second:02d}') for second in range(4)]
+        generators = [(report for report in unchanged_reports), (report for report in unchanged_reports[:1])]
+        mock_stream.side_effect = generators
+
+        CrcSqueue.execute(['--watch', '5'])
+        commands = [call.args[0] for call in mock_stream.call_args_list]
+        self.assertEqual(2, len(commands))
+        self.assertTrue(commands[0].endswith('--iterate=5'))
+        self.assertTrue(commands[1].endswith('--iterate=10'))
+        self.assertEqual(5, mock_redraw.call_count)
+
+
+    @patch('apps.crc_squeue.CrcSqueue.redraw')
+    @patch('apps.utils.system_info.Shell.stream_output')
+    def test_partial_report_replaced(self, mock_stream: Mock, mock_redraw: Mock) -> None:
+        """Test a report streamed again in full replaces its partial version when checking for changes"""
+
+        reports = [self.report.format(second=second, state='R', time='1:00') for second in range(4)]
+        partial = reports[1].rsplit('\n', 2)[0] + '\n'
+        mock_stream.side_effect = [(report for report in [reports[0], partial, *reports[1:]]), iter(())]
+
+        CrcSqueue.execute(['--watch', '5'])
+        self.assertEqual(2, mock_stream.call_count)
+        self.assertEqual(5, mock_redraw.call_count)
+
+    @patch('apps.crc_squeue.CrcSqueue.watch')
+    def test_zero_interval_rejected(self, mock_watch: Mock) -> None:
+        """Test a zero refresh interval is reported as an error"""
+
+        with self.assertRaises(SystemExit), patch('sys.stderr'):
+            CrcSqueue.execute(['--watch', '0'])
+
+        mock_watch.assert_not_called()
+
+
+class SnapshotBroker(TestCase):
+    """Test only listings of all users' jobs are served from a snapshot broker"""
+
+    @patch('builtins.print')
+    @patch('apps.utils.system_info.Shell.run_command', return_value='jobs')
+    @patch('apps.utils.system_info.Shell.run_snapshot_command', return_value='all jobs')
+    def test_all_jobs_use_broker(self, mock_snapshot: Mock, mock_run: Mock, mock_print: Mock) -> None:
+        """Test listings of all users' jobs are requested from the broker"""
+
+        CrcSqueue.execute(['--all'])
+        mock_snapshot.assert_called_once()
+        mock_run.assert_not_called()
+        mock_print.assert_called_once_with('all jobs')
+
+    @patch('builtins.print')
+    @patch('apps.utils.system_info.Shell.run_command', return_value='jobs')
+    @patch('apps.utils.system_info.Shell.run_snapshot_command', return_value='all jobs')
+    def test_user_jobs_queried_directly(self, mock_snapshot: Mock, mock_run: Mock, mock_print: Mock) -> None:
+        """Test the current user's jobs are queried as that user, respecting job visibility restrictions"""
+
+        CrcSqueue.execute(['--cluster', 'smp'])
+        mock_snapshot.assert_not_called()
+        self.assertIn(f'-u {getpass.getuser()}', mock_run.call_args.args[0])
+        mock_print.assert_called_once_with('jobs')
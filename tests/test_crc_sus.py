@@ -3,6 +3,7 @@
 import grp
 import os
 from unittest import TestCase
+from unittest.mock import Mock, patch
 
 from apps.crc_sus import CrcSus
 
@@ -13,15 +14,27 @@ class AccountArgument(TestCase):
     def test_default_account(self) -> None:
         """Test the default account matches the current user's primary group"""
 
-        parsed_account = CrcSus().parse_args([]).account
+        parsed_accounts = CrcSus().parse_args([]).accounts
         current_account = grp.getgrgid(os.getgid()).gr_name
-        self.assertEqual(current_account, parsed_account)
+        self.assertEqual([current_account], parsed_accounts)
 
     def test_custom_account_name(self) -> None:
         """Test a custom account is used when specified"""
 
-        parsed_account = CrcSus().parse_args(['dummy_account']).account
-        self.assertEqual('dummy_account', parsed_account)
+        parsed_accounts = CrcSus().parse_args(['dummy_account']).accounts
+        self.assertEqual(['dummy_account'], parsed_accounts)
+
+    def test_multiple_account_names(self) -> None:
+        """Test multiple accounts are stored in the order they are given"""
+
+        parsed_accounts = CrcSus().parse_args(['account1', 'account2']).accounts
+        self.assertEqual(['account1', 'account2'], parsed_accounts)
+
+    def test_no_cache_flag(self) -> None:
+        """Test response caching is enabled unless ``--no-cache`` is given"""
+
+        self.assertFalse(CrcSus().parse_args([]).no_cache)
+        self.assertTrue(CrcSus().parse_args(['--no-cache']).no_cache)
 
 
 class OutputStringFormatting(TestCase):
@@ -36,3 +49,29 @@ class OutputStringFormatting(TestCase):
         )
 
         self.assertEqual(expected_string, output_string)
+
+
+class UsedServiceUnits(TestCase):
+    """Test the calculation of used service units across accounts"""
+
+    @patch('apps.utils.system_info.Slurm.get_bulk_usage_by_period')
+    def test_accounts_grouped_by_start_date(self, mock_get_usage: Mock) -> None:
+        """Test a single usage query is issued per distinct reporting period"""
+
+        mock_get_usage.side_effect = lambda queries: [
+            {account: {cluster: {'total': 5} for cluster in clusters} for account in accounts}
+            for accounts, start, clusters in queries
+        ]
+
+        alloc_requests = {
+            'account1': [{'active': '2025-01-01', '_allocations': [{'_cluster': {'name': 'smp'}, 'awarded': 10}]}],
+            'account2': [{'active': '2025-01-01', '_allocations': [{'_cluster': {'name': 'gpu'}, 'awarded': 10}]}],
+            'account3': [{'active': '2025-06-01', '_allocations': [{'_cluster': {'name': 'mpi'}, 'awarded': 10}]}],
+        }
+
+        used = CrcSus.get_used_service_units(alloc_requests)
+
+        mock_get_usage.assert_called_once()
+        self.assertEqual(2, len(mock_get_usage.call_args.args[0]))
+        self.assertEqual({'gpu': 5, 'smp': 5}, used['account1'])
+        self.assertEqual({'mpi': 5}, used['account3'])
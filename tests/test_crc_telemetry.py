@@ -0,0 +1,72 @@
+"""Tests for the ``CrcTelemetry`` class."""
+
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from apps.crc_telemetry import CrcTelemetry
+from apps.utils.telemetry import append_record
+
+
+class Summarize(TestCase):
+    """Test the aggregation of telemetry records"""
+
+    def test_grouped_by_tool(self) -> None:
+        """Test statistics are computed separately for each tool"""
+
+        records = [
+            {'tool': 'crc-idle', 'ms': ms, 'slurm': 5, 'keystone': 0, 'status': 0} for ms in range(1, 21)
+        ] + [
+            {'tool': 'crc-sus', 'ms': 100, 'slurm': 1, 'keystone': 3, 'status': 1},
+        ]
+
+        summary = CrcTelemetry.summarize(records)
+        self.assertEqual(['crc-idle', 'crc-sus'], list(summary))
+        self.assertEqual(20, summary['crc-idle']['runs'])
+        self.assertEqual(10, summary['crc-idle']['median_ms'])
+        self.assertEqual(19, summary['crc-idle']['p95_ms'])
+        self.assertEqual(100, summary['crc-idle']['slurm_calls'])
+        self.assertEqual(1, summary['crc-sus']['errors'])
+        self.assertEqual(3, summary['crc-sus']['keystone_calls'])
+
+
+class AppLogic(TestCase):
+    """Test reading and printing spooled records"""
+
+    def setUp(self) -> None:
+        """Create a spool directory with an old and a recent record"""
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.spool_dir = temp_dir.name
+
+        path = Path(self.spool_dir) / 'telemetry-1000.jsonl'
+        append_record(path, {'ts': int(time.time()) - 10 * 86400, 'tool': 'crc-old', 'ms': 1})
+        append_record(path, {'ts': int(time.time()), 'tool': 'crc-new', 'ms': 1})
+
+    def test_all_records_printed(self) -> None:
+        """Test every tool appears in the summary table"""
+
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            CrcTelemetry.execute([self.spool_dir])
+
+        self.assertIn('crc-old', stdout.getvalue())
+        self.assertIn('crc-new', stdout.getvalue())
+
+    def test_days_filter(self) -> None:
+        """Test old records are excluded by the ``--days`` option"""
+
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            CrcTelemetry.execute([self.spool_dir, '--days', '1'])
+
+        self.assertNotIn('crc-old', stdout.getvalue())
+        self.assertIn('crc-new', stdout.getvalue())
+
+    def test_missing_directory(self) -> None:
+        """Test an error is raised when no spool directory is available"""
+
+        with patch.dict('os.environ', {}, clear=True), self.assertRaises(SystemExit):
+            CrcTelemetry.execute([])
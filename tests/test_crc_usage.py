@@ -15,15 +15,21 @@ class ArgumentParsing(TestCase):
     def test_default_account(self) -> None:
         """Test the default account matches the current user's primary group"""
 
-        parsed_account = CrcUsage().parse_args([]).account
+        parsed_accounts = CrcUsage().parse_args([]).accounts
         current_account = grp.getgrgid(os.getgid()).gr_name
-        self.assertEqual(current_account, parsed_account)
+        self.assertEqual([current_account], parsed_accounts)
 
     def test_custom_account_name(self) -> None:
         """Test a custom account is used when specified"""
 
-        parsed_account = CrcUsage().parse_args(['dummy_account']).account
-        self.assertEqual('dummy_account', parsed_account)
+        parsed_accounts = CrcUsage().parse_args(['dummy_account']).accounts
+        self.assertEqual(['dummy_account'], parsed_accounts)
+
+    def test_multiple_account_names(self) -> None:
+        """Test multiple accounts are stored in the order they are given"""
+
+        parsed_accounts = CrcUsage().parse_args(['account1', 'account2']).accounts
+        self.assertEqual(['account1', 'account2'], parsed_accounts)
 
 
 @skipIf(not Slurm.is_installed(), 'Slurm is required to run this test')
@@ -105,14 +111,12 @@ class PrintUsageTable(TestCase):
         self.awarded_totals = {'cluster1': 1000, 'cluster2': 2000}
         self.earliest_date = date(2023, 1, 1)
 
-    @mock.patch('apps.utils.system_info.Slurm.get_cluster_usage_by_user')
+    @mock.patch('apps.utils.system_info.Slurm.get_usage_by_cluster')
     def test_usage_table_printed(self, mock_get_usage) -> None:
         """Test the creation and formatting of the usage table"""
 
-        mock_get_usage.side_effect = lambda *args, **kwargs: {
-            'user1': 100,
-            'user2': 200,
-            'total': 300
+        mock_get_usage.side_effect = lambda account, start, clusters: {
+            cluster: {'user1': 100, 'user2': 200, 'total': 300} for cluster in clusters
         }
 
         with mock.patch('builtins.print') as mock_print:
@@ -140,12 +144,12 @@ class PrintUsageTable(TestCase):
             self.assertIn("200", printed_output)  # Used
             self.assertIn("10", printed_output)  # % Used
 
-    @mock.patch('apps.utils.system_info.Slurm.get_cluster_usage_by_user')
+    @mock.patch('apps.utils.system_info.Slurm.get_usage_by_cluster')
     def test_print_usage_table_no_data(self, mock_get_usage) -> None:
         """Test the usage table when no usage data is available"""
 
         # Mock no usage data
-        mock_get_usage.return_value = None
+        mock_get_usage.side_effect = lambda account, start, clusters: {cluster: None for cluster in clusters}
 
         # Mock the print function to capture output
         with mock.patch('builtins.print') as mock_print:
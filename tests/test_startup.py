@@ -0,0 +1,31 @@
+"""Tests for the startup behavior of the wrapper applications."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+from benchmarks.bench_startup import get_entry_modules, HEAVY_MODULES
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class DeferredImports(TestCase):
+    """Test expensive dependencies are not imported at application startup"""
+
+    def test_heavy_modules_not_imported(self) -> None:
+        """Test importing each application module does not load heavy dependencies"""
+
+        for name, module in get_entry_modules().items():
+            with self.subTest(application=name):
+                code = f'import sys, {module}; print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))'
+                result = subprocess.run(
+                    [sys.executable, '-c', code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+
+                self.assertEqual('', result.stdout.strip())
+
+    def test_version_resolved_lazily(self) -> None:
+        """Test the package version is available on demand"""
+
+        import apps
+        self.assertIsInstance(apps.__version__, str)
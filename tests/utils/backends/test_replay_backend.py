@@ -0,0 +1,125 @@
+"""Tests for the ``ReplayBackend`` class."""
+
+import os
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from apps.utils.backends import Backend, get_backend, ReplayBackend, set_backend
+from apps.utils.keystone import authenticate_keystone_session, get_team_id
+from apps.utils.system_info import Shell
+
+
+class BackendTestCase(TestCase):
+    """Base class installing a replay backend for each test"""
+
+    def setUp(self) -> None:
+        """Install a replay backend with recorded responses"""
+
+        self.backend = ReplayBackend()
+        self.backend.add_command('sinfo --version', 'slurm 23.02.6')
+        self.backend.add_command('squeue -M fake', '', 'invalid cluster')
+        self.backend.add_keystone_response('/users/teams/', {'name': 'sam'}, {'results': [{'id': 7, 'name': 'sam'}]})
+
+        set_backend(self.backend)
+        self.addCleanup(set_backend, None)
+
+
+class ReplayCommands(BackendTestCase):
+    """Test recorded commands are served in place of running processes"""
+
+    def test_recorded_output(self) -> None:
+        """Test stdout and stderr are returned for recorded commands"""
+
+        self.assertEqual('slurm 23.02.6', Shell.run_command('sinfo --version'))
+        self.assertEqual(('', 'invalid cluster'), Shell.run_command('squeue -M fake', include_err=True))
+
+    def test_unknown_command(self) -> None:
+        """Test an error is raised for commands without recorded output"""
+
+        with self.assertRaises(RuntimeError):
+            Shell.run_command('sinfo')
+
+    def test_concurrent_latency(self) -> None:
+        """Test artificial latency overlaps when commands run concurrently"""
+
+        self.backend.latency = 0.2
+
+        start = time.perf_counter()
+        outputs = Shell.run_commands(['sinfo --version'] * 5, max_concurrency=5)
+        self.assertLess(time.perf_counter() - start, 0.8)
+        self.assertEqual(['slurm 23.02.6'] * 5, outputs)
+
+
+class ReplayKeystone(BackendTestCase):
+    """Test recorded Keystone responses are served in place of API requests"""
+
+    def test_recorded_response(self) -> None:
+        """Test sessions are created without credentials and serve recorded responses"""
+
+        session = authenticate_keystone_session(username='user')
+        self.assertEqual(7, get_team_id(session, 'sam'))
+        self.assertEqual(1, session.request_count)
+
+    def test_unknown_request(self) -> None:
+        """Test requests without a recorded response return a 404 status"""
+
+        session = authenticate_keystone_session(username='user')
+        self.assertEqual(404, session.http_get('/users/teams/', params={'name': 'fake'}).status_code)
+
+
+class FixtureFiles(TestCase):
+    """Test fixtures are saved to and loaded from disk"""
+
+    def test_round_trip(self) -> None:
+        """Test a saved backend is restored with the same responses"""
+
+        backend = ReplayBackend()
+        backend.add_command('sinfo', 'output')
+        backend.add_keystone_response('/users/teams/', {'name': 'sam'}, {'results': []}, status=200)
+
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'fixture.json'
+            backend.save(path)
+            loaded = ReplayBackend.from_file(path, latency=0.5)
+
+        self.assertEqual(backend.commands, loaded.commands)
+        self.assertEqual(backend.keystone, loaded.keystone)
+        self.assertEqual(0.5, loaded.latency)
+
+    def test_environment_configuration(self) -> None:
+        """Test the replay backend is loaded from the environment"""
+
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'fixture.json'
+            ReplayBackend({'commands': {'sinfo': {'stdout': 'output'}}}).save(path)
+
+            env = {'CRC_WRAPPERS_BACKEND': 'replay', 'CRC_WRAPPERS_REPLAY_FILE': str(path)}
+            with patch.dict(os.environ, env):
+                self.assertEqual('output', Shell.run_command('sinfo'))
+                self.assertIs(get_backend(), get_backend())
+
+    @patch.dict(os.environ, {'CRC_WRAPPERS_BACKEND': 'unknown'})
+    def test_unknown_backend(self) -> None:
+        """Test an error is raised for unrecognized backend names"""
+
+        with self.assertRaises(ValueError):
+            get_backend()
+
+
+class BackendSelection(TestCase):
+    """Test the backend interface and selection"""
+
+    @patch.dict(os.environ, {'CRC_WRAPPERS_BACKEND': 'rest'})
+    def test_rest_backend(self) -> None:
+        """Test no backend instance is returned when the Slurm REST API is selected"""
+
+        self.assertIsNone(get_backend())
+
+    def test_abstract_interface(self) -> None:
+        """Test backends must implement commands and Keystone requests"""
+
+        with self.assertRaises(TypeError):
+            Backend()
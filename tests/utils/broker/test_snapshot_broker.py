@@ -0,0 +1,199 @@
+"""Tests for the ``SnapshotBroker`` class and its client functions."""
+
+import os
+import threading
+import time
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from apps.utils.backends import ReplayBackend, set_backend
+from apps.utils.broker import is_allowed, query_snapshot, query_snapshots, SnapshotBroker, SOCKET_ENV
+from apps.utils.system_info import Shell
+
+
+class IsAllowed(TestCase):
+    """Test the filtering of commands served by the broker"""
+
+    def test_wrapper_queries_allowed(self) -> None:
+        """Test the ``sinfo`` and ``squeue`` queries generated by the wrappers are allowed"""
+
+        for command in (
+            'sinfo -M all',
+            'sinfo -h -M smp -p high-mem -N -o %N,%C',
+            'sinfo -h -M gpu -N --Format=NodeList:_,Gres:5',
+            "squeue -M smp -o '%.7i %.9P'",
+        ):
+            with self.subTest(command=command):
+                self.assertTrue(is_allowed(command))
+
+    def test_other_commands_rejected(self) -> None:
+        """Test other programs, unknown options, and malformed commands are rejected"""
+
+        for command in ('scancel 1234', 'sinfo --version', 'squeue -u someone', 'squeue 1234', "sinfo -o '", ''):
+            with self.subTest(command=command):
+                self.assertFalse(is_allowed(command))
+
+    def test_iterating_queries_rejected(self) -> None:
+        """Test bundled and abbreviated forms of ``--iterate`` are rejected"""
+
+        for command in ('sinfo -i 5', 'squeue -hi5', 'squeue --iterate=5', 'squeue --iter=5', 'sinfo -hNi 5'):
+            with self.subTest(command=command):
+                self.assertFalse(is_allowed(command))
+
+
+class SnapshotCaching(TestCase):
+    """Test commands are cached and refreshed by the broker"""
+
+    def setUp(self) -> None:
+        """Install a replay backend with recorded command output"""
+
+        self.backend = ReplayBackend()
+        self.backend.add_command('sinfo -M all', 'first')
+        set_backend(self.backend)
+        self.addCleanup(set_backend, None)
+
+    def test_output_cached_until_refresh(self) -> None:
+        """Test cached output is returned until the broker refreshes it"""
+
+        broker = SnapshotBroker()
+        self.assertEqual('first', broker.get('sinfo -M all'))
+
+        self.backend.add_command('sinfo -M all', 'second')
+        self.assertEqual('first', broker.get('sinfo -M all'))
+
+        broker.refresh()
+        self.assertEqual('second', broker.get('sinfo -M all'))
+
+    def test_unrequested_commands_expire(self) -> None:
+        """Test commands no longer requested by clients are dropped on refresh"""
+
+        broker = SnapshotBroker(interval=0, expire_intervals=0)
+        broker.get('sinfo -M all')
+        broker.refresh()
+        self.assertEqual({}, broker.snapshots)
+
+    def test_command_limit(self) -> None:
+        """Test new commands are not tracked beyond the configured limit"""
+
+        self.backend.add_command('squeue -M all', 'jobs')
+        broker = SnapshotBroker(max_commands=1)
+        self.assertEqual('first', broker.get('sinfo -M all'))
+        self.assertIsNone(broker.get('squeue -M all'))
+
+    def test_request_limit(self) -> None:
+        """Test a single request cannot add more than the configured number of new commands"""
+
+        self.backend.add_command('squeue -M all', 'jobs')
+        broker = SnapshotBroker(max_new_commands=1)
+        self.assertEqual(['first', None], broker.get_many(['sinfo -M all', 'squeue -M all']))
+        self.assertEqual(['first', 'jobs'], broker.get_many(['sinfo -M all', 'squeue -M all']))
+
+    def test_failed_refresh_isolated(self) -> None:
+        """Test a command failing during a refresh does not prevent other commands from updating"""
+
+        self.backend.add_command('squeue -M all', 'jobs')
+        broker = SnapshotBroker()
+        broker.get_many(['sinfo -M all', 'squeue -M all'])
+
+        del self.backend.commands['sinfo -M all']
+        self.backend.add_command('squeue -M all', 'new jobs')
+        broker.refresh()
+
+        self.assertEqual(['first', 'new jobs'], broker.get_many(['sinfo -M all', 'squeue -M all']))
+
+    def test_stale_output_not_served(self) -> None:
+        """Test output that has not been refreshed for several intervals is no longer served"""
+
+        broker = SnapshotBroker(interval=10, stale_intervals=3)
+        broker.get('sinfo -M all')
+
+        with patch('apps.utils.broker.time.monotonic', return_value=time.monotonic() + 31):
+            self.assertIsNone(broker.get('sinfo -M all'))
+
+        self.assertIn('sinfo -M all', broker.snapshots)
+
+    def test_failed_and_disallowed_commands(self) -> None:
+        """Test None is returned for commands that fail or are not allowed"""
+
+        broker = SnapshotBroker()
+        self.assertIsNone(broker.get('squeue -M unknown'))
+        self.assertIsNone(broker.get('scancel 1234'))
+        self.assertEqual({}, broker.snapshots)
+
+
+class SocketQueries(TestCase):
+    """Test clients query a running broker over its Unix socket"""
+
+    def setUp(self) -> None:
+        """Start a broker on a temporary socket"""
+
+        backend = ReplayBackend()
+        backend.add_command('sinfo -M all', 'nodes')
+        set_backend(backend)
+        self.addCleanup(set_backend, None)
+
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.socket_path = os.path.join(temp_dir.name, 'broker.sock')
+
+        stop_event = threading.Event()
+        thread = threading.Thread(target=SnapshotBroker(interval=60).serve, args=(self.socket_path, stop_event))
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(stop_event.set)
+
+        deadline = time.monotonic() + 5
+        while not os.path.exists(self.socket_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_snapshots_served(self) -> None:
+        """Test output is returned for allowed commands and None otherwise"""
+
+        self.assertEqual(
+            ['nodes', None],
+            query_snapshots(['sinfo -M all', 'scancel 1234'], self.socket_path))
+
+    def test_shell_uses_broker(self) -> None:
+        """Test ``Shell`` serves snapshot commands from the configured broker"""
+
+        # The broker runs the command on its first request, so the first request is made before patching
+        query_snapshot('sinfo -M all', self.socket_path)
+        with patch.dict(os.environ, {SOCKET_ENV: self.socket_path}), \
+                patch('apps.utils.system_info.get_backend', return_value=None), \
+                patch('apps.utils.system_info.Shell.run_command') as mock_run_command:
+            self.assertEqual('nodes', Shell.run_snapshot_command('sinfo -M all'))
+
+        mock_run_command.assert_not_called()
+
+    def test_backend_skips_broker(self) -> None:
+        """Test commands are answered by an installed backend instead of the broker"""
+
+        # The broker caches output from the backend installed in ``setUp``
+        query_snapshot('sinfo -M all', self.socket_path)
+        backend = ReplayBackend()
+        backend.add_command('sinfo -M all', 'replayed')
+        set_backend(backend)
+
+        with patch.dict(os.environ, {SOCKET_ENV: self.socket_path}):
+            self.assertEqual('replayed', Shell.run_snapshot_command('sinfo -M all'))
+            self.assertEqual(['replayed'], Shell.run_snapshot_commands(['sinfo -M all']))
+
+
+class ClientFallback(TestCase):
+    """Test clients fall back to running commands directly without a broker"""
+
+    @patch.dict(os.environ, {SOCKET_ENV: '/nonexistent/broker.sock'})
+    def test_no_broker(self) -> None:
+        """Test None is returned for every command when no broker is running"""
+
+        self.assertIsNone(query_snapshot('sinfo -M all'))
+        self.assertEqual([None, None], query_snapshots(['sinfo', 'squeue']))
+
+    @patch.dict(os.environ, {SOCKET_ENV: '/nonexistent/broker.sock'})
+    @patch('apps.utils.system_info.Shell.run_commands', return_value=['a', 'b'])
+    def test_shell_runs_commands_directly(self, mock_run_commands: Mock) -> None:
+        """Test ``Shell`` runs commands directly when no broker is running"""
+
+        self.assertEqual(['a', 'b'], Shell.run_snapshot_commands(['sinfo', 'squeue'], max_concurrency=2))
+        mock_run_commands.assert_called_once_with(['sinfo', 'squeue'], max_concurrency=2)
@@ -0,0 +1,101 @@
+"""Tests for the ``FileCache`` class."""
+
+import os
+import stat
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from apps.utils.cache import atomic_write, FileCache
+
+
+class AtomicWrite(TestCase):
+    """Test the atomic writing of files"""
+
+    def test_contents_and_permissions(self) -> None:
+        """Test written files have the expected contents and permissions"""
+
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'file.txt'
+            atomic_write(path, 'old')
+            atomic_write(path, 'new', mode=0o600)
+
+            self.assertEqual('new', path.read_text())
+            self.assertEqual(0o600, stat.S_IMODE(path.stat().st_mode))
+
+    def test_no_temporary_files_left_behind(self) -> None:
+        """Test temporary files are removed after writing"""
+
+        with TemporaryDirectory() as temp_dir:
+            atomic_write(Path(temp_dir) / 'file.txt', 'data')
+            self.assertEqual(['file.txt'], os.listdir(temp_dir))
+
+
+class CacheReadWrite(TestCase):
+    """Test values are stored and retrieved from the cache"""
+
+    def setUp(self) -> None:
+        """Create a cache in a temporary directory"""
+
+        self.temp_dir = TemporaryDirectory()
+        self.cache = FileCache(Path(self.temp_dir.name) / 'cache', ttl=60)
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory"""
+
+        self.temp_dir.cleanup()
+
+    def test_missing_key(self) -> None:
+        """Test missing keys return ``None``"""
+
+        self.assertIsNone(self.cache.get('missing'))
+
+    def test_round_trip(self) -> None:
+        """Test stored values are returned"""
+
+        self.cache.set('key', 'value')
+        self.assertEqual('value', self.cache.get('key'))
+
+    def test_expired_entry(self) -> None:
+        """Test expired entries are treated as missing"""
+
+        self.cache.set('key', 'value')
+        with patch('apps.utils.cache.time.time', return_value=time.time() + 120):
+            self.assertIsNone(self.cache.get('key'))
+
+    def test_corrupt_entry(self) -> None:
+        """Test unreadable entries are treated as missing"""
+
+        self.cache.set('key', 'value')
+        self.cache._path_for_key('key').write_text('not json')
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_disabled_cache(self) -> None:
+        """Test nothing is written when the TTL is zero"""
+
+        cache = FileCache(self.cache.directory, ttl=0)
+        cache.set('key', 'value')
+
+        self.assertFalse(cache.enabled)
+        self.assertIsNone(cache.get('key'))
+        self.assertFalse(self.cache.directory.exists())
+
+
+class FromEnvironment(TestCase):
+    """Test the cache is configured from environment variables"""
+
+    @patch.dict(os.environ, {'CRC_WRAPPERS_CACHE_DIR': '/tmp/custom', 'CRC_WRAPPERS_CACHE_TTL': '30'})
+    def test_custom_settings(self) -> None:
+        """Test the cache directory and TTL are read from the environment"""
+
+        cache = FileCache.from_environment()
+        self.assertEqual(Path('/tmp/custom'), cache.directory)
+        self.assertEqual(30, cache.ttl)
+
+    @patch.dict(os.environ, {'CRC_WRAPPERS_CACHE_TTL': 'invalid'})
+    def test_invalid_ttl(self) -> None:
+        """Test an invalid TTL falls back to the default"""
+
+        self.assertEqual(FileCache.default_ttl, FileCache.from_environment().ttl)
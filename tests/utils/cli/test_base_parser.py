@@ -1,7 +1,9 @@
 """Tests for the ``BaseParser`` class."""
 
 import re
+from io import StringIO
 from unittest import TestCase
+from unittest.mock import patch
 
 from apps.utils.cli import BaseParser
 
@@ -40,3 +42,18 @@ class ErrorHandling(TestCase):
         message = 'This is a test'
         with self.assertRaisesRegex(SystemExit, message):
             DummyApp().error(message)
+
+
+class VersionFlag(TestCase):
+    """Test the ``--version`` flag"""
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_version_printed(self, mock_stdout: StringIO) -> None:
+        """Test the package version is printed before exiting"""
+
+        import apps
+
+        with self.assertRaises(SystemExit):
+            DummyApp().parse_args(['--version'])
+
+        self.assertIn(f'version {apps.__version__}', mock_stdout.getvalue())
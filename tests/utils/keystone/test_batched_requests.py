@@ -0,0 +1,82 @@
+"""Tests for batched Keystone queries spanning multiple accounts."""
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from apps.utils.keystone import (
+    get_active_requests_by_account,
+    get_most_recent_expired_requests_by_account,
+    get_team_ids)
+
+
+def create_mock_session(responses: dict[str, list[dict]]) -> MagicMock:
+    """Return a mock Keystone session serving fixed results for each endpoint
+
+    Args:
+        responses: Mapping of API endpoints to the results they return
+    """
+
+    def http_get(endpoint: str, params: dict) -> MagicMock:
+        response = MagicMock()
+        response.json.return_value = {'results': responses[endpoint]}
+        return response
+
+    session = MagicMock()
+    session.http_get.side_effect = http_get
+    return session
+
+
+class GetTeamIds(TestCase):
+    """Test the lookup of team IDs for multiple accounts"""
+
+    def test_single_query(self) -> None:
+        """Test all team IDs are fetched using a single filtered request"""
+
+        session = create_mock_session({'/users/teams/': [{'name': 'a', 'id': 1}, {'name': 'b', 'id': 2}]})
+
+        self.assertEqual({'a': 1, 'b': 2}, get_team_ids(session, ['a', 'b']))
+        session.http_get.assert_called_once_with('/users/teams/', params={'name__in': 'a,b'})
+
+    def test_no_accounts(self) -> None:
+        """Test no requests are made when no accounts are given"""
+
+        session = create_mock_session({})
+        self.assertEqual({}, get_team_ids(session, []))
+        session.http_get.assert_not_called()
+
+
+class GetRequestsByAccount(TestCase):
+    """Test allocation requests are fetched and grouped by account"""
+
+    def setUp(self) -> None:
+        """Define mock API responses"""
+
+        self.session = create_mock_session({
+            '/users/teams/': [{'name': 'a', 'id': 1}, {'name': 'b', 'id': 2}],
+            '/allocations/requests/': [
+                {'id': 10, 'team': 1},
+                {'id': 11, 'team': 2},
+                {'id': 12, 'team': 1},
+            ]
+        })
+
+    def test_active_requests_grouped(self) -> None:
+        """Test active requests are grouped by account using a constant number of requests"""
+
+        result = get_active_requests_by_account(self.session, ['a', 'b', 'c'])
+
+        self.assertEqual([10, 12], [r['id'] for r in result['a']])
+        self.assertEqual([11], [r['id'] for r in result['b']])
+        self.assertEqual([], result['c'])
+        self.assertEqual(2, self.session.http_get.call_count)
+
+        params = self.session.http_get.call_args.kwargs['params']
+        self.assertEqual('1,2', params['team__in'])
+
+    def test_most_recent_expired_request(self) -> None:
+        """Test the first (most recently expired) request is returned for each account"""
+
+        result = get_most_recent_expired_requests_by_account(self.session, ['a', 'b', 'c'])
+
+        self.assertEqual({'a': 10, 'b': 11}, {name: r['id'] for name, r in result.items()})
+        self.assertEqual(2, self.session.http_get.call_count)
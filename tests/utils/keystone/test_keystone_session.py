@@ -0,0 +1,83 @@
+"""Tests for the `KeystoneSession` class."""
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from apps.utils.keystone import get_team_id, get_team_ids, KeystoneSession
+
+
+def create_mock_client(teams: list[dict]) -> MagicMock:
+    """Return a mock Keystone client serving a fixed list of teams
+
+    Args:
+        teams: The team records returned by the API
+    """
+
+    def http_get(endpoint: str, params: dict) -> MagicMock:
+        response = MagicMock()
+        response.json.return_value = {'results': teams}
+        return response
+
+    client = MagicMock(spec=['http_get', 'url'])
+    client.http_get.side_effect = http_get
+    return client
+
+
+class RequestTiming(TestCase):
+    """Test the accounting of HTTP requests"""
+
+    def test_counters_updated(self) -> None:
+        """Test each request increments the request count and timing totals"""
+
+        session = KeystoneSession(create_mock_client([]))
+        session.http_get('/users/teams/', params={})
+        session.http_get('/users/teams/', params={})
+
+        self.assertEqual(2, session.request_count)
+        self.assertGreaterEqual(session.request_seconds, session.max_request_seconds)
+        self.assertGreaterEqual(session.max_request_seconds, 0)
+
+    def test_failed_request_counted(self) -> None:
+        """Test requests raising an error are still counted"""
+
+        client = create_mock_client([])
+        client.http_get.side_effect = ConnectionError
+        session = KeystoneSession(client)
+
+        with self.assertRaises(ConnectionError):
+            session.http_get('/users/teams/')
+
+        self.assertEqual(1, session.request_count)
+
+    def test_attributes_forwarded(self) -> None:
+        """Test unknown attributes are read from the wrapped client"""
+
+        client = create_mock_client([])
+        client.url = 'https://example.com'
+        self.assertEqual('https://example.com', KeystoneSession(client).url)
+
+
+class TeamIdMemoization(TestCase):
+    """Test team IDs are only fetched once per session"""
+
+    def test_single_account(self) -> None:
+        """Test repeated lookups for one account reuse the first response"""
+
+        client = create_mock_client([{'name': 'a', 'id': 1}])
+        session = KeystoneSession(client)
+
+        self.assertEqual(1, get_team_id(session, 'a'))
+        self.assertEqual(1, get_team_id(session, 'a'))
+        client.http_get.assert_called_once()
+
+    def test_batched_lookup_skips_known_accounts(self) -> None:
+        """Test batched lookups only query accounts missing from the session"""
+
+        client = create_mock_client([{'name': 'b', 'id': 2}])
+        session = KeystoneSession(client)
+        session.team_ids['a'] = 1
+
+        self.assertEqual({'a': 1, 'b': 2}, get_team_ids(session, ['a', 'b']))
+        client.http_get.assert_called_once_with('/users/teams/', params={'name__in': 'b'})
+        self.assertEqual(2, get_team_id(session, 'b'))
+        client.http_get.assert_called_once()
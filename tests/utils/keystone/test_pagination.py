@@ -0,0 +1,124 @@
+"""Tests for the iteration over paginated Keystone API results."""
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from apps.utils.keystone import _get_results, _parse_next_link, get_per_cluster_totals, iter_results
+
+BASE_URL = 'https://api.example.com'
+
+
+def create_paginated_session(pages: list[list[dict]]) -> MagicMock:
+    """Return a mock Keystone session serving the given pages of results
+
+    Pages after the first are requested using a ``page`` query parameter.
+    """
+
+    def http_get(endpoint: str, params: dict) -> MagicMock:
+        index = int(params.get('page', 1)) - 1
+        has_next = index + 1 < len(pages)
+
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {
+            'results': pages[index],
+            'next': f'{BASE_URL}{endpoint}?status=AP&page={index + 2}' if has_next else None,
+        }
+
+        return response
+
+    session = MagicMock()
+    session.http_get.side_effect = http_get
+    return session
+
+
+class ParseNextLink(TestCase):
+    """Test pagination links are converted into endpoints relative to the API base URL"""
+
+    def test_no_next_page(self) -> None:
+        """Test None is returned when there is no next page"""
+
+        self.assertIsNone(_parse_next_link(None))
+
+    def test_absolute_link(self) -> None:
+        """Test the endpoint and query parameters are extracted from absolute links"""
+
+        self.assertEqual(
+            ('/allocations/requests/', {'page': '2'}),
+            _parse_next_link(f'{BASE_URL}/allocations/requests/?page=2', BASE_URL))
+
+    def test_base_url_prefix(self) -> None:
+        """Test endpoints are relative to a base URL with a path prefix"""
+
+        base_url = f'{BASE_URL}/api/v1'
+        self.assertEqual(
+            ('/allocations/requests/', {'page': '2'}),
+            _parse_next_link(f'{base_url}/allocations/requests/?page=2', base_url))
+
+    def test_relative_link(self) -> None:
+        """Test relative links are resolved against the base URL"""
+
+        base_url = f'{BASE_URL}/api/v1/'
+        self.assertEqual(
+            ('/allocations/requests/', {'page': '2'}),
+            _parse_next_link('allocations/requests/?page=2', base_url))
+
+
+class IterResults(TestCase):
+    """Test records are yielded from every page of results"""
+
+    def test_all_pages_followed(self) -> None:
+        """Test records from all pages are yielded in order"""
+
+        session = create_paginated_session([[{'id': 1}, {'id': 2}], [{'id': 3}], [{'id': 4}]])
+        records = list(iter_results(session, '/allocations/requests/', {'status': 'AP'}))
+
+        self.assertEqual([1, 2, 3, 4], [r['id'] for r in records])
+        self.assertEqual(3, session.http_get.call_count)
+
+        # Query parameters from the pagination link are passed to subsequent requests
+        session.http_get.assert_called_with('/allocations/requests/', params={'status': 'AP', 'page': '3'})
+
+    def test_prefetch(self) -> None:
+        """Test records are identical when the next page is fetched in the background"""
+
+        session = create_paginated_session([[{'id': 1}], [{'id': 2}], [{'id': 3}]])
+        records = list(iter_results(session, '/allocations/requests/', {}, prefetch=True))
+        self.assertEqual([1, 2, 3], [r['id'] for r in records])
+
+    @patch('concurrent.futures.ThreadPoolExecutor')
+    def test_no_prefetch_for_single_page(self, mock_executor: MagicMock) -> None:
+        """Test no background worker is started when there is no next page"""
+
+        session = create_paginated_session([[{'id': 1}]])
+        records = list(iter_results(session, '/allocations/requests/', {}, prefetch=True))
+
+        self.assertEqual([{'id': 1}], records)
+        mock_executor.assert_not_called()
+
+    def test_incremental_consumption(self) -> None:
+        """Test later pages are only fetched as records are consumed"""
+
+        session = create_paginated_session([[{'id': 1}], [{'id': 2}]])
+        records = iter_results(session, '/allocations/requests/', {})
+
+        next(records)
+        self.assertEqual(1, session.http_get.call_count)
+
+    def test_get_results_combines_pages(self) -> None:
+        """Test ``_get_results`` returns records from every page"""
+
+        session = create_paginated_session([[{'id': 1}], [{'id': 2}]])
+        self.assertEqual([{'id': 1}, {'id': 2}], _get_results(session, '/allocations/requests/', {}))
+
+    def test_streamed_cluster_totals(self) -> None:
+        """Test cluster totals can be computed directly from streamed records"""
+
+        allocation = {'_cluster': {'name': 'smp'}, 'awarded': 10}
+        session = create_paginated_session([
+            [{'id': 1, '_allocations': [allocation]}],
+            [{'id': 2, '_allocations': [allocation]}],
+        ])
+
+        totals = get_per_cluster_totals(iter_results(session, '/allocations/requests/', {}, prefetch=True))
+        self.assertEqual({'smp': 20}, totals)
@@ -0,0 +1,141 @@
+"""Tests for the ``ResponseCache`` class."""
+
+import os
+import stat
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from apps.utils.backends import ReplayBackend, set_backend
+from apps.utils.keystone import _get_results, authenticate_keystone_session, get_team_id, ResponseCache
+
+
+def create_mock_response(status_code: int = 200, results: list = None, etag: str = None) -> MagicMock:
+    """Return a mock HTTP response"""
+
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {'ETag': etag} if etag else {}
+    response.json.return_value = {'results': results or []}
+    return response
+
+
+class FromEnvironment(TestCase):
+    """Test the cache is configured from environment variables"""
+
+    @patch.dict(os.environ, {'CRC_WRAPPERS_KEYSTONE_CACHE_TTL': '0'})
+    def test_disabled(self) -> None:
+        """Test no cache is returned when the TTL is zero"""
+
+        self.assertIsNone(ResponseCache.from_environment())
+
+    @patch.dict(os.environ, {'CRC_WRAPPERS_KEYSTONE_CACHE_TTL': '120'})
+    def test_custom_ttl(self) -> None:
+        """Test the TTL is read from the environment"""
+
+        self.assertEqual(120, ResponseCache.from_environment().ttl)
+
+    def test_disabled_under_backend(self) -> None:
+        """Test replayed responses are never written to the shared cache"""
+
+        backend = ReplayBackend()
+        backend.add_keystone_response('/users/teams/', {'name': 'team'}, {'results': [{'id': 7}]})
+        set_backend(backend)
+        self.addCleanup(set_backend, None)
+
+        with TemporaryDirectory() as temp_dir, patch.dict(os.environ, {'XDG_CACHE_HOME': temp_dir}):
+            cache = ResponseCache.from_environment()
+            self.assertIsNone(cache)
+
+            session = authenticate_keystone_session('user')
+            self.assertEqual(7, get_team_id(session, 'team', cache=cache))
+            self.assertFalse((Path(temp_dir) / 'crc-wrappers' / 'keystone-responses.json').exists())
+
+
+class CachedResults(TestCase):
+    """Test API results are served from the cache"""
+
+    def setUp(self) -> None:
+        """Create a cache in a temporary directory"""
+
+        self.temp_dir = TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / 'responses.json'
+        self.cache = ResponseCache(self.path, ttl=60)
+        self.session = MagicMock()
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory"""
+
+        self.temp_dir.cleanup()
+
+    def test_fresh_entry_served_from_cache(self) -> None:
+        """Test fresh entries are returned without contacting the API"""
+
+        self.session.http_get.return_value = create_mock_response(results=[{'id': 1}])
+
+        _get_results(self.session, '/endpoint/', {'a': 1}, cache=self.cache)
+        results = _get_results(self.session, '/endpoint/', {'a': 1}, cache=ResponseCache(self.path, ttl=60))
+
+        self.assertEqual([{'id': 1}], results)
+        self.session.http_get.assert_called_once()
+
+    def test_different_params_not_shared(self) -> None:
+        """Test requests with different parameters are cached separately"""
+
+        self.session.http_get.return_value = create_mock_response(results=[{'id': 1}])
+
+        _get_results(self.session, '/endpoint/', {'a': 1}, cache=self.cache)
+        _get_results(self.session, '/endpoint/', {'a': 2}, cache=self.cache)
+        self.assertEqual(2, self.session.http_get.call_count)
+
+    def test_stale_entry_revalidated(self) -> None:
+        """Test stale entries are revalidated using their ETag"""
+
+        self.session.http_get.return_value = create_mock_response(results=[{'id': 1}], etag='"v1"')
+        _get_results(self.session, '/endpoint/', {}, cache=self.cache)
+
+        self.session.http_get.return_value = create_mock_response(status_code=304)
+        with patch('apps.utils.keystone.time.time', return_value=time.time() + 120):
+            results = _get_results(self.session, '/endpoint/', {}, cache=self.cache)
+
+        self.assertEqual([{'id': 1}], results)
+        self.assertEqual({'If-None-Match': '"v1"'}, self.session.http_get.call_args.kwargs['headers'])
+
+    def test_stale_multi_page_entry_refetched(self) -> None:
+        """Test stale multi-page entries are refetched instead of revalidated with the first page's ETag"""
+
+        first_page = create_mock_response(results=[{'id': 1}], etag='"v1"')
+        first_page.json.return_value['next'] = 'https://example.com/endpoint/?page=2'
+        second_page = create_mock_response(results=[{'id': 2}], etag='"v2"')
+        self.session.http_get.side_effect = [first_page, second_page]
+        _get_results(self.session, '/endpoint/', {}, cache=self.cache)
+
+        self.session.http_get.side_effect = None
+        self.session.http_get.return_value = create_mock_response(results=[{'id': 3}])
+        with patch('apps.utils.keystone.time.time', return_value=time.time() + 120):
+            results = _get_results(self.session, '/endpoint/', {}, cache=self.cache)
+
+        self.assertEqual([{'id': 3}], results)
+        self.assertNotIn('headers', self.session.http_get.call_args.kwargs)
+
+    def test_cache_file_permissions(self) -> None:
+        """Test the cache file is only readable by the current user"""
+
+        self.cache.set('key', [])
+        self.assertEqual(0o600, stat.S_IMODE(self.path.stat().st_mode))
+
+    def test_least_recently_used_evicted(self) -> None:
+        """Test the least recently used entries are evicted when the cache is full"""
+
+        cache = ResponseCache(self.path, ttl=60, max_entries=2)
+        cache.set('a', [])
+        cache.set('b', [])
+        cache.get('a')
+        cache.set('c', [])
+
+        reloaded = ResponseCache(self.path)
+        self.assertIsNotNone(reloaded.get('a'))
+        self.assertIsNone(reloaded.get('b'))
+        self.assertIsNotNone(reloaded.get('c'))
@@ -0,0 +1,168 @@
+"""Tests for the ``SessionCache`` class."""
+
+import os
+import stat
+import time
+from http.cookiejar import Cookie, CookieJar
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from apps.utils.backends import set_backend
+from apps.utils.keystone import get_team_id, KeystoneSession, SessionCache
+
+
+def create_cookie(name: str, value: str, expires: int = None) -> Cookie:
+    """Return a cookie for the Keystone API domain"""
+
+    return Cookie(
+        version=0, name=name, value=value, port=None, port_specified=False, domain='api.example.com',
+        domain_specified=True, domain_initial_dot=False, path='/', path_specified=True, secure=True,
+        expires=expires, discard=False, comment=None, comment_url=None, rest={})
+
+
+def create_session(*cookies: Cookie) -> SimpleNamespace:
+    """Return a mock client session whose transport holds the given cookies"""
+
+    jar = CookieJar()
+    for cookie in cookies:
+        jar.set_cookie(cookie)
+
+    return SimpleNamespace(_client=SimpleNamespace(cookies=jar))
+
+
+class FromEnvironment(TestCase):
+    """Test caching is only enabled on request"""
+
+    @patch.dict(os.environ, clear=True)
+    def test_disabled_by_default(self) -> None:
+        """Test no cache is returned when the environment variable is unset"""
+
+        self.assertIsNone(SessionCache.from_environment())
+
+    @patch.dict(os.environ, {'CRC_WRAPPERS_KEYSTONE_SESSION_CACHE': '1', 'XDG_RUNTIME_DIR': '/run/user/1000'})
+    def test_runtime_directory(self) -> None:
+        """Test credentials are stored under the runtime directory when available"""
+
+        cache = SessionCache.from_environment()
+        self.assertEqual(Path('/run/user/1000/crc-wrappers/keystone-session.json'), cache.path)
+
+
+class SaveAndLoad(TestCase):
+    """Test credentials are written to and restored from disk"""
+
+    def setUp(self) -> None:
+        """Create a cache in a temporary directory"""
+
+        self.temp_dir = TemporaryDirectory()
+        self.cache = SessionCache(Path(self.temp_dir.name) / 'crc-wrappers' / 'session.json')
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory"""
+
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self) -> None:
+        """Test cookies saved from one session are restored into another"""
+
+        expires = int(time.time()) + 3600
+        self.cache.save(create_session(create_cookie('sessionid', 'abc', expires)), 'user1')
+
+        new_session = create_session()
+        self.assertTrue(self.cache.load(new_session, 'user1'))
+
+        restored = {cookie.name: cookie.value for cookie in new_session._client.cookies}
+        self.assertEqual({'sessionid': 'abc'}, restored)
+
+    def test_file_permissions(self) -> None:
+        """Test the cache file is only readable by the current user"""
+
+        self.cache.save(create_session(create_cookie('sessionid', 'abc')), 'user1')
+        self.assertEqual(0o600, stat.S_IMODE(self.cache.path.stat().st_mode))
+
+    def test_wrong_user(self) -> None:
+        """Test credentials are not restored for a different user"""
+
+        self.cache.save(create_session(create_cookie('sessionid', 'abc')), 'user1')
+        self.assertFalse(self.cache.load(create_session(), 'user2'))
+
+    def test_expired_credentials(self) -> None:
+        """Test expired credentials are not restored"""
+
+        self.cache.save(create_session(create_cookie('sessionid', 'abc', int(time.time()) - 1)), 'user1')
+        self.assertFalse(self.cache.load(create_session(), 'user1'))
+
+    def test_clear(self) -> None:
+        """Test cleared credentials are not restored"""
+
+        self.cache.save(create_session(create_cookie('sessionid', 'abc')), 'user1')
+        self.cache.clear()
+        self.assertFalse(self.cache.load(create_session(), 'user1'))
+
+
+class RejectedCredentials(TestCase):
+    """Test cached credentials rejected by the server are refreshed transparently"""
+
+    def setUp(self) -> None:
+        """Create a cache in a temporary directory and a client whose first request is rejected"""
+
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache = SessionCache(Path(temp_dir.name) / 'session.json')
+        self.cache.save(create_session(create_cookie('sessionid', 'stale')), 'user1')
+
+        rejected = MagicMock(status_code=401)
+        rejected.raise_for_status.side_effect = RuntimeError('401 Unauthorized')
+        accepted = MagicMock(status_code=200)
+        accepted.json.return_value = {'results': [{'id': 7}]}
+
+        self.client = MagicMock(spec=['http_get', 'login'])
+        self.client.http_get.side_effect = [rejected, accepted]
+
+    @patch('apps.utils.keystone.getpass', return_value='password')
+    def test_login_and_retry(self, mock_getpass: MagicMock) -> None:
+        """Test the user logs in again and the request is retried once"""
+
+        session = KeystoneSession(self.client, 'user1', self.cache)
+        self.assertEqual(7, get_team_id(session, 'team'))
+
+        mock_getpass.assert_called_once()
+        self.client.login.assert_called_once_with(username='user1', password='password')
+        self.assertEqual(2, self.client.http_get.call_count)
+
+    @patch('apps.utils.keystone.getpass')
+    def test_no_retry_for_fresh_credentials(self, mock_getpass: MagicMock) -> None:
+        """Test requests made with freshly entered credentials are not retried"""
+
+        session = KeystoneSession(self.client, 'user1')
+        with self.assertRaises(RuntimeError):
+            get_team_id(session, 'team')
+
+        mock_getpass.assert_not_called()
+        self.assertEqual(1, self.client.http_get.call_count)
+
+    @patch('apps.utils.keystone.getpass')
+    def test_unloaded_cache_kept(self, mock_getpass: MagicMock) -> None:
+        """Test credentials are not discarded by sessions that did not load them"""
+
+        session = KeystoneSession(self.client, 'user1')
+        with self.assertRaises(RuntimeError):
+            get_team_id(session, 'team')
+
+        self.assertTrue(self.cache.path.exists())
+
+    @patch('apps.utils.keystone.getpass')
+    def test_cache_kept_under_backend(self, mock_getpass: MagicMock) -> None:
+        """Test rejected backend requests never touch the session cache"""
+
+        set_backend(MagicMock())
+        self.addCleanup(set_backend, None)
+
+        session = KeystoneSession(self.client, 'user1', self.cache)
+        with self.assertRaises(RuntimeError):
+            get_team_id(session, 'team')
+
+        mock_getpass.assert_not_called()
+        self.assertTrue(self.cache.path.exists())
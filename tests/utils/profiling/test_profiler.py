@@ -0,0 +1,151 @@
+"""Tests for the `profiling` module."""
+
+import json
+import os
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from apps.utils import profiling
+from apps.utils.backends import ReplayBackend, set_backend
+from apps.utils.cli import BaseParser
+from apps.utils.system_info import Shell
+
+
+class CommandApp(BaseParser):
+    """A dummy application that runs a single command"""
+
+    def app_logic(self, args) -> None:
+        """Run a command through the shell"""
+
+        Shell.run_command('sinfo')
+
+
+class SpanRecording(TestCase):
+    """Test spans are recorded only while a profiler is active"""
+
+    def tearDown(self) -> None:
+        """Disable profiling and remove installed backends"""
+
+        profiling.set_profiler(None)
+        set_backend(None)
+
+    def test_disabled_by_default(self) -> None:
+        """Test the module level span helper yields None without a profiler"""
+
+        with profiling.span('work', 'test') as span:
+            self.assertIsNone(span)
+
+    def test_records_duration_and_metadata(self) -> None:
+        """Test spans record their category, duration, and metadata"""
+
+        profiler = profiling.Profiler()
+        profiling.set_profiler(profiler)
+        with profiling.span('work', 'test', key='value') as span:
+            span.metadata['extra'] = 1
+
+        self.assertEqual(1, len(profiler.spans))
+        self.assertEqual('test', profiler.spans[0].category)
+        self.assertEqual({'key': 'value', 'extra': 1}, profiler.spans[0].metadata)
+        self.assertGreaterEqual(profiler.spans[0].duration, 0)
+
+    def test_commands_record_output_size(self) -> None:
+        """Test shell commands are recorded with the size of their output"""
+
+        backend = ReplayBackend()
+        backend.add_command('sinfo', 'abc', 'de')
+        set_backend(backend)
+
+        profiler = profiling.Profiler()
+        profiling.set_profiler(profiler)
+        Shell.run_command('sinfo')
+
+        span = profiler.spans[0]
+        self.assertEqual(('sinfo', 'command'), (span.name, span.category))
+        self.assertEqual(3, span.metadata['stdout_bytes'])
+        self.assertEqual(2, span.metadata['stderr_bytes'])
+
+    def test_subprocess_records_exit_code(self) -> None:
+        """Test commands run on the host record their exit code"""
+
+        profiler = profiling.Profiler()
+        profiling.set_profiler(profiler)
+        Shell.run_command(f'{sys.executable} -c "import sys; sys.exit(3)"')
+        self.assertEqual(3, profiler.spans[0].metadata['exit_code'])
+
+
+class OutputSetting(TestCase):
+    """Test the resolution of the profiling output destination"""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_disabled_without_option_or_environment(self) -> None:
+        """Test profiling is disabled by default"""
+
+        self.assertIsNone(profiling.get_output_setting(None))
+
+    @patch.dict(os.environ, {profiling.PROFILE_ENV: '1'})
+    def test_environment_flag_prints_summary(self) -> None:
+        """Test a truthy environment value prints a summary"""
+
+        self.assertEqual('-', profiling.get_output_setting(None))
+
+    @patch.dict(os.environ, {profiling.PROFILE_ENV: 'trace.json'})
+    def test_option_overrides_environment(self) -> None:
+        """Test command line options take precedence over the environment"""
+
+        self.assertEqual('trace.json', profiling.get_output_setting(None))
+        self.assertEqual('other.prof', profiling.get_output_setting('other.prof'))
+
+
+class ProfiledExecution(TestCase):
+    """Test profiling applications via `BaseParser.execute`"""
+
+    def setUp(self) -> None:
+        """Serve commands from a replay backend"""
+
+        backend = ReplayBackend()
+        backend.add_command('sinfo', 'output')
+        set_backend(backend)
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def tearDown(self) -> None:
+        """Remove the installed backend"""
+
+        set_backend(None)
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_summary_written_to_stderr(self) -> None:
+        """Test the `--profile` option prints a summary to stderr"""
+
+        with patch('sys.stderr', new_callable=StringIO) as stderr:
+            CommandApp.execute(['--profile'])
+
+        self.assertIn('PROFILE SUMMARY', stderr.getvalue())
+        self.assertIn('[command] sinfo', stderr.getvalue())
+        self.assertIsNone(profiling.get_profiler())
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_chrome_trace(self) -> None:
+        """Test a `.json` output file receives Chrome trace events"""
+
+        path = Path(self.temp_dir.name) / 'trace.json'
+        CommandApp.execute(['--profile-output', str(path)])
+
+        events = json.loads(path.read_text())['traceEvents']
+        self.assertEqual({'parse_args', 'app_logic', 'sinfo'}, {event['name'] for event in events})
+        self.assertTrue(all(event['ph'] == 'X' and event['ts'] >= 0 for event in events))
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_cprofile_stats(self) -> None:
+        """Test a `.prof` output file receives loadable cProfile statistics"""
+
+        import pstats
+
+        path = Path(self.temp_dir.name) / 'app.prof'
+        CommandApp.execute(['--profile-output', str(path)])
+        self.assertGreater(pstats.Stats(str(path)).total_calls, 0)
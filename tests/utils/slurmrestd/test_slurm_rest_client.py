@@ -0,0 +1,248 @@
+"""Tests for the ``SlurmRestClient`` class."""
+
+import json
+import os
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import patch
+
+from apps.crc_idle import CrcIdle
+from apps.utils.backends import get_backend_name, ReplayBackend, set_backend
+from apps.utils.slurmrestd import SlurmRestClient
+from apps.utils.system_info import Slurm
+
+# Responses served by the stub slurmrestd server, keyed by request path
+RESPONSES = {
+    '/slurmdb/v0.0.40/clusters/': {'clusters': [{'name': 'smp'}, {'name': 'azure'}]},
+    '/slurm/v0.0.40/partitions/': {'partitions': [{'name': 'high-mem'}, {'name': 'pliu'}]},
+    '/slurm/v0.0.40/nodes/': {'nodes': [
+        {'name': 'node1', 'partitions': ['high-mem'], 'state': ['IDLE'], 'cpus': 8, 'alloc_cpus': 2, 'free_mem': 1024}
+    ]},
+    '/slurmdb/v0.0.40/account/sam': {'accounts': [{'name': 'sam'}]},
+    '/slurmdb/v0.0.40/account/fake': {'accounts': []},
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serve canned slurmrestd responses and record incoming requests"""
+
+    protocol_version = 'HTTP/1.1'  # Support keep-alive connections
+    requests = []
+    connections = set()
+
+    def do_GET(self) -> None:
+        """Respond with the canned response for the requested path"""
+
+        StubHandler.requests.append((self.path, dict(self.headers)))
+        StubHandler.connections.add(id(self.connection))
+
+        status = 200 if self.path in RESPONSES else 404
+        body = json.dumps(RESPONSES.get(self.path, {'errors': [{'description': 'Not found'}]})).encode()
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        """Return a placeholder address since Unix sockets have no client address"""
+
+        return 'stub'
+
+    def log_message(self, *args) -> None:
+        """Suppress request logging"""
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """A threaded HTTP server listening on a Unix domain socket"""
+
+    daemon_threads = True
+
+
+class StubServerTestCase(TestCase):
+    """Base class running a stub slurmrestd server for each test"""
+
+    def start_server(self, server: socketserver.BaseServer) -> None:
+        """Serve requests in a background thread until the test finishes"""
+
+        StubHandler.requests = []
+        StubHandler.connections = set()
+
+        Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+    def setUp(self) -> None:
+        """Start a stub server listening on a local TCP port"""
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        server.daemon_threads = True
+        self.start_server(server)
+        self.url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    def create_client(self, url: str = None, **kwargs) -> SlurmRestClient:
+        """Return a client for the stub server that is closed when the test finishes"""
+
+        client = SlurmRestClient(url or self.url, **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+
+class Queries(StubServerTestCase):
+    """Test queries are translated into REST API requests"""
+
+    def test_cluster_names(self) -> None:
+        """Test cluster names are read from the Slurm database"""
+
+        self.assertEqual({'smp', 'azure'}, self.create_client().get_cluster_names())
+
+    def test_partition_names(self) -> None:
+        """Test partition names are read from the partitions endpoint"""
+
+        self.assertEqual({'high-mem', 'pliu'}, self.create_client().get_partition_names('smp'))
+
+    def test_account_exists(self) -> None:
+        """Test accounts are reported as existing only if the database returns a record"""
+
+        client = self.create_client()
+        self.assertTrue(client.account_exists('sam'))
+        self.assertFalse(client.account_exists('fake'))
+        self.assertFalse(client.account_exists('missing'))
+
+    def test_authentication_headers(self) -> None:
+        """Test the token and username are sent with each request"""
+
+        self.create_client(token='secret', username='user1').get_cluster_names()
+
+        _, headers = StubHandler.requests[0]
+        self.assertEqual('secret', headers['X-SLURM-USER-TOKEN'])
+        self.assertEqual('user1', headers['X-SLURM-USER-NAME'])
+
+    def test_error_status(self) -> None:
+        """Test error responses raise a ``RuntimeError`` including the error description"""
+
+        with self.assertRaisesRegex(RuntimeError, 'Not found'):
+            self.create_client().get('/slurm/{version}/unknown')
+
+    def test_connection_reused(self) -> None:
+        """Test multiple requests are sent over a single keep-alive connection"""
+
+        client = self.create_client()
+        client.get_cluster_names()
+        client.get_partition_names('smp')
+        client.get_nodes('smp')
+
+        self.assertEqual(3, len(StubHandler.requests))
+        self.assertEqual(1, len(StubHandler.connections))
+
+    def test_cluster_url_template(self) -> None:
+        """Test cluster specific URLs require a separate database URL"""
+
+        client = self.create_client(self.url + '/{cluster}')
+        with self.assertRaises(RuntimeError):
+            client.get_cluster_names()
+
+        client = self.create_client(self.url + '/{cluster}', db_url=self.url)
+        self.assertEqual({'smp', 'azure'}, client.get_cluster_names())
+        with self.assertRaises(RuntimeError):
+            client.get_partition_names('smp')
+
+        self.assertEqual('/smp/slurm/v0.0.40/partitions/', StubHandler.requests[-1][0])
+
+    def test_single_cluster_url(self) -> None:
+        """Test a URL without a cluster placeholder is only used for one cluster"""
+
+        client = self.create_client()
+        self.assertEqual({'high-mem', 'pliu'}, client.get_partition_names('smp'))
+        client.get_nodes('smp')
+        with self.assertRaisesRegex(RuntimeError, 'placeholder'):
+            client.get_partition_names('gpu')
+
+        self.assertEqual(2, len(StubHandler.requests))
+
+
+class UnixSocket(StubServerTestCase):
+    """Test requests are sent over a Unix domain socket"""
+
+    def setUp(self) -> None:
+        """Start a stub server listening on a Unix domain socket"""
+
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        socket_path = Path(temp_dir.name) / 'slurmrestd.sock'
+
+        self.start_server(UnixHTTPServer(str(socket_path), StubHandler))
+        self.url = f'unix://{socket_path}'
+
+    def test_cluster_names(self) -> None:
+        """Test queries are answered over the socket"""
+
+        self.assertEqual({'smp', 'azure'}, self.create_client().get_cluster_names())
+
+
+class SlurmBackendSelection(StubServerTestCase):
+    """Test the ``Slurm`` class routes queries to the configured backend"""
+
+    def setUp(self) -> None:
+        """Select the REST backend for the duration of each test"""
+
+        super().setUp()
+        env = {'CRC_WRAPPERS_BACKEND': 'rest', 'CRC_WRAPPERS_SLURMRESTD_URL': self.url}
+        env_patch = patch.dict(os.environ, env)
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+        self.addCleanup(self.close_clients)
+
+    @staticmethod
+    def close_clients() -> None:
+        """Close any clients created by the ``Slurm`` class"""
+
+        for client in Slurm._rest_clients.values():
+            client.close()
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_queries_use_rest_api(self, mock_run_command) -> None:
+        """Test topology and account lookups do not run any commands"""
+
+        self.assertEqual({'smp'}, Slurm.get_cluster_names())
+        self.assertEqual({'high-mem'}, Slurm.get_partition_names('smp'))
+        Slurm.check_slurm_account_exists('sam')
+        Slurm.check_slurm_accounts_exist(['sam'])
+        with self.assertRaises(RuntimeError):
+            Slurm.check_slurm_accounts_exist(['sam', 'fake'])
+
+        mock_run_command.assert_not_called()
+
+    @patch('apps.utils.system_info.Shell.run_commands')
+    def test_idle_resources_use_rest_api(self, mock_run_commands) -> None:
+        """Test crc-idle reads node status from the REST API"""
+
+        app = CrcIdle()
+        result = app._collect_json_summaries(['smp'], workers=1)
+
+        self.assertEqual({'smp': {'high-mem': {6: {'count': 1, 'min_free_mem': 1024, 'max_free_mem': 1024}}}}, result)
+        mock_run_commands.assert_not_called()
+
+    def test_client_reused(self) -> None:
+        """Test the same client is returned while the configuration is unchanged"""
+
+        self.assertIs(Slurm.get_rest_client(), Slurm.get_rest_client())
+
+    def test_installed_backend_takes_precedence(self) -> None:
+        """Test queries are issued as commands while a backend is installed using ``set_backend``"""
+
+        set_backend(ReplayBackend())
+        self.addCleanup(set_backend, None)
+        self.assertIsNone(Slurm.get_rest_client())
+
+    @patch.dict(os.environ, {'CRC_WRAPPERS_BACKEND': ''})
+    def test_live_backend_default(self) -> None:
+        """Test the command line utilities are used by default"""
+
+        self.assertEqual('live', get_backend_name())
+        self.assertIsNone(Slurm.get_rest_client())
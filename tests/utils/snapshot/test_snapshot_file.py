@@ -0,0 +1,150 @@
+"""Tests for reading and publishing cluster state snapshot files."""
+
+import os
+import struct
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from apps.utils.snapshot import ClusterSnapshot, load_snapshot, MAX_AGE_ENV, read_snapshot, SnapshotWriter, VERSION
+
+NODES = {
+    'node': ['n1', 'n2', 'n3'],
+    'partition': ['p1', 'p1', 'p2'],
+    'state': ['idle', 'mix', 'drain'],
+    'gres': ['gpu:4', 'gpu:4', 'gpu:2'],
+    'idle': [4, 2, 0],
+    'free_mem': [1000, 2000, 0],
+}
+
+
+def build_writer() -> SnapshotWriter:
+    """Return a snapshot writer holding two clusters."""
+
+    writer = SnapshotWriter()
+    writer.add_cluster(
+        'gpu', NODES, 'PartitionName=p1\n\nPartitionName=p2', [('p1', 'NodeName=n1'), ('p2', 'NodeName=n3')])
+    writer.add_cluster(
+        'smp', {name: column[:1] for name, column in NODES.items()}, 'PartitionName=p1', [('p1', 'NodeName=n1')])
+    return writer
+
+
+class RoundTrip(TestCase):
+    """Test snapshot contents are recovered after encoding"""
+
+    def setUp(self) -> None:
+        """Encode and decode a snapshot with two clusters"""
+
+        self.snapshot = ClusterSnapshot(build_writer().to_bytes(created=123.0))
+
+    def test_header(self) -> None:
+        """Test the creation time and cluster names are recovered"""
+
+        self.assertEqual(123.0, self.snapshot.created)
+        self.assertEqual(('gpu', 'smp'), self.snapshot.clusters)
+
+    def test_node_columns(self) -> None:
+        """Test node columns are recovered for each cluster"""
+
+        columns = self.snapshot.node_columns('gpu')
+        self.assertEqual(NODES['idle'], columns['idle'].tolist())
+        self.assertEqual(NODES['free_mem'], columns['free_mem'].tolist())
+        self.assertEqual(NODES['state'], [self.snapshot.string(index) for index in columns['state']])
+
+        smp_columns = self.snapshot.node_columns('smp')
+        self.assertEqual(['n1'], [self.snapshot.string(index) for index in smp_columns['node']])
+
+    def test_partition_config(self) -> None:
+        """Test partition names and configuration are recovered"""
+
+        self.assertEqual(['p1', 'p2'], self.snapshot.partition_names('gpu'))
+        self.assertEqual('PartitionName=p1', self.snapshot.partition_config('smp'))
+        self.assertEqual('NodeName=n3', self.snapshot.node_config('gpu', 'p2'))
+        self.assertIsNone(self.snapshot.node_config('smp', 'p2'))
+
+    def test_unknown_cluster(self) -> None:
+        """Test a ``KeyError`` is raised for clusters not in the snapshot"""
+
+        with self.assertRaises(KeyError):
+            self.snapshot.node_columns('mpi')
+
+    def test_mismatched_columns(self) -> None:
+        """Test node columns of different lengths are rejected"""
+
+        with self.assertRaises(ValueError):
+            SnapshotWriter().add_cluster('smp', {**NODES, 'idle': [1]})
+
+
+class Validation(TestCase):
+    """Test invalid snapshots are rejected"""
+
+    def test_version_mismatch(self) -> None:
+        """Test snapshots written with a different format version are rejected"""
+
+        data = bytearray(build_writer().to_bytes())
+        struct.pack_into('=I', data, 12, VERSION + 1)
+        with self.assertRaisesRegex(ValueError, 'version'):
+            ClusterSnapshot(bytes(data))
+
+    def test_bad_magic(self) -> None:
+        """Test files that are not snapshots are rejected"""
+
+        with self.assertRaises(ValueError):
+            ClusterSnapshot(b'x' * 100)
+
+    def test_truncated(self) -> None:
+        """Test truncated snapshots are rejected"""
+
+        data = build_writer().to_bytes()
+        for size in (10, len(data) - 1):
+            with self.subTest(size=size), self.assertRaises(ValueError):
+                ClusterSnapshot(data[:size])
+
+
+class PublishAndLoad(TestCase):
+    """Test snapshots are published atomically and loaded from disk"""
+
+    def setUp(self) -> None:
+        """Create a temporary snapshot directory"""
+
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / 'state.snapshot'
+
+    def test_publish_replaces_file(self) -> None:
+        """Test publishing replaces an existing snapshot without leaving temporary files"""
+
+        self.path.write_bytes(b'old')
+        build_writer().publish(self.path)
+
+        self.assertEqual(['state.snapshot'], os.listdir(self.path.parent))
+        self.assertEqual(('gpu', 'smp'), read_snapshot(self.path).clusters)
+
+    def test_load_recent_snapshot(self) -> None:
+        """Test a recent snapshot is loaded from a memory mapped file"""
+
+        build_writer().publish(self.path)
+        snapshot = load_snapshot(self.path, max_age=60)
+        self.assertEqual(['p1', 'p2'], snapshot.partition_names('gpu'))
+
+    def test_stale_snapshot_ignored(self) -> None:
+        """Test None is returned for snapshots older than the maximum age"""
+
+        self.path.write_bytes(build_writer().to_bytes(created=time.time() - 600))
+        self.assertIsNone(load_snapshot(self.path, max_age=60))
+
+    def test_missing_or_empty_snapshot_ignored(self) -> None:
+        """Test None is returned when the snapshot is missing or empty"""
+
+        self.assertIsNone(load_snapshot(self.path, max_age=60))
+        self.path.touch()
+        self.assertIsNone(load_snapshot(self.path, max_age=60))
+
+    @patch.dict(os.environ, {MAX_AGE_ENV: '0'})
+    def test_disabled_by_zero_max_age(self) -> None:
+        """Test snapshots are ignored when the configured maximum age is zero"""
+
+        build_writer().publish(self.path)
+        self.assertIsNone(load_snapshot(self.path))
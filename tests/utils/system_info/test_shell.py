@@ -1,6 +1,14 @@
 """Tests for the ``Shell`` class"""
 
+import asyncio
+import re
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Iterator
 from unittest import TestCase
+from unittest.mock import Mock, patch
 
 from apps.utils.system_info import Shell
 
@@ -39,3 +47,158 @@ class ReturnIsDecoded(TestCase):
         out, err = Shell.run_command('echo hello world', include_err=True)
         self.assertIsInstance(out, str)
         self.assertIsInstance(err, str)
+
+
+class RunCommandAsync(TestCase):
+    """Test the asynchronous execution of shell commands"""
+
+    def test_output_matches_sync_runner(self) -> None:
+        """Test output is captured and decoded the same way as ``run_command``"""
+
+        out, err = asyncio.run(Shell.run_command_async('ls fake_dr', include_err=True))
+        self.assertEqual(Shell.run_command('ls fake_dr', include_err=True), (out, err))
+
+    def test_timeout(self) -> None:
+        """Test a ``TimeoutError`` is raised for commands exceeding the timeout"""
+
+        with self.assertRaises(TimeoutError):
+            asyncio.run(Shell.run_command_async('sleep 5', timeout=0.1))
+
+
+class RunCommands(TestCase):
+    """Test the concurrent execution of multiple shell commands"""
+
+    def test_outputs_in_order(self) -> None:
+        """Test outputs are returned in the same order as the commands"""
+
+        outputs = Shell.run_commands([f'echo {i}' for i in range(5)], max_concurrency=2)
+        self.assertEqual([str(i) for i in range(5)], outputs)
+
+    def test_commands_run_concurrently(self) -> None:
+        """Test commands run in parallel up to the concurrency limit"""
+
+        start = time.perf_counter()
+        Shell.run_commands(['sleep 0.5'] * 4, max_concurrency=4)
+        self.assertLess(time.perf_counter() - start, 1.5)
+
+    def test_timeout_cancels_batch(self) -> None:
+        """Test a timed out command raises an error for the whole batch"""
+
+        start = time.perf_counter()
+        with self.assertRaises(TimeoutError):
+            Shell.run_commands(['echo hello', 'sleep 5', 'sleep 5'], timeout=0.2)
+
+        self.assertLess(time.perf_counter() - start, 2)
+
+    def test_no_commands(self) -> None:
+        """Test an empty batch returns an empty list"""
+
+        self.assertEqual([], Shell.run_commands([]))
+
+    def test_invalid_concurrency(self) -> None:
+        """Test a ``ValueError`` is raised for a non-positive concurrency limit"""
+
+        with self.assertRaises(ValueError):
+            Shell.run_commands(['echo hello'], max_concurrency=0)
+
+
+class StreamOutput(TestCase):
+    """Test streaming output from a long-lived command"""
+
+    separator = re.compile(r'report \d+')
+
+    def stream(self, script: str) -> Iterator[str]:
+        """Return a stream of reports printed by a Python script"""
+
+        return Shell.stream_output(f'{sys.executable} -c "{script}"', self.separator, idle_timeout=0.1)
+
+    def test_output_split_on_separator(self) -> None:
+        """Test output is split into reports at each separator line"""
+
+        script = "print('report 1'); print('a'); print('report 2'); print('b')"
+        self.assertEqual(['report 1\na\n', 'report 2\nb\n'], list(self.stream(script)))
+
+    def test_slow_report_not_fragmented(self) -> None:
+        """Test a report written with pauses is yielded in full rather than in fragments"""
+
+        script = (
+            "import time; print('report 1'); print('a', flush=True); time.sleep(0.5); "
+            "print('b', flush=True); time.sleep(0.5); print('report 2', flush=True)")
+
+        self.assertEqual(['report 1\na\n', 'report 1\na\nb\n', 'report 2\n'], list(self.stream(script)))
+
+    def test_process_terminated_on_close(self) -> None:
+        """Test closing the stream stops a command that would otherwise run forever"""
+
+        script = "import time\nwhile True: print('report 1', flush=True); time.sleep(0.3)"
+        start = time.perf_counter()
+        stream = self.stream(script)
+        self.assertEqual('report 1\n', next(stream))
+        stream.close()
+        self.assertLess(time.perf_counter() - start, 2)
+
+
+class TimeoutsAndRetries(TestCase):
+    """Test the timeout and retry behavior of ``run_command``"""
+
+    def setUp(self) -> None:
+        """Create a temporary file used to count command attempts"""
+
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.attempts_file = Path(temp_dir.name) / 'attempts'
+
+    def count_attempts(self) -> int:
+        """Return the number of times the test command was executed"""
+
+        return len(self.attempts_file.read_text().splitlines())
+
+    def failing_command(self, message: str) -> str:
+        """Return a command recording each attempt and writing the given message to stderr"""
+
+        return f"sh -c 'echo attempt >> {self.attempts_file}; echo \"{message}\" >&2'"
+
+    @patch.object(Shell, '_backoff_delay', return_value=0)
+    def test_transient_errors_retried(self, _: Mock) -> None:
+        """Test commands reporting a transient Slurm error are retried"""
+
+        _, err = Shell.run_command(self.failing_command('Socket timed out'), include_err=True, retries=2)
+        self.assertEqual(3, self.count_attempts())
+        self.assertEqual('Socket timed out', err)
+
+    @patch.object(Shell, '_backoff_delay', return_value=0)
+    def test_other_errors_not_retried(self, _: Mock) -> None:
+        """Test commands reporting other errors are only run once"""
+
+        Shell.run_command(self.failing_command('Invalid account'), retries=2)
+        self.assertEqual(1, self.count_attempts())
+
+    @patch.object(Shell, '_backoff_delay', return_value=5)
+    def test_deadline_stops_retries(self, _: Mock) -> None:
+        """Test no retry is attempted if waiting would exceed the overall deadline"""
+
+        Shell.run_command(self.failing_command('Unable to contact slurm controller'), retries=2, deadline=1)
+        self.assertEqual(1, self.count_attempts())
+
+    def test_timeout(self) -> None:
+        """Test a ``TimeoutError`` is raised for commands exceeding the timeout"""
+
+        start = time.perf_counter()
+        with self.assertRaises(TimeoutError):
+            Shell.run_command('sleep 5', timeout=0.1)
+
+        self.assertLess(time.perf_counter() - start, 2)
+
+    @patch.dict('os.environ', {Shell.timeout_env: '5', Shell.retries_env: '1', Shell.deadline_env: '0'})
+    def test_limits_from_environment(self) -> None:
+        """Test default limits are read from the environment and zero disables a limit"""
+
+        self.assertEqual((5, 1, None), Shell._get_limits(None, None, None))
+        self.assertEqual((2, 0, 3), Shell._get_limits(2, 0, 3))
+
+    def test_backoff_bounded(self) -> None:
+        """Test retry delays grow exponentially up to the configured maximum"""
+
+        for attempt in range(1, 10):
+            delay = Shell._backoff_delay(attempt)
+            self.assertLessEqual(delay, min(Shell.backoff_max, Shell.backoff_base * 2 ** (attempt - 1)))
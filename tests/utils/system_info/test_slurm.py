@@ -1,8 +1,11 @@
 """ Tests for the `Slurm` class """
+import os
 from datetime import date
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import patch
 
+from apps.utils.backends import ReplayBackend, set_backend
 from apps.utils.system_info import Slurm
 
 
@@ -24,6 +27,18 @@ class IsInstalled(TestCase):
         self.assertFalse(Slurm.is_installed())
 
 
+class SplitClusterSections(TestCase):
+    """ Tests for the `split_cluster_sections()` method of the `Slurm` class """
+
+    def test_lines_grouped_by_cluster(self) -> None:
+        """ Test output lines are grouped under the preceding cluster header """
+
+        output = "stray line\nCLUSTER: smp\n1 smp\n\n2 smp\nCLUSTER: gpu\nCLUSTER: htc\n3 htc\n"
+        sections = Slurm.split_cluster_sections(output)
+        self.assertEqual({'smp': ['1 smp', '2 smp'], 'gpu': [], 'htc': ['3 htc']}, sections)
+
+
+@patch.dict(os.environ, {'CRC_WRAPPERS_CACHE_TTL': '0'})
 class GetClusterNames(TestCase):
     """ Tests for the `get_cluster_names()` method of the `Slurm` class """
 
@@ -46,6 +61,7 @@ class GetClusterNames(TestCase):
         self.assertEqual(clusters, {'cluster1', 'cluster2', 'azure'})
 
 
+@patch.dict(os.environ, {'CRC_WRAPPERS_CACHE_TTL': '0'})
 class GetPartitionNames(TestCase):
     """ Test cases for the `get_partition_names()` method of the `Slurm` class """
 
@@ -68,6 +84,109 @@ class GetPartitionNames(TestCase):
         self.assertEqual(partitions, {'partition1', 'partition2', 'pliu'})
 
 
+@patch.dict(os.environ, {'CRC_WRAPPERS_CACHE_TTL': '0', 'CRC_WRAPPERS_SLURM_JSON': '1'})
+class JsonTopologyLookups(TestCase):
+    """ Test cluster and partition names are read from JSON output when enabled """
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_cluster_names(self, mock_run_command) -> None:
+        """ Test cluster names are read from `sacctmgr` JSON output """
+
+        mock_run_command.return_value = '{"clusters": [{"name": "cluster1"}, {"name": "azure"}]}'
+
+        self.assertEqual({'cluster1'}, Slurm.get_cluster_names())
+        mock_run_command.assert_called_once_with('sacctmgr --json show clusters')
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_partition_names(self, mock_run_command) -> None:
+        """ Test partition names are read from `scontrol` JSON output """
+
+        mock_run_command.return_value = '{"partitions": [{"name": "partition1"}, {"name": "pliu"}]}'
+
+        self.assertEqual({'partition1'}, Slurm.get_partition_names('cluster1'))
+        mock_run_command.assert_called_once_with('scontrol -M cluster1 --json show partition')
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_text_fallback(self, mock_run_command) -> None:
+        """ Test text output is parsed when JSON output is unavailable """
+
+        mock_run_command.side_effect = ['scontrol: unrecognized option \'--json\'', 'PartitionName=partition1\n']
+
+        self.assertEqual({'partition1'}, Slurm.get_partition_names('cluster1'))
+        mock_run_command.assert_called_with('scontrol -M cluster1 show partition')
+
+    def test_parse_invalid_json(self) -> None:
+        """ Test invalid or non-object JSON output is rejected """
+
+        self.assertIsNone(Slurm.parse_json('not json'))
+        self.assertIsNone(Slurm.parse_json('[1, 2]'))
+        self.assertEqual({'a': 1}, Slurm.parse_json('{"a": 1}'))
+
+
+class CachedTopologyLookups(TestCase):
+    """ Test cluster and partition lookups are served from the on-disk cache """
+
+    def setUp(self) -> None:
+        """ Point the cache at a temporary directory """
+
+        self.temp_dir = TemporaryDirectory()
+        env = {'CRC_WRAPPERS_CACHE_DIR': self.temp_dir.name, 'CRC_WRAPPERS_CACHE_TTL': '60'}
+        self.env_patch = patch.dict(os.environ, env)
+        self.env_patch.start()
+
+    def tearDown(self) -> None:
+        """ Restore the environment and remove the temporary cache """
+
+        self.env_patch.stop()
+        self.temp_dir.cleanup()
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_cluster_names_cached(self, mock_run_command) -> None:
+        """ Test repeated calls to `get_cluster_names()` only run `squeue` once """
+
+        mock_run_command.return_value = "CLUSTER: cluster1\nCLUSTER: cluster2\n"
+
+        self.assertEqual({'cluster1', 'cluster2'}, Slurm.get_cluster_names())
+        self.assertEqual({'cluster1', 'cluster2'}, Slurm.get_cluster_names())
+        mock_run_command.assert_called_once()
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_partition_names_cached_per_cluster(self, mock_run_command) -> None:
+        """ Test partition names are cached separately for each cluster """
+
+        mock_run_command.side_effect = lambda cmd: f"PartitionName={cmd.split()[2]}-part\n"
+
+        self.assertEqual({'c1-part'}, Slurm.get_partition_names('c1'))
+        self.assertEqual({'c2-part'}, Slurm.get_partition_names('c2'))
+        self.assertEqual({'c1-part'}, Slurm.get_partition_names('c1'))
+        self.assertEqual(2, mock_run_command.call_count)
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_empty_output_not_cached(self, mock_run_command) -> None:
+        """ Test empty command output is not written to the cache """
+
+        mock_run_command.return_value = ""
+
+        Slurm.get_cluster_names()
+        Slurm.get_cluster_names()
+        self.assertEqual(2, mock_run_command.call_count)
+
+    def test_backend_output_not_cached(self) -> None:
+        """ Test output served by an installed backend bypasses the cache """
+
+        backend = ReplayBackend()
+        backend.add_command('squeue -u fakeuser -M all', 'CLUSTER: replayed\n')
+        set_backend(backend)
+        self.addCleanup(set_backend, None)
+
+        self.assertEqual({'replayed'}, Slurm.get_cluster_names())
+        self.assertEqual([], os.listdir(self.temp_dir.name))
+
+        set_backend(None)
+        with patch('apps.utils.system_info.Shell.run_command', return_value='CLUSTER: live\n'):
+            self.assertEqual({'live'}, Slurm.get_cluster_names())
+
+
 class CheckSlurmAccountExists(TestCase):
     """ Test cases for the `check_slurm_account_exists()` method of the `Slurm` class """
 
@@ -85,6 +204,24 @@ class CheckSlurmAccountExists(TestCase):
             Slurm.check_slurm_account_exists('nonexistent_account')
 
 
+class CheckSlurmAccountsExist(TestCase):
+    """ Test cases for the `check_slurm_accounts_exist()` method of the `Slurm` class """
+
+    @patch('apps.utils.system_info.Shell.run_commands')
+    def test_accounts_exist(self, mock_run_commands) -> None:
+        """ Test all accounts are checked using a single batch of commands """
+        mock_run_commands.return_value = ["account1", "account2"]
+        Slurm.check_slurm_accounts_exist(['account1', 'account2'])  # Should not raise an exception
+        self.assertEqual(2, len(mock_run_commands.call_args.args[0]))
+
+    @patch('apps.utils.system_info.Shell.run_commands')
+    def test_account_does_not_exist(self, mock_run_commands) -> None:
+        """ Test a `RuntimeError` naming the missing account is raised """
+        mock_run_commands.return_value = ["account1", ""]
+        with self.assertRaisesRegex(RuntimeError, 'nonexistent_account'):
+            Slurm.check_slurm_accounts_exist(['account1', 'nonexistent_account'])
+
+
 class GetClusterUsageByUser(TestCase):
     """ Test cases for the `get_cluster_usage_by_user()` method of the `Slurm` class """
 
@@ -122,3 +259,100 @@ class GetClusterUsageByUser(TestCase):
 
         usage = Slurm.get_cluster_usage_by_user('account1', start_date, 'cluster1')
         self.assertIsNone(usage)
+
+
+class GetBulkUsageByUser(TestCase):
+    """ Test cases for the `get_bulk_usage_by_user()` method of the `Slurm` class """
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_single_command_for_all_clusters(self, mock_run_command) -> None:
+        """ Test all accounts and clusters are queried using a single `sreport` call """
+
+        mock_run_command.return_value = ""
+        Slurm.get_bulk_usage_by_user(['account1', 'account2'], date(2023, 1, 1), ['c1', 'c2'])
+
+        mock_run_command.assert_called_once()
+        command = mock_run_command.call_args.args[0]
+        self.assertIn('Cluster=c1,c2', command)
+        self.assertIn('Account=account1,account2', command)
+        self.assertIn('Format=Cluster,Account,Proper,Used', command)
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_output_parsed_to_nested_dict(self, mock_run_command) -> None:
+        """ Test usage is grouped by account and cluster """
+
+        mock_run_command.return_value = (
+            "c1|account1||300\n"
+            "c1|account1|user1|100\n"
+            "c1|account1|user2|200\n"
+            "c2|account1||50\n"
+            "c2|account1|user1|50\n"
+            "c2|account2||10\n"
+            "c2|account2|user3|10"
+        )
+
+        usage = Slurm.get_bulk_usage_by_user(['account1', 'account2'], date(2023, 1, 1), ['c1', 'c2'])
+        expected = {
+            'account1': {
+                'c1': {'total': 300, 'user1': 100, 'user2': 200},
+                'c2': {'total': 50, 'user1': 50},
+            },
+            'account2': {
+                'c2': {'total': 10, 'user3': 10},
+            },
+        }
+
+        self.assertEqual(expected, usage)
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_no_accounts_or_clusters(self, mock_run_command) -> None:
+        """ Test no command is run when there is nothing to query """
+
+        self.assertEqual({}, Slurm.get_bulk_usage_by_user([], date(2023, 1, 1), ['c1']))
+        self.assertEqual({}, Slurm.get_bulk_usage_by_user(['account1'], date(2023, 1, 1), []))
+        mock_run_command.assert_not_called()
+
+
+class GetBulkUsageByPeriod(TestCase):
+    """ Test cases for the `get_bulk_usage_by_period()` method of the `Slurm` class """
+
+    @patch('apps.utils.system_info.Shell.run_commands')
+    def test_periods_queried_concurrently(self, mock_run_commands) -> None:
+        """ Test one `sreport` call per period is submitted in a single concurrent batch """
+
+        mock_run_commands.return_value = ["c1|account1||300", "c2|account2||10"]
+        queries = [
+            (['account1'], date(2023, 1, 1), ['c1']),
+            (['account3'], date(2023, 3, 1), []),
+            (['account2'], date(2023, 6, 1), ['c2']),
+        ]
+
+        usage = Slurm.get_bulk_usage_by_period(queries, max_concurrency=2)
+
+        mock_run_commands.assert_called_once()
+        commands = mock_run_commands.call_args.args[0]
+        self.assertEqual(2, len(commands))
+        self.assertIn('Start=2023-06-01', commands[1])
+        self.assertEqual(2, mock_run_commands.call_args.kwargs['max_concurrency'])
+        self.assertEqual([{'account1': {'c1': {'total': 300}}}, {}, {'account2': {'c2': {'total': 10}}}], usage)
+
+
+class GetUsageByCluster(TestCase):
+    """ Test cases for the `get_usage_by_cluster()` method of the `Slurm` class """
+
+    @patch('apps.utils.system_info.Shell.run_command')
+    def test_results_keyed_in_order(self, mock_run_command) -> None:
+        """ Test usage is returned for each cluster in the order the clusters were given """
+
+        mock_run_command.return_value = "c1|account1||300\nc1|account1|user1|300"
+
+        usage = Slurm.get_usage_by_cluster('account1', date(2023, 1, 1), ['c3', 'c1', 'c2'])
+        self.assertEqual(['c3', 'c1', 'c2'], list(usage))
+        self.assertEqual({'total': 300, 'user1': 300}, usage['c1'])
+        self.assertIsNone(usage['c3'])
+        mock_run_command.assert_called_once()
+
+    def test_no_clusters(self) -> None:
+        """ Test an empty dictionary is returned when no clusters are given """
+
+        self.assertEqual({}, Slurm.get_usage_by_cluster('account1', date(2023, 1, 1), []))
@@ -0,0 +1,185 @@
+"""Tests for the telemetry spool."""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from apps.utils import telemetry
+from apps.utils.backends import ReplayBackend, set_backend
+from apps.utils.cli import BaseParser
+from apps.utils.profiling import Profiler
+from apps.utils.system_info import Shell
+
+
+class CommandApp(BaseParser):
+    """A dummy application that runs a command and optionally fails"""
+
+    def __init__(self) -> None:
+        """Define arguments for the command line interface"""
+
+        super().__init__()
+        self.add_argument('--fail', action='store_true')
+
+    def app_logic(self, args) -> None:
+        """Run a command and raise an error if requested"""
+
+        Shell.run_command('sinfo')
+        if args.fail:
+            raise RuntimeError('failed')
+
+
+class SpoolPath(TestCase):
+    """Test telemetry is only enabled when a spool directory is configured"""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_disabled_by_default(self) -> None:
+        """Test no spool file is returned without a configured directory"""
+
+        self.assertIsNone(telemetry.get_spool_path())
+
+    @patch.dict(os.environ, {telemetry.SPOOL_DIR_ENV: '/spool'})
+    def test_per_user_spool_file(self) -> None:
+        """Test each user writes to a separate spool file"""
+
+        self.assertEqual(Path(f'/spool/telemetry-{os.getuid()}.jsonl'), telemetry.get_spool_path())
+
+
+class RecordSpooling(TestCase):
+    """Test records are appended, rotated, and read back"""
+
+    def setUp(self) -> None:
+        """Create a temporary spool directory"""
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.spool_dir = Path(temp_dir.name)
+        self.path = self.spool_dir / 'telemetry-1000.jsonl'
+
+    def test_build_record_counts_calls(self) -> None:
+        """Test Slurm and Keystone calls are counted from profiling spans"""
+
+        profiler = Profiler()
+        for category in ('command', 'command', 'slurmrestd', 'keystone', 'cli'):
+            profiler.add_span('name', category, 0, 0)
+
+        record = telemetry.build_record('crc-idle', 0.25, profiler, 0)
+        self.assertEqual('crc-idle', record['tool'])
+        self.assertEqual(250.0, record['ms'])
+        self.assertEqual((3, 1, 0), (record['slurm'], record['keystone'], record['status']))
+
+    def test_append_and_read(self) -> None:
+        """Test appended records are read back in order"""
+
+        for index in range(3):
+            telemetry.append_record(self.path, {'tool': f'tool{index}'})
+
+        records = list(telemetry.read_records(telemetry.find_spool_files(self.spool_dir)))
+        self.assertEqual(['tool0', 'tool1', 'tool2'], [record['tool'] for record in records])
+
+    def test_rotation(self) -> None:
+        """Test spool files are rotated once they reach the size limit"""
+
+        telemetry.append_record(self.path, {'tool': 'first'}, max_bytes=10)
+        telemetry.append_record(self.path, {'tool': 'second'}, max_bytes=10_000)
+
+        self.assertTrue(self.path.with_name(self.path.name + '.1').exists())
+        records = list(telemetry.read_records(telemetry.find_spool_files(self.spool_dir)))
+        self.assertCountEqual(['first', 'second'], [record['tool'] for record in records])
+
+    def test_rotation_skipped_while_locked(self) -> None:
+        """Test a spool file is not rotated while another process is rotating it"""
+
+        import fcntl
+
+        self.path.write_text('{"tool": "first"}\n')
+        with open(self.path) as spool_file:
+            fcntl.flock(spool_file, fcntl.LOCK_EX)
+            telemetry.append_record(self.path, {'tool': 'second'}, max_bytes=10)
+
+        self.assertFalse(self.path.with_name(self.path.name + '.1').exists())
+
+    def test_already_rotated_file_not_rotated_again(self) -> None:
+        """Test a run holding a rotated spool file does not rotate its replacement"""
+
+        self.path.write_text('{"tool": "first"}\n')
+        rotated = self.path.with_name(self.path.name + '.1')
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+        self.addCleanup(os.close, fd)
+
+        os.replace(self.path, rotated)
+        self.path.write_text('{"tool": "second"}\n')
+        telemetry._rotate(self.path, fd)
+
+        self.assertEqual('{"tool": "first"}\n', rotated.read_text())
+        self.assertEqual('{"tool": "second"}\n', self.path.read_text())
+
+    def test_symlinks_not_followed(self) -> None:
+        """Test records are not written through a symbolic link planted at the spool path"""
+
+        target = self.spool_dir / 'target'
+        target.write_text('')
+        self.path.symlink_to(target)
+
+        telemetry.append_record(self.path, {'tool': 'tool'})
+        self.assertEqual('', target.read_text())
+
+    def test_malformed_lines_skipped(self) -> None:
+        """Test corrupt lines do not prevent reading other records"""
+
+        self.path.write_text('not json\n{"tool": "ok"}\n[1, 2]\n')
+        records = list(telemetry.read_records([self.path]))
+        self.assertEqual([{'tool': 'ok'}], records)
+
+    def test_write_errors_ignored(self) -> None:
+        """Test spooling to an unwritable location does not raise an error"""
+
+        telemetry.append_record(self.spool_dir / 'missing' / 'telemetry.jsonl', {'tool': 'tool'})
+
+
+class ExecuteTelemetry(TestCase):
+    """Test `BaseParser.execute` spools a record for each invocation"""
+
+    def setUp(self) -> None:
+        """Serve commands from a replay backend and configure a spool directory"""
+
+        backend = ReplayBackend()
+        backend.add_command('sinfo', 'output')
+        set_backend(backend)
+        self.addCleanup(set_backend, None)
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        env = patch.dict(os.environ, {telemetry.SPOOL_DIR_ENV: temp_dir.name})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_successful_run(self) -> None:
+        """Test a successful run is recorded with a zero exit status"""
+
+        CommandApp.execute([])
+        record, = telemetry.read_records([telemetry.get_spool_path()])
+        self.assertEqual((1, 0, 0), (record['slurm'], record['keystone'], record['status']))
+
+    def test_failed_run(self) -> None:
+        """Test a failed run is recorded with a nonzero exit status"""
+
+        with self.assertRaises(SystemExit):
+            CommandApp.execute(['--fail'])
+
+        record, = telemetry.read_records([telemetry.get_spool_path()])
+        self.assertEqual(1, record['status'])
+
+    def test_overhead(self) -> None:
+        """Test spooling a record adds well under a millisecond"""
+
+        path = telemetry.get_spool_path()
+        record = telemetry.build_record('tool', 0.1, Profiler(), 0)
+        start = time.perf_counter()
+        for _ in range(100):
+            telemetry.append_record(path, record)
+
+        self.assertLess((time.perf_counter() - start) / 100, 0.001)
+        self.assertEqual(100, len(path.read_bytes().splitlines()))